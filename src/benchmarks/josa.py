@@ -0,0 +1,72 @@
+"""
+조사 엔진 벤치마크
+
+pyjosa로 행마다 조사를 붙이는 방식과 excel.josa.apply_josa를 비교합니다.
+
+실행:
+    cd src
+    python -m benchmarks.josa --rows 100000 --unique 300
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+from pyjosa.josa import Josa
+
+from excel.josa import apply_josa, has_batchim, resolve_josa
+
+
+def make_names(rows: int, unique: int, seed: int = 0) -> pd.Series:
+    """
+    무작위 한글 이름 열을 만듭니다.
+
+    Args:
+        rows (int): 행 수
+        unique (int): 서로 다른 이름 수
+        seed (int): 난수 시드
+
+    Returns:
+        pd.Series: 이름 열
+    """
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(ord("가"), ord("힣") + 1)]
+    names = ["".join(rng.choices(syllables, k=3)) for _ in range(unique)]
+    return pd.Series(rng.choices(names, k=rows), name="성명")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조사 엔진 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="행 수")
+    parser.add_argument("--unique", type=int, default=300, help="서로 다른 이름 수")
+    parser.add_argument("--josa", default="을", help="조사")
+    args = parser.parse_args()
+
+    names = make_names(args.rows, args.unique)
+
+    start = time.perf_counter()
+    expected = names.apply(lambda x: Josa.get_full_string(x, args.josa))
+    baseline = time.perf_counter() - start
+
+    for cache in (has_batchim, resolve_josa):
+        cache.cache_clear()
+
+    start = time.perf_counter()
+    result = apply_josa(names, args.josa)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    apply_josa(names, args.josa)
+    warm = time.perf_counter() - start
+
+    assert result.tolist() == expected.tolist(), "pyjosa와 결과가 다릅니다."
+
+    print(f"행 수: {args.rows:,} (서로 다른 이름 {args.unique:,}개)")
+    print(f"pyjosa apply     : {baseline * 1000:8.1f} ms")
+    print(f"apply_josa (cold): {cold * 1000:8.1f} ms ({baseline / cold:.1f}x)")
+    print(f"apply_josa (warm): {warm * 1000:8.1f} ms ({baseline / warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
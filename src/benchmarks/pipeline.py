@@ -0,0 +1,448 @@
+"""
+문서 생성 파이프라인 벤치마크
+
+채용계약서 엑셀(template/contract_fill.xlsx)과 같은 모양의 합성 엑셀을 행 수별로 만들고,
+읽기 → 전처리 → 필드 매핑 → 입력/저장 단계의 처리 속도(행/초)와 최대 메모리(RSS)를 측정합니다.
+입력/저장 단계는 행별 필드 초기화(기본), 초기화 없이 덮어쓰기, 행마다 템플릿 다시 열기를 비교합니다.
+입력/저장 단계는 지연 시간을 넣은 가짜 HWP 객체(hwp.fake.FakeHwp)로 실행하므로 Linux에서도 동작합니다.
+
+행 수마다 새 프로세스에서 측정하므로 최대 메모리는 그 행 수만의 값입니다.
+단계별 최대 메모리는 그 단계까지의 최대값(누적)입니다.
+
+실행:
+    cd src
+    python -m benchmarks.pipeline --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.pipeline --sizes 1000 --compare bench.json  # 이전 결과와 비교
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+
+from config import FIELD_MAPPING
+from excel.loader import data_loader, load_worksheet
+from excel.preprocess import preprocess_dataframe
+from hwp.fake import FakeHwp
+from hwp.metrics import Metrics, use_metrics
+from hwp.rows import RowFeed
+from hwp.service import process_documents, render_rows
+from hwp.template import FIELD_INSTANCE_PATTERN, TemplatePlan, open_template
+from hwp.writer import to_field_text
+
+CONTRACT_INPUTS = {
+    "const_sanhak": "산학협력단장명",
+    "sanhak_name": "김응태",
+    "workflow_name": "프로젝트연구교수 채용계약서",
+    "key_columns": ["성명", "사번"],
+}
+
+# 한글 프로그램의 메서드별 대략적인 호출 시간(초) (--latency로 배율 조정)
+DEFAULT_LATENCY = {
+    "open": 0.05,
+    "put_field_text": 0.002,
+    "save_as": 0.02,
+}
+
+DATE_FORMAT = 'yyyy"년"\\ m"월"\\ d"일";@'
+PERIOD_FORMAT = "yyyy/mm/dd/"
+MONEY_FORMAT = '_("₩"* #,##0_);_("₩"* \\(#,##0\\);_("₩"* "-"_);_(@_)'
+
+HEADER = [
+    ("성명", None),
+    ("사번", None),
+    ("소속", None),
+    ("직급", None),
+    ("책임교수명", None),
+    ("프로젝트명", None),
+    ("총 사업기간 시작", PERIOD_FORMAT),
+    ("총 사업기간 종료", PERIOD_FORMAT),
+    ("당해연도 사업기간 시작", PERIOD_FORMAT),
+    ("당해연도 사업기간 종료", PERIOD_FORMAT),
+    ("계약시작일", DATE_FORMAT),
+    ("계약종료일", DATE_FORMAT),
+    ("참여개월수", "0_);[Red]\\(0\\)"),
+    ("예산 편성금액", MONEY_FORMAT),
+    ("월 계약금액", MONEY_FORMAT),
+    ("총 계약금액", MONEY_FORMAT),
+    ("급여일", None),
+    ("계약일", DATE_FORMAT),
+    ("주소", None),
+    ("휴대폰번호", None),
+]
+
+
+def make_workbook(path: str | Path, rows: int, seed: int = 0) -> Path:
+    """
+    채용계약서 엑셀과 같은 열과 셀 서식의 합성 엑셀 파일을 만듭니다.
+    총 계약금액은 수식 대신 계산된 값으로 저장합니다. (수식은 openpyxl로 계산할 수 없음)
+
+    Args:
+        path (str | Path): 저장 경로
+        rows (int): 데이터 행 수
+        seed (int): 난수 시드
+
+    Returns:
+        Path: 저장 경로
+    """
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(ord("가"), ord("힣") + 1)]
+    names = ["".join(rng.choices(syllables, k=3)) for _ in range(300)]
+    professors = ["".join(rng.choices(syllables, k=3)) for _ in range(40)]
+    units = [
+        "인공지능기술사업화연구소",
+        "ICT지능화융합센터",
+        "바이오헬스연구원",
+        "미래모빌리티센터",
+    ]
+    grades = ["연구교수(선임급)", "연구교수(책임급)", "연구교수(원급)"]
+    projects = [f"과제 {n:03d} 기술개발 연구" for n in range(60)]
+    addresses = ["서울특별시 강남구", "경기도 성남시", "대전광역시 유성구", "부산광역시 해운대구"]
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+
+    def cell(value: Any, number_format: str | None) -> WriteOnlyCell:
+        c = WriteOnlyCell(sheet, value=value)
+        if number_format is not None:
+            c.number_format = number_format
+        return c
+
+    sheet.append([name for name, _ in HEADER])
+    for number in range(rows):
+        year = 2025
+        month = rng.randint(1, 10)
+        months = rng.randint(1, 12 - month + 1)
+        monthly = rng.randrange(1_000_000, 6_000_000, 1000)
+        start = datetime.datetime(year, month, 1)
+        end = datetime.datetime(year, month + months - 1, 28)
+        values = [
+            rng.choice(names),
+            f"B{number:06d}",
+            rng.choice(units),
+            rng.choice(grades),
+            rng.choice(professors),
+            rng.choice(projects),
+            datetime.datetime(year, 1, 1),
+            datetime.datetime(year, 12, 31),
+            start,
+            end,
+            start,
+            end,
+            months,
+            monthly * 12,
+            monthly,
+            monthly * months,
+            25,
+            start,
+            rng.choice(addresses),
+            f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        ]
+        sheet.append([cell(v, fmt) for v, (_, fmt) in zip(values, HEADER)])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(path)
+    return path
+
+
+def peak_rss_mb() -> float | None:
+    """
+    현재 프로세스의 최대 메모리 사용량(RSS, MB)을 반환합니다. (측정할 수 없으면 None)
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows: psutil이 있으면 최대 작업 집합 크기 사용
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return round(psutil.Process().memory_info().peak_wset / 2**20, 1)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return round(peak / 2**20 if sys.platform == "darwin" else peak / 2**10, 1)
+
+
+def measure(stages: dict, name: str, rows: int, func: Callable[[], Any]) -> Any:
+    """
+    함수 하나를 실행하면서 걸린 시간, 처리 속도, 최대 메모리를 stages[name]에 기록합니다.
+    """
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    stages[name] = {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    return result
+
+
+def map_fields(dataframe, plan: TemplatePlan, mapping: dict[str, str]) -> list[list[str]]:
+    """
+    행마다 필드에 입력할 문자열 목록을 만듭니다. (render_rows, write_fields의 일괄 입력과 같은 방식)
+    """
+    binding = plan.bind(mapping)
+    return [[row[column] for column in binding.columns] for row in RowFeed(dataframe, mapping)]
+
+
+def map_fields_iterrows(dataframe, plan: TemplatePlan, mapping: dict[str, str]) -> list[list[str]]:
+    """
+    map_fields와 같은 결과를 iterrows(행마다 pd.Series 생성)로 만듭니다. (비교용)
+    """
+    binding = plan.bind(mapping)
+    return [
+        [to_field_text(row[column]) for column in binding.columns]
+        for _, row in dataframe.iterrows()
+    ]
+
+
+def reopen_per_row(template_path: str, dataframe, hwp, output: str, metrics: Metrics) -> list:
+    """
+    행마다 템플릿을 다시 열어 초기화하는 방식으로 문서를 생성합니다. (행별 필드 초기화와 비교용)
+    """
+    results = []
+    with use_metrics(metrics):
+        for position in range(len(dataframe)):
+            plan = open_template(hwp, template_path, cache_dir=None)
+            results += render_rows(
+                hwp,
+                dataframe.iloc[position : position + 1],
+                output_folder=output,
+                workflow_name=CONTRACT_INPUTS["workflow_name"],
+                field_mapping=FIELD_MAPPING,
+                key_columns=CONTRACT_INPUTS["key_columns"],
+                batch_write=True,
+                reset_fields=False,
+                formats=("hwp",),
+                plan=plan,
+            )
+    return results
+
+
+def run_size(
+    rows: int,
+    workdir: str,
+    fill_rows: int,
+    latency_scale: float,
+    seed: int,
+    reopen_rows: int = 100,
+) -> dict[str, Any]:
+    """
+    행 수 하나에 대해 전체 단계를 측정합니다. (새 프로세스에서 실행)
+
+    Args:
+        rows (int): 엑셀 데이터 행 수
+        workdir (str): 합성 엑셀과 출력 파일을 둘 폴더
+        fill_rows (int): 입력/저장 단계에서 처리할 행 수 (0이면 전체)
+        latency_scale (float): 가짜 HWP 지연 시간 배율 (0이면 지연 없음)
+        seed (int): 난수 시드
+        reopen_rows (int): 행마다 템플릿을 다시 여는 방식으로 처리할 행 수 (0이면 측정 안 함)
+
+    Returns:
+        dict[str, Any]: 단계별 측정 결과
+    """
+    workbook = Path(workdir) / f"contract_fill_{rows}_{seed}.xlsx"
+    if not workbook.exists():
+        make_workbook(workbook, rows, seed)
+
+    stages: dict[str, Any] = {}
+    key_columns = CONTRACT_INPUTS["key_columns"]
+    df = measure(
+        stages,
+        "load",
+        rows,
+        lambda: data_loader(load_worksheet(str(workbook)), key_columns=key_columns),
+    )
+    df = measure(stages, "preprocess", len(df), lambda: preprocess_dataframe(df, CONTRACT_INPUTS))
+
+    fields = [FIELD_INSTANCE_PATTERN.match(field)["name"] for field in FIELD_MAPPING]
+    plan = TemplatePlan.from_field_list("benchmark", fields)
+    mapped = measure(stages, "mapping", len(df), lambda: map_fields(df, plan, FIELD_MAPPING))
+    # 행마다 pd.Series를 만드는 이전 방식과 비교 (결과가 같아야 함)
+    baseline = measure(
+        stages,
+        "mapping_iterrows",
+        len(df),
+        lambda: map_fields_iterrows(df, plan, FIELD_MAPPING),
+    )
+    if mapped != baseline:
+        stages["mapping"]["mismatch"] = sum(1 for a, b in zip(mapped, baseline) if a != b)
+    del mapped, baseline
+
+    sample = df.head(fill_rows) if fill_rows else df
+    latency = {method: delay * latency_scale for method, delay in DEFAULT_LATENCY.items()}
+    factory = functools.partial(FakeHwp, fields=fields, latency=latency)
+    output = tempfile.mkdtemp(prefix=f"fill_{rows}_", dir=workdir)
+
+    # 진행 메시지는 출력하지 않고 단계별 시간만 집계
+    metrics = Metrics(sinks=[])
+
+    def fill(reset_fields: bool, metrics: Metrics):
+        return process_documents(
+            template_path=str(workbook),  # 가짜 HWP 객체는 템플릿 내용을 읽지 않음
+            dataframe=sample,
+            output_folder=output,
+            workflow_name=CONTRACT_INPUTS["workflow_name"],
+            key_columns=CONTRACT_INPUTS["key_columns"],
+            field_mapping=FIELD_MAPPING,
+            batch_write=True,
+            reset_fields=reset_fields,
+            formats=("hwp",),
+            hwp_factory=factory,
+            metrics=metrics,
+        )
+
+    # 행별 필드 초기화(기본) / 초기화 없이 덮어쓰기 / 행마다 템플릿 다시 열기
+    results = measure(stages, "fill_export", len(sample), lambda: fill(True, metrics))
+    measure(stages, "fill_noreset", len(sample), lambda: fill(False, Metrics(sinks=[])))
+    if reopen_rows:
+        reopen_sample = sample.head(reopen_rows)
+        measure(
+            stages,
+            "fill_reopen",
+            len(reopen_sample),
+            lambda: reopen_per_row(
+                str(workbook), reopen_sample, factory(), output, Metrics(sinks=[])
+            ),
+        )
+    shutil.rmtree(output, ignore_errors=True)
+    failed = sum(1 for r in results if not r.ok)
+    if failed:
+        stages["fill_export"]["failed"] = failed
+
+    # 입력/저장 단계의 세부 구간(open_template, write_fields, save_as 등)별 시간
+    breakdown = metrics.summary()
+
+    return {"rows": rows, "stages": stages, "breakdown": breakdown, "peak_rss_mb": peak_rss_mb()}
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    """
+    측정 결과를 표로 출력합니다. 이전 결과가 있으면 같은 행 수, 같은 단계의 속도 비율을 함께 출력합니다.
+    """
+    previous = {}
+    if baseline is not None:
+        previous = {
+            (result["rows"], name): stage["rows_per_sec"]
+            for result in baseline["results"]
+            for name, stage in result["stages"].items()
+        }
+
+    print(
+        f"{'행 수':>8} {'단계':<12} {'시간(초)':>10} {'행/초':>12} {'최대 RSS(MB)':>13} {'비교':>8}"
+    )
+    for result in report["results"]:
+        for name, stage in result["stages"].items():
+            before = previous.get((result["rows"], name))
+            ratio = (
+                f"{stage['rows_per_sec'] / before:.2f}x" if before and stage["rows_per_sec"] else ""
+            )
+            print(
+                f"{result['rows']:>8,} {name:<12} {stage['seconds']:>10.3f} "
+                f"{stage['rows_per_sec'] or 0:>12,.1f} {stage['peak_rss_mb'] or 0:>13,.1f} {ratio:>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 생성 파이프라인 벤치마크")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="엑셀 행 수 목록"
+    )
+    parser.add_argument(
+        "--fill-rows",
+        type=int,
+        default=1_000,
+        help="입력/저장 단계에서 처리할 행 수 (0이면 전체, 지연 시간 때문에 기본은 앞쪽 1000행)",
+    )
+    parser.add_argument(
+        "--reopen-rows",
+        type=int,
+        default=100,
+        help="행마다 템플릿을 다시 여는 방식과 비교할 행 수 (0이면 비교하지 않음)",
+    )
+    parser.add_argument("--latency", type=float, default=1.0, help="가짜 HWP 지연 시간 배율")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument(
+        "--workdir",
+        default=str(Path(tempfile.gettempdir()) / "autohwp-bench"),
+        help="합성 엑셀과 출력 파일을 둘 폴더 (합성 엑셀은 재사용)",
+    )
+    parser.add_argument("--output", default="benchmark_pipeline.json", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for rows in args.sizes:
+        # 행 수마다 새 프로세스에서 측정해야 최대 메모리가 앞의 측정에 섞이지 않음
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            future = executor.submit(
+                run_size,
+                rows,
+                args.workdir,
+                args.fill_rows,
+                args.latency,
+                args.seed,
+                args.reopen_rows,
+            )
+            results.append(future.result())
+        print(f"측정 완료: {rows:,}행")
+
+    report = {
+        "benchmark": "pipeline",
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "fill_rows": args.fill_rows,
+            "reopen_rows": args.reopen_rows,
+            "latency": {m: d * args.latency for m, d in DEFAULT_LATENCY.items()},
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    print_report(report, baseline)
+    print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from typing import Any, Dict
 
 from pydantic import BaseModel, Field
 
+from excel.pipeline import PreprocessPipeline
+
 FIELD_MAPPING = {  # 추후 UI 및 JSON으로 입력받을 수 있도록 수정
     "책임교수명(본문){{0}}": "책임교수명(본문)",
     "계약당사자명(본문){{0}}": "성명(본문)",
@@ -63,22 +65,35 @@ class Config(BaseModel):
         examples=["template/contract_fill.xlsx"],
     )
 
+    excel_paths: list[str] = Field(
+        default_factory=list,
+        title="추가 엑셀 경로",
+        description="excel_path와 함께 읽을 엑셀 파일 경로 목록 (열 구성이 같아야 하며, 행마다 원본 파일과 시트를 기록)",
+        examples=[["template/team_b.xlsx", "template/team_c.xlsx"]],
+    )
+    sheets: str | int | list[str | int] | None = Field(
+        None,
+        title="시트 선택",
+        description='읽을 시트 이름, 번호(0부터) 또는 이름 패턴(예: "2024-*", 모든 시트는 "*"), 또는 그 목록 (없으면 활성 시트)',
+        examples=["*", ["1월", "2월"]],
+    )
+
     header_row: int = Field(
-        ...,
+        1,
         title="헤더 행 번호",
         description="엑셀에서 열 제목이 있는 행 번호 (1부터 시작)",
         ge=1,
     )
-    start_row: int = Field(
-        ...,
+    start_row: int | None = Field(
+        None,
         title="시작 행 번호",
-        description="엑셀에서 데이터가 시작되는 행 번호",
+        description="엑셀에서 데이터가 시작되는 행 번호 (없으면 헤더 다음 행)",
         ge=1,
     )
-    end_row: int = Field(
-        ...,
+    end_row: int | None = Field(
+        None,
         title="끝 행 번호",
-        description="엑셀에서 데이터가 끝나는 행 번호",
+        description="엑셀에서 데이터가 끝나는 행 번호 (없으면 시트 끝까지)",
         ge=1,
     )
     key_columns: list[str] = Field(
@@ -101,3 +116,23 @@ class Config(BaseModel):
             },
         ],
     )
+
+    pipeline: PreprocessPipeline = Field(
+        default_factory=PreprocessPipeline,
+        title="전처리 파이프라인",
+        description="엑셀 데이터에 순서대로 적용할 전처리 단계(constant, concat, josa, number, date)입니다.",
+        examples=[
+            {
+                "steps": [
+                    {"op": "josa", "target": "성명(본문)", "source": "성명", "josa": "을"},
+                    {
+                        "op": "concat",
+                        "target": "총 사업기간",
+                        "sources": ["총 사업기간 시작", "총 사업기간 종료"],
+                        "sep": " ~ ",
+                    },
+                    {"op": "number", "target": "총 계약금액", "source": "총 계약금액"},
+                ]
+            },
+        ],
+    )
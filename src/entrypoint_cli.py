@@ -1,39 +1,380 @@
 # %% entrypoint_cli.py
 
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import get_args
+
+from pandas import DataFrame
+
 from config import FIELD_MAPPING, Config
-from excel.loader import data_loader, load_worksheet
-from excel.preprocess import preprocess_dataframe
+from excel.loader import iter_data_chunks, load_workbooks, load_worksheet
+from excel.preprocess import contract_pipeline
+from hwp.bundle import ZipBundle
+from hwp.export import FILENAME_COLUMN, ExportFormat, OutputPlanner, resolve_output_folder
+from hwp.manifest import FAILURE_REPORT_SUFFIX, MANIFEST_SUFFIX
+from hwp.metrics import JsonlSink, LogSink, Metrics, PrometheusSink, use_metrics
+from hwp.retry import RetryPolicy
 from hwp.service import process_documents
+from hwp.session import DEFAULT_MAX_DOCUMENTS, HwpSession
 
-if __name__ == "__main__":
-    print("Hello from autohwp!")
+# 설정 JSON 없이 실행할 때 사용하는 기본 설정 (채용계약서)
+UI_INPUTS = {
+    "const_sanhak": "산학협력단장명",
+    "sanhak_name": "김응태",
+    "workflow_name": "프로젝트연구교수 채용계약서",
+    "key_columns": ["성명", "사번"],
+}
+PATH_CONFIG = {
+    "template_path": "../template/contract.hwp",
+    "excel_path": "../template/contract_fill.xlsx",
+}
 
-    UI_INPUTS = {
-        "const_sanhak": "산학협력단장명",
-        "sanhak_name": "김응태",
-        "workflow_name": "프로젝트연구교수 채용계약서",
-        "key_columns": ["성명", "사번"],
-    }
-    PATH_CONFIG = {
-        "template_path": "../template/contract.hwp",
-        "excel_path": "../template/contract_fill.xlsx",
-    }
-
-    excel_path = PATH_CONFIG["excel_path"]
-    ws = load_worksheet(excel_path)
-    df = data_loader(ws, key_columns=UI_INPUTS["key_columns"])
 
-    df = preprocess_dataframe(df, UI_INPUTS)
-    df = df.dropna(how="all")
+def default_config() -> Config:
+    """
+    설정 JSON이 없을 때 사용할 기본 설정(채용계약서)을 반환합니다.
 
-    # 임시로 설정값을 전달하여 process_documents 호출
-    process_documents(
-        template_path=PATH_CONFIG["template_path"],
-        dataframe=df,
-        output_folder=UI_INPUTS["workflow_name"],
+    Returns:
+        Config: 기본 설정
+    """
+    return Config(
         workflow_name=UI_INPUTS["workflow_name"],
+        template_path=PATH_CONFIG["template_path"],
+        excel_path=PATH_CONFIG["excel_path"],
         key_columns=UI_INPUTS["key_columns"],
         field_mapping=FIELD_MAPPING,
+        pipeline=contract_pipeline(UI_INPUTS),
+    )
+
+
+def load_config(path: str) -> Config:
+    """
+    설정 JSON 파일을 불러옵니다.
+    템플릿과 엑셀의 상대 경로는 설정 파일이 있는 폴더를 기준으로 해석합니다.
+
+    Args:
+        path (str): 설정 JSON 파일 경로
+
+    Returns:
+        Config: 설정
+    """
+    config_path = Path(path)
+    config = Config.model_validate_json(config_path.read_text(encoding="utf-8"))
+    base = config_path.resolve().parent
+    config.template_path = str(base / config.template_path)
+    config.excel_path = str(base / config.excel_path)
+    config.excel_paths = [str(base / path) for path in config.excel_paths]
+    return config
+
+
+def parse_rows(value: str) -> tuple[int, int | None]:
+    """
+    "시작-끝" 형식의 데이터 행 번호 범위를 해석합니다. (예: "1-500", "501-", "7")
+    """
+    start, sep, end = value.partition("-")
+    try:
+        first = int(start) if start else 1
+        last = (int(end) if end else None) if sep else first
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"행 범위 형식이 올바르지 않습니다: {value}")
+
+    if first < 1 or (last is not None and last < first):
+        raise argparse.ArgumentTypeError(f"행 범위가 올바르지 않습니다: {value}")
+    return first, last
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    "i/N" 형식의 작업 구간을 해석합니다. (i는 0부터 N-1까지)
+    """
+    index, _, count = value.partition("/")
+    try:
+        shard_index, shard_count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"구간 형식이 올바르지 않습니다: {value} (예: 0/4)")
+
+    if not 0 <= shard_index < shard_count:
+        raise argparse.ArgumentTypeError(f"구간 번호는 0 이상 N-1 이하여야 합니다: {value}")
+    return shard_index, shard_count
+
+
+def parse_formats(value: str) -> tuple[ExportFormat, ...]:
+    """
+    쉼표로 구분된 저장 형식 목록을 해석합니다. (예: "hwp,pdf")
+    """
+    formats = tuple(part.strip().lower() for part in value.split(",") if part.strip())
+    supported = get_args(ExportFormat)
+    if not formats or any(f not in supported for f in formats):
+        raise argparse.ArgumentTypeError(
+            f"지원하지 않는 저장 형식입니다: {value} (가능: {', '.join(supported)})"
+        )
+    return formats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="autohwp",
+        description="엑셀 데이터로 HWP 양식문서를 일괄 생성합니다.",
+    )
+    parser.add_argument(
+        "--config", help="설정(Config) JSON 파일 경로 (없으면 기본 채용계약서 설정)"
+    )
+    parser.add_argument(
+        "--rows",
+        type=parse_rows,
+        help="생성할 데이터 행 번호 범위 (1부터 시작, 예: 1-500, 501-)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=(0, 1),
+        help="i/N: 데이터 행을 N개 구간으로 나누어 i번째 구간만 생성 (행 순서 %% N == i)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="작업 프로세스 수 (기본 1)")
+    parser.add_argument(
+        "--formats",
+        type=parse_formats,
+        default=("hwp", "pdf"),
+        help="저장 형식 (쉼표로 구분, 기본 hwp,pdf)",
+    )
+    parser.add_argument("--defer-pdf", action="store_true", help="PDF 변환을 마지막에 일괄 실행")
+    parser.add_argument("--output", help="출력 폴더 이름 또는 경로 (기본: 워크플로우 이름)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="엑셀을 한 번에 읽는 행 수")
+    parser.add_argument("--no-resume", action="store_true", help="실행 기록을 무시하고 모두 생성")
+    parser.add_argument("--no-zip", action="store_true", help="ZIP 파일을 만들지 않음")
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=RetryPolicy().attempts - 1,
+        help="행 생성 실패 시 다시 시도할 횟수 (기본 %(default)s, 0이면 재시도 없음)",
     )
+    parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=RetryPolicy().backoff,
+        help="첫 재시도 전 대기 시간(초), 재시도마다 두 배씩 증가 (기본 %(default)s)",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="필드 값이 같은 행은 문서를 한 번만 만들고 나머지는 하드링크(또는 복사)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="엑셀 읽기, 전처리, 필드 매핑 검증만 하고 문서는 생성하지 않음",
+    )
+    parser.add_argument("--summary", help="실행 요약 JSON 저장 경로 (없으면 표준 출력의 마지막 줄)")
+    parser.add_argument(
+        "--max-documents",
+        type=int,
+        default=DEFAULT_MAX_DOCUMENTS,
+        help=f"한글 프로그램을 다시 시작하기 전까지 만들 문서 수 (기본 {DEFAULT_MAX_DOCUMENTS})",
+    )
+    parser.add_argument("--metrics-jsonl", help="단계별 계측 이벤트를 기록할 JSON Lines 파일 경로")
+    parser.add_argument(
+        "--metrics-prom", help="단계별 시간 집계를 저장할 Prometheus 텍스트 파일 경로"
+    )
+    parser.add_argument("--verbose", action="store_true", help="단계별 소요 시간도 화면에 출력")
+    return parser
+
+
+def build_metrics(args: argparse.Namespace) -> Metrics:
+    """
+    명령행 인자로 계측기를 만듭니다. (화면 출력은 항상 포함)
+    """
+    sinks = [LogSink(verbose=args.verbose)]
+    if args.metrics_jsonl:
+        sinks.append(JsonlSink(args.metrics_jsonl))
+    if args.metrics_prom:
+        sinks.append(PrometheusSink(args.metrics_prom))
+    return Metrics(sinks)
+
+
+def iter_rows(
+    config: Config,
+    rows: tuple[int, int | None] | None = None,
+    shard: tuple[int, int] = (0, 1),
+    chunk_size: int = 1000,
+    planner: OutputPlanner | None = None,
+) -> Iterator[DataFrame]:
+    """
+    엑셀을 조각 단위로 읽어 행 범위와 구간에 해당하는 행만 전처리해서 반환합니다.
+    인덱스는 시트의 데이터 행 순서(0부터)로 고정되므로, 여러 프로세스가 같은 시트를
+    --shard로 나누어도 구간이 겹치거나 빠지지 않습니다.
+
+    Args:
+        config (Config): 설정
+        rows (tuple[int, int | None] | None): 데이터 행 번호 범위 (1부터 시작, 끝 포함)
+        shard (tuple[int, int]): (구간 번호, 구간 수)
+        chunk_size (int): 한 번에 읽을 행 수
+        planner (OutputPlanner | None): 저장 파일 이름을 정할 계획기
+            - 구간과 행 범위로 거르기 전의 모든 행 순서로 이름을 정해 FILENAME_COLUMN 열에 기록
+              (여러 구간이 같은 출력 폴더에 생성해도 이름이 겹치지 않고, 나누지 않은 실행과 같은 이름)
+
+    Yields:
+        DataFrame: 전처리된 데이터프레임 조각
+    """
+    if config.excel_paths or config.sheets is not None:
+        # 여러 파일, 여러 시트는 작업 프로세스에서 시트별로 읽어 합친 뒤 조각으로 나눔
+        # (인덱스는 합친 순서의 0부터 번호이므로 --rows, --shard는 모든 시트를 이어 붙인 기준)
+        frame = load_workbooks(
+            [config.excel_path, *config.excel_paths],
+            sheets=config.sheets,
+            header_row=config.header_row,
+            start_row=config.start_row,
+            end_row=config.end_row,
+            key_columns=config.key_columns,
+        )
+        chunks = (frame.iloc[i : i + chunk_size] for i in range(0, len(frame), chunk_size))
+    else:
+        worksheet = load_worksheet(config.excel_path)
+        chunks = iter_data_chunks(
+            worksheet,
+            header_row=config.header_row,
+            start_row=config.start_row,
+            end_row=config.end_row,
+            key_columns=config.key_columns,
+            chunk_size=chunk_size,
+        )
+
+    pipeline = None
+    shard_index, shard_count = shard
+    for chunk in chunks:
+        if pipeline is None:
+            # 열 검증과 실행 계획 생성은 첫 조각에서 한 번만
+            pipeline = config.pipeline.compile(list(chunk.columns))
+
+        last_position = chunk.index[-1] + 1
+        if planner is not None:
+            chunk = pipeline.run(chunk).dropna(how="all")
+            chunk = chunk.assign(**{FILENAME_COLUMN: planner.plan(chunk)})
+
+        mask = chunk.index % shard_count == shard_index
+        if rows is not None:
+            first, last = rows
+            mask &= chunk.index + 1 >= first
+            if last is not None:
+                mask &= chunk.index + 1 <= last
+        chunk = chunk[mask]
 
-    print("Documents generated successfully.")
+        if len(chunk):
+            yield chunk if planner is not None else pipeline.run(chunk).dropna(how="all")
+
+        if rows is not None and rows[1] is not None and last_position >= rows[1]:
+            return  # 범위 끝까지 읽었으면 나머지 시트는 읽지 않음
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    config = load_config(args.config) if args.config else default_config()
+    output_folder = args.output or config.workflow_name
+    output_path = resolve_output_folder(output_folder)
+    shard_index, shard_count = args.shard
+
+    summary = {
+        "workflow_name": config.workflow_name,
+        "output_folder": str(output_path),
+        "rows": list(args.rows) if args.rows else None,
+        "shard": f"{shard_index}/{shard_count}",
+        "workers": args.workers,
+        "formats": list(args.formats),
+        "dry_run": args.dry_run,
+    }
+
+    started = time.perf_counter()
+    planner = None
+    if not args.dry_run:
+        planner = OutputPlanner(output_folder, config.workflow_name, key_columns=config.key_columns)
+    chunks = iter_rows(config, args.rows, args.shard, args.chunk_size, planner)
+
+    if args.dry_run:
+        total, columns = 0, None
+        for chunk in chunks:
+            total += len(chunk)
+            columns = columns or list(chunk.columns)
+        missing = sorted(
+            {c for c in config.field_mapping.values() if columns is not None and c not in columns}
+        )
+        summary.update(total=total, missing_columns=missing)
+        exit_code = 1 if missing else 0
+    else:
+        # 구간마다 실행 기록과 ZIP 파일을 따로 두어 여러 프로세스가 같은 파일에 쓰지 않도록 함
+        suffix = f".shard{shard_index}of{shard_count}" if shard_count > 1 else ""
+        manifest_path = output_path.with_name(f"{output_path.name}{suffix}{MANIFEST_SUFFIX}")
+        bundle_path = output_path.with_name(f"{output_path.name}{suffix}.zip")
+        report_path = output_path.with_name(f"{output_path.name}{suffix}{FAILURE_REPORT_SUFFIX}")
+        retry = RetryPolicy(attempts=args.retries + 1, backoff=args.retry_backoff)
+
+        metrics = build_metrics(args)
+        session = HwpSession(max_documents=args.max_documents)
+        bundle = None if args.no_zip else ZipBundle(bundle_path, layout="flat")
+        if bundle is not None:
+            bundle.open()
+        try:
+            # 행이 끝날 때마다 생성된 파일을 출력 폴더 옆의 ZIP 파일에 추가
+            results = process_documents(
+                template_path=config.template_path,
+                dataframe=chunks,
+                output_folder=output_folder,
+                workflow_name=config.workflow_name,
+                key_columns=config.key_columns,
+                field_mapping=config.field_mapping,
+                batch_write=True,
+                workers=args.workers,
+                formats=args.formats,
+                defer_pdf=args.defer_pdf,
+                resume=not args.no_resume,  # 이전 실행 기록으로 변경된 행만 다시 생성
+                manifest_path=manifest_path,
+                on_result=bundle.add if bundle is not None else None,
+                session=session,
+                metrics=metrics,
+                deduplicate=args.dedup,
+                retry=retry,
+                failure_report=report_path,
+            )
+        finally:
+            session.close()
+            if bundle is not None:
+                with use_metrics(metrics):
+                    bundle.close()
+            metrics.close()
+
+        elapsed = time.perf_counter() - started
+        generated = sum(1 for r in results if r.ok and not r.skipped)
+        deduplicated = sum(1 for r in results if r.source is not None)
+        failures = [r for r in results if not r.ok]
+        summary.update(
+            total=len(results),
+            generated=generated,
+            skipped=sum(1 for r in results if r.skipped),
+            failed=len(failures),
+            deduplicated=deduplicated,
+            dedup_ratio=round(deduplicated / generated, 4) if generated else 0.0,
+            rows_per_sec=round(generated / elapsed, 3) if elapsed > 0 else None,
+            bundle=str(bundle_path) if bundle is not None else None,
+            failures=[
+                {"index": r.index, "filename": r.filename, "error": r.error} for r in failures
+            ],
+            failure_report=str(report_path) if failures else None,
+            retried=sum(1 for r in results if r.attempts > 1),
+            hwp_starts=session.starts,
+            stages=metrics.summary(),
+        )
+        exit_code = 1 if failures else 0
+
+    summary["elapsed_sec"] = round(time.perf_counter() - started, 3)
+
+    report = json.dumps(summary, ensure_ascii=False)
+    if args.summary:
+        Path(args.summary).write_text(report, encoding="utf-8")
+    print(report)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
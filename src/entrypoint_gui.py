@@ -1,17 +1,27 @@
-import base64
 import os
 import tempfile
-from difflib import get_close_matches
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
-from pyjosa.josa import Josa
+
+from excel.pipeline import load_pipeline
+from ui.cache import (
+    column_index,
+    hash_content,
+    load_excel,
+    load_template_fields,
+    save_field_settings,
+    saved_field_settings,
+)
+from ui.downloads import render_file_browser
+from ui.transforms import TransformGraph
 
 # pyhwpx가 설치되어 있으면 import
 # 윈도우 이외 OS 동작오류 방지
 try:
     from hwp.service import hwp_context, open_template, process_documents
+    from ui.jobs import get_job_runner, render_job_progress
 except ImportError:
     pass
 
@@ -139,6 +149,14 @@ def main():
             key=f"excel_file_uploader_{st.session_state['excel_file_key']}",
         )
 
+        # 전처리 파이프라인 (CLI와 같은 설정 JSON 사용)
+        uploaded_file_pipeline = st.file_uploader(
+            "전처리 파이프라인 (JSON, 선택)",
+            type=["json"],
+            help="엑셀을 읽은 뒤 적용할 전처리 단계입니다. 설정(Config) JSON도 사용할 수 있습니다.",
+            key=f"pipeline_file_uploader_{st.session_state['excel_file_key']}",
+        )
+
     # HWP 양식 열기 및 필드명 가져오기 (Session State)
     if "hwp_field_names" not in st.session_state and uploaded_file_hwp is not None:
         # HWP 양식 파일을 임시 폴더에 저장
@@ -147,18 +165,19 @@ def main():
             if not Path(output_folder).exists():
                 Path(output_folder).mkdir(parents=False, exist_ok=True)
 
+        hwp_content = uploaded_file_hwp.getvalue()
         with tempfile.NamedTemporaryFile(
             delete=False,
             suffix=".hwp",
             dir=output_folder,
             prefix=f"{workflow_name}_upload_template_",
         ) as tmp:
-            tmp.write(uploaded_file_hwp.read())
+            tmp.write(hwp_content)
             print("Temporary file created:", tmp.name)
             hwp_temp_path = tmp.name
 
-        with hwp_context(visible=False) as hwp_ctx:
-            hwp_field_names = open_template(hwp_ctx, hwp_temp_path)
+        # 같은 내용의 양식은 한글(HWP) 프로그램 실행 없이 캐시된 필드 목록 사용
+        hwp_field_names = load_template_fields(hash_content(hwp_content), hwp_temp_path)
 
         st.session_state["hwp_temp_path"] = hwp_temp_path
         st.session_state["hwp_field_names"] = hwp_field_names
@@ -184,9 +203,22 @@ def main():
 
     # Excel 읽기 및 데이터프레임 생성 (Session State)
     if "df" not in st.session_state and uploaded_file_excel is not None:
-        st.session_state["df"] = pd.read_excel(uploaded_file_excel)
+        # 같은 내용의 엑셀은 한 번만 읽고, 캐시된 데이터프레임의 복사본 사용
+        excel_content = uploaded_file_excel.getvalue()
+        st.session_state["df_key"] = hash_content(excel_content)
+        st.session_state["df"] = load_excel(st.session_state["df_key"], excel_content)
         st.session_state["excel_file_name"] = uploaded_file_excel.name
 
+        if uploaded_file_pipeline is not None:
+            pipeline_content = uploaded_file_pipeline.getvalue()
+            try:
+                pipeline = load_pipeline(pipeline_content)
+                st.session_state["df"] = pipeline.run(st.session_state["df"])
+                # 전처리 결과가 달라지므로 컬럼 변환 캐시 키에 파이프라인 해시를 포함
+                st.session_state["df_key"] += hash_content(pipeline_content)
+            except ValueError as e:
+                st.error(f"전처리 파이프라인 적용 실패: {e}")
+
     # 엑셀 데이터 속성 설정
     df = st.session_state.get("df")
     if df is not None:
@@ -341,41 +373,22 @@ def main():
 
             # 기본키에 해당하는 값들을 "_"로 합쳐서 파일명으로 사용
             if len(_pk_columns) > 0:
-                st.session_state["save_filenames"] = (
-                    df[_pk_columns].astype(str).agg("_".join, axis=1)
+                _pk_values = df[_pk_columns].astype(str)
+                st.session_state["save_filenames"] = _pk_values.iloc[:, 0].str.cat(
+                    [_pk_values.iloc[:, i] for i in range(1, len(_pk_columns))], sep="_"
                 )
             else:
                 st.session_state["save_filenames"] = df.index.astype(str).tolist()
 
             # 선택된 데이터 타입 및 포맷을 반영
-            converted_df = df.copy()
-            st.session_state["converted_df"] = converted_df
+            # 컬럼별 변환 결과는 설정별로 캐시되어, 설정이 바뀐 컬럼만 다시 변환
+            if "transform_graph" not in st.session_state:
+                st.session_state["transform_graph"] = TransformGraph()
+            transform_graph = st.session_state["transform_graph"]
 
-            # 포맷 및 타입 변환
-            for col, setting in column_settings.items():
-                dtype = setting["dtype"]
-                fmt = setting["format"]
-
-                if dtype == "날짜":
-                    try:
-                        converted_df[col] = pd.to_datetime(converted_df[col]).dt.strftime(fmt)
-                    except Exception:
-                        pass  # 변환 실패 시 원본 유지
-                elif dtype == "숫자":
-                    try:
-                        converted_df[col] = pd.to_numeric(converted_df[col])
-                        if fmt == "#,##0":
-                            converted_df[col] = converted_df[col].map("{:,.0f}".format)
-                        elif fmt == "0":
-                            converted_df[col] = converted_df[col].map("{:.0f}".format)
-                        elif fmt == "0.00":
-                            converted_df[col] = converted_df[col].map("{:.2f}".format)
-                        elif fmt == "0.##":
-                            converted_df[col] = converted_df[col].map(
-                                lambda x: f"{x:.2f}".rstrip("0").rstrip(".")
-                            )
-                    except Exception:
-                        pass
+            _data_key = (st.session_state.get("df_key"), tuple(_pk_columns))
+            converted_df = transform_graph.convert(df, _data_key, column_settings)
+            st.session_state["converted_df"] = converted_df
 
             # 데이터에디터 표시
             st.divider()
@@ -418,7 +431,25 @@ def main():
             )
             grid_match[2].write("**사용자 지정 값**")
 
+            # 같은 양식과 엑셀 열 구성으로 저장해 둔 매칭이 있으면 기본값으로 사용하고,
+            # 없는 필드는 업로드마다 한 번 만드는 열 이름 색인으로 자동 매칭
+            _match_options = ["사용자 지정", "조사(은/는)"] + list(converted_df.columns)
+            _field_key = tuple(st.session_state["hwp_field_names"])
+            _column_key = tuple(converted_df.columns)
+            _column_index = column_index(_column_key)
+            _saved_settings = (
+                saved_field_settings(_field_key, _column_key, ("사용자 지정", "조사(은/는)")) or {}
+            )
+
             for field in st.session_state["hwp_field_names"]:
+                if field in _saved_settings:
+                    _saved = _saved_settings[field]
+                    _default_columns = [c for c in _saved["columns"] if c in _match_options]
+                else:
+                    _saved = {}
+                    _matched = _column_index.match(field)
+                    _default_columns = [] if _matched is None else [_matched]
+
                 matching_stack = st.columns(grid_match_columns, vertical_alignment="center")
                 with matching_stack[0]:
                     # 필드명 표시 (오른쪽 정렬)
@@ -434,10 +465,10 @@ def main():
                 with matching_stack[1]:
                     _selected_columns = st.multiselect(
                         "컬럼 (Excel)",
-                        options=["사용자 지정", "조사(은/는)"] + list(converted_df.columns),
+                        options=_match_options,
                         placeholder="하나 이상 선택하세요.",
                         max_selections=3,
-                        default=get_close_matches(field, converted_df.columns, n=1, cutoff=0.4),
+                        default=_default_columns,
                         label_visibility="collapsed",
                         key=f"{field}_excel_columns",
                     )
@@ -447,7 +478,7 @@ def main():
                     )
                     _fixed_value = st.text_input(
                         "사용자 지정",
-                        value="",
+                        value=_saved.get("fixed_value", ""),
                         label_visibility="collapsed",
                         placeholder="값을 입력하세요." if _option_selected else "",
                         disabled=not _option_selected,
@@ -461,58 +492,18 @@ def main():
 
         # 필드명으로 컬럼 구성된 데이터프레임 뷰어
         # "사용자 지정"은 컬럼 이름이 아니라, 해당 컬럼에 들어갈 값을 입력함
-        field_df = pd.DataFrame(columns=hwp_field_names)
+        # 필드 값은 선택 컬럼과 사용자 지정 값별로 캐시되어, 설정이 바뀐 필드만 다시 계산
+        transform_graph = st.session_state["transform_graph"]
+        field_values = {}
         for field, setting in field_settings.items():
-            selected_columns = setting["columns"]
-            fixed_value = setting["fixed_value"]
-
-            # KeyError: "['사용자 지정'] not in index" 해결
-            # 선택된 열이 데이터프레임에 존재하는지 확인하는 검증 로직 추가
-            if "converted_df" in st.session_state:
-                selected_columns = [col for col in st.session_state["converted_df"].columns if col in converted_df.columns]
-                if not selected_columns:
-                    st.error("선택한 열이 데이터프레임에 존재하지 않습니다.")
-                    return
-
-            if len(selected_columns) == 0:
-                st.warning(f"❗ 필드 `{field}`에 대해 선택된 컬럼이 없습니다. 필드를 선택하세요.")
-                continue
-            elif len(selected_columns) == 1:
-                # 단일 선택 컬럼이므로 셀 데이터 그대로 넣기
-                if selected_columns[0] == "사용자 지정":
-                    # 사용자 지정값이므로 고정값 사용
-                    field_df[field] = fixed_value
-                elif selected_columns[0] == "조사(은/는)":
-                    # 단독사용 불가
-                    st.warning("❗ 조사(은/는) 단독 사용이 지원되지 않습니다.")
-                else:
-                    field_df[field] = converted_df[selected_columns[0]]
-            elif len(selected_columns) > 1:
-                # 다중 선택 컬럼이므로 셀 데이터 합치기
-                if "사용자 지정" in selected_columns and len(selected_columns) == 3:
-                    # "사용자 지정"이 포함된 경우 (3개 선택: df 컬럼 값 + 사용자 지정 값 + df 컬럼 값)
-                    selected_columns.remove("사용자 지정")
-                    field_df[field] = converted_df[selected_columns].apply(
-                        lambda row: f" {fixed_value} ".join(row.values.astype(str)), axis=1
-                    )
-                elif "조사(은/는)" in selected_columns and len(selected_columns) == 2:
-                    # "조사(은/는)"이 포함된 경우 (2개 선택: df 컬럼 값 + 조사(은/는))
-                    selected_columns.remove("조사(은/는)")
-                    try:
-                        fixed_value = st.text_input("사용자 지정", value="", label_visibility="collapsed")
-                        if not fixed_value:
-                            raise ValueError("올바르지 않은 조사 값입니다.")
-                        field_df[field] = converted_df[selected_columns].apply(
-                            lambda row: Josa.get_full_string(row.values.astype(str)[0], fixed_value),
-                            axis=1,
-                        )
-                    except ValueError as e:
-                        st.error(str(e))
-                else:
-                    # 실제 컬럼으로만 구성된 경우 (df 컬럼 값 + df 컬럼 값 + df 컬럼 값)
-                    field_df[field] = converted_df[selected_columns].apply(
-                        lambda row: " ".join(row.values.astype(str)), axis=1
-                    )
+            try:
+                field_values[field] = transform_graph.field(
+                    field, converted_df, setting["columns"], setting["fixed_value"]
+                )
+            except ValueError as e:
+                st.warning(f"❗ 필드 `{field}`: {e}")
+
+        field_df = pd.DataFrame(field_values, index=converted_df.index, columns=hwp_field_names)
 
         st.session_state["field_df"] = field_df
         st.session_state["field_settings"] = field_settings
@@ -534,15 +525,29 @@ def main():
             if uploaded_file_excel is None:
                 st.warning("❗ 먼저 엑셀 파일을 업로드하세요.")
             if uploaded_file_hwp is not None and uploaded_file_excel is not None:
-                with st.spinner("문서 생성 중..."):
-                    process_documents(
+                if "job_id" in st.session_state:
+                    st.warning("❗ 이미 문서를 생성하고 있습니다.")
+                else:
+                    # 확정된 필드 매칭 저장 (같은 양식과 엑셀을 다시 올리면 바로 불러옴)
+                    save_field_settings(
+                        tuple(st.session_state["hwp_field_names"]),
+                        tuple(st.session_state["converted_df"].columns),
+                        st.session_state["field_settings"],
+                    )
+
+                    # 백그라운드 작업으로 실행 (페이지를 다시 실행해도 작업은 계속됨)
+                    st.session_state.pop("job_message", None)
+                    st.session_state["job_id"] = get_job_runner().submit(
                         dataframe=st.session_state["field_df"],
                         template_path=st.session_state["hwp_temp_path"],
                         workflow_name=st.session_state["workflow_name"],
                         output_folder=st.session_state["output_folder"],
                         filename_suffixes=st.session_state["save_filenames"],
+                        resume=True,  # 이전 실행 기록으로 변경된 행만 다시 생성
                     )
-                st.success("문서 생성 완료!")
+
+    # 문서 생성 작업 진행 상황
+    render_job_progress()
 
     # 문서 삭제 버튼 (hwp, pdf)
     with button_col2:
@@ -561,102 +566,13 @@ def main():
 
     # 생성문서 파일 목록 뷰어
     # output_folder에 생성된 파일 목록 표시 (hwp, pdf)
-    # flexbox에서 가로로 스택되며,
-    # hwp / pdf 아이콘으로 표시하고, 아이콘을 누르면 다운로드
-    # 아이콘 아래 파일명 표시
+    # 페이지 단위로 아이콘과 파일명을 표시하고, 선택한 파일만 읽어서 다운로드
     if "output_folder" in st.session_state:
         output_folder = st.session_state["output_folder"]
         if not Path(output_folder).exists():
             st.header("시작하려면 HWP 양식과 Excel 파일을 업로드하세요.")
         else:
-            patterns = ["*.hwp", "*.pdf"]
-            file_paths = [
-                file for pattern in patterns for file in Path(output_folder).glob(pattern)
-            ]
-
-            st.header("생성된 문서")
-            if not file_paths:
-                st.write(
-                    "<span style='color: gray; font-size: 14px'> 생성된 문서가 없습니다.</span>",
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.write(
-                    """<span style='color: gray; font-size: 14px'>
-                        아이콘을 클릭해 다운로드합니다.
-                        <br>파일명은 워크플로우 이름을 기준으로 생성됩니다. (예: 20XX_양식문서_홍길동.hwp)
-                    </span>""",
-                    unsafe_allow_html=True,
-                )
-            st.markdown(
-                """
-                <style>
-                    .file-container {
-                        display: flex;
-                        flex-wrap: wrap;
-                        gap: 5px;
-                    }
-                    .file-item {
-                        display: flex;
-                        flex-direction: column;
-                        align-items: center;
-                        width: 120px;
-                    }
-                    .file-item img {
-                        width: auto;
-                        height: auto;
-                    }
-                    .file-name {
-                        font-size: 14px;
-                        text-align: center;
-                        word-wrap: break-word;
-                        overflow-wrap: break-word;
-                        width: 100%;
-                    }
-                </style>
-                """,
-                unsafe_allow_html=True,
-            )
-
-            file_items = ""
-            for file_path in file_paths:
-                file_name = file_path.name
-                file_type = file_path.suffix.lower()
-                mime_type = "application/pdf" if file_type == ".pdf" else "application/x-hwp"
-
-                file_path_b64 = (
-                    f"data:{mime_type};base64,{base64.b64encode(file_path.read_bytes()).decode()}"
-                )
-                file_name_short = file_name.replace(f"{st.session_state['workflow_name']}_", "")
-
-                resource_path = Path(__file__).parent / "icons"
-                image_icons = {
-                    ".hwp": "hwp_icon.png",
-                    ".pdf": "pdf_icon.png",
-                    "default": "default_icon.png",
-                }
-                file_type = image_icons.get(file_type, image_icons["default"])
-                icon_path = f"{resource_path}/{file_type}"
-                icon_path_b64 = f"data:image/png;base64,{base64.b64encode(Path(icon_path).read_bytes()).decode()}"
-
-                file_items += f'''
-                <div class="file-item">
-                    <a href="{file_path_b64}" download="{file_name}">
-                        <img src="{icon_path_b64}" alt="{file_type} icon">
-                    </a>
-                    <span class="file-name">{file_name_short}</span>
-                </div>
-                '''
-
-            # 전체 파일 목록을 Flexbox 컨테이너에 삽입
-            st.markdown(
-                f"""
-                <div class="file-container">
-                    {file_items}
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            render_file_browser(output_folder, st.session_state["workflow_name"])
 
 
 if __name__ == "__main__":
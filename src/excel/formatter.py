@@ -1,6 +1,10 @@
 from datetime import datetime
+from typing import Any, Literal
 
+import numpy as np
+import pandas as pd
 from openpyxl.cell import Cell, MergedCell
+from openpyxl.cell.read_only import EmptyCell, ReadOnlyCell
 from openpyxl.styles import is_date_format
 
 from excel.config import EXCEL_TO_STRFTIME
@@ -25,3 +29,181 @@ def format_cell(cell: "Cell | MergedCell") -> str | None:
             return cell.value.strftime(fmt)
 
     return str(cell.value)
+
+
+# 기본 날짜 포맷 (EXCEL_TO_STRFTIME에 없는 날짜 서식)
+DEFAULT_STRFTIME = "%Y.%m.%d."
+
+
+class ColumnFormat:
+    """
+    엑셀 열 하나의 변환 방식입니다.
+
+    - "text": 모든 값을 문자열로 변환
+    - "date": 날짜 값을 strftime 포맷으로, 나머지는 문자열로 변환
+    - "unknown": 표본에 값이 없는 열로, 날짜 값은 기본 포맷으로 변환
+    - "mixed": 표본 안에서 서식이 섞인 열로, 셀마다 format_cell로 변환
+
+    표본 뒤의 행에서 계획과 다른 서식(텍스트 열의 날짜, 다른 날짜 서식)이 나오면
+    해당 조각의 그 열은 셀마다 format_cell로 변환합니다. (format_columns, needs_cells 참고)
+    """
+
+    def __init__(
+        self,
+        kind: Literal["text", "date", "unknown", "mixed"],
+        strftime: str = "",
+        number_format: str = "",
+    ):
+        self.kind = kind
+        self.strftime = strftime
+        self.number_format = number_format  # "date" 열의 엑셀 날짜 서식
+
+    def __repr__(self) -> str:
+        return f"ColumnFormat({self.kind!r}, {self.strftime!r}, {self.number_format!r})"
+
+
+def plan_column_formats(
+    sample: list[tuple["Cell | MergedCell", ...]], width: int
+) -> list[ColumnFormat]:
+    """
+    표본 행들의 셀 서식으로 열마다 변환 방식을 한 번만 결정합니다.
+    EXCEL_TO_STRFTIME 매핑은 이 단계에서 열별 strftime 포맷으로 바뀝니다.
+
+    Args:
+        sample (list[tuple[Cell | MergedCell, ...]]): 표본 데이터 행 목록
+        width (int): 열 개수
+
+    Returns:
+        list[ColumnFormat]: 열별 변환 방식
+    """
+    plans = []
+    for col in range(width):
+        number_formats = {
+            row[col].number_format
+            for row in sample
+            if col < len(row) and row[col].value is not None
+        }
+        date_formats = {fmt for fmt in number_formats if is_date_format(fmt)}
+
+        if not number_formats:
+            plans.append(ColumnFormat("unknown", DEFAULT_STRFTIME))
+        elif not date_formats:
+            plans.append(ColumnFormat("text"))
+        elif len(number_formats) == 1:
+            (fmt,) = date_formats
+            plans.append(ColumnFormat("date", EXCEL_TO_STRFTIME.get(fmt, DEFAULT_STRFTIME), fmt))
+        else:
+            plans.append(ColumnFormat("mixed"))
+
+    return plans
+
+
+def format_columns(
+    rows: list[tuple[Any, ...]], plans: list[ColumnFormat]
+) -> list[list[str | None]]:
+    """
+    행 목록을 열 단위로 한 번에 변환합니다.
+
+    Args:
+        rows (list[tuple[Any, ...]]): 행 목록
+            - 셀 객체의 튜플, 또는 needs_cells가 False인 경우에만 셀 값(values_only)의 튜플
+        plans (list[ColumnFormat]): plan_column_formats로 만든 열별 변환 방식
+
+    Returns:
+        list[list[str | None]]: 열별 변환된 값 목록
+    """
+    columns = []
+    for col, plan in enumerate(plans):
+        # 읽기 전용 시트에서는 뒤쪽 빈 셀이 빠진 짧은 행이 있을 수 있음
+        cells = [row[col] if col < len(row) else None for row in rows]
+        if plan.kind == "mixed" or not _follows_plan(cells, plan):
+            # 표본과 서식이 다른 셀이 있으면 이 조각의 열은 셀마다 변환
+            columns.append([None if cell is None else format_cell(cell) for cell in cells])
+            continue
+
+        values = [_value(cell) for cell in cells]
+        if plan.kind == "text":
+            columns.append(_format_text(values))
+        else:
+            columns.append(_format_dates(values, plan.strftime))
+
+    return columns
+
+
+def needs_cells(rows: list[tuple[Any, ...]], plans: list[ColumnFormat]) -> bool:
+    """
+    셀 값(values_only)만으로는 계획대로 변환할 수 없는 행이 있는지 확인합니다.
+    표본 뒤의 행에서 "text" 또는 "unknown" 열에 날짜 값이 나오면, 셀 서식을 알아야
+    format_cell과 같은 결과를 만들 수 있으므로 해당 조각을 셀 객체로 다시 읽어야 합니다.
+    ("date", "mixed" 열이 있으면 처음부터 셀 객체로 읽음)
+
+    Args:
+        rows (list[tuple[Any, ...]]): 셀 값의 튜플 목록
+        plans (list[ColumnFormat]): 열별 변환 방식
+
+    Returns:
+        bool: 셀 객체로 다시 읽어야 하는지 여부
+    """
+    for col, plan in enumerate(plans):
+        if plan.kind in ("text", "unknown") and any(
+            col < len(row) and isinstance(row[col], datetime) for row in rows
+        ):
+            return True
+    return False
+
+
+def _follows_plan(cells: list[Any], plan: ColumnFormat) -> bool:
+    """
+    셀 객체 목록이 열의 변환 계획과 같은 결과를 내는지 확인합니다. (셀 값 목록이면 항상 True)
+    - "text", "unknown": 날짜 값이 없어야 함
+    - "date": 날짜 값의 셀 서식이 모두 표본의 날짜 서식과 같아야 함
+    """
+    present = [cell for cell in cells if cell is not None]
+    if not present or not hasattr(present[0], "number_format"):
+        return True
+
+    dated = [cell for cell in present if isinstance(cell.value, datetime)]
+    if plan.kind == "date":
+        return all(cell.number_format == plan.number_format for cell in dated)
+    return not dated
+
+
+def _value(cell: Any) -> Any:
+    """
+    셀 객체 또는 셀 값에서 값을 꺼냅니다.
+    """
+    return cell.value if isinstance(cell, (Cell, MergedCell, ReadOnlyCell, EmptyCell)) else cell
+
+
+def _format_text(values: list[Any]) -> list[str | None]:
+    """
+    값 목록을 문자열로 변환합니다. (None은 유지)
+    빈 값이 없는 숫자 열은 NumPy로 한 번에 변환합니다.
+    """
+    if values and None not in values:
+        array = np.asarray(values)
+        if array.dtype.kind in "iu":
+            return array.astype(str).tolist()
+
+    return [None if value is None else str(value) for value in values]
+
+
+def _format_dates(values: list[Any], strftime: str) -> list[str | None]:
+    """
+    날짜 열의 값 목록을 strftime 포맷 문자열로 변환합니다.
+    모든 값이 날짜이면 pandas로 한 번에 변환하고, 다른 값이 섞여 있으면 값마다 변환합니다.
+    """
+    if all(value is None or isinstance(value, datetime) for value in values):
+        try:
+            converted = pd.Series(pd.to_datetime(values)).dt.strftime(strftime)
+        except (ValueError, OverflowError):
+            pass  # pandas 날짜 범위를 벗어나면 값마다 변환
+        else:
+            return [None if value is None else text for value, text in zip(values, converted)]
+
+    return [
+        value.strftime(strftime)
+        if isinstance(value, datetime)
+        else (None if value is None else str(value))
+        for value in values
+    ]
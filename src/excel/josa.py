@@ -0,0 +1,72 @@
+from functools import lru_cache
+
+import pandas as pd
+from pyjosa.jonsung import Jongsung
+from pyjosa.josa import Josa
+
+# 받침 여부별 조사를 구할 때 사용하는 대표 글자 (pyjosa는 마지막 글자만 확인)
+_REPRESENTATIVE = {True: "각", False: "가"}
+
+
+@lru_cache(maxsize=4096)
+def has_batchim(last_char: str) -> bool:
+    """
+    글자의 받침(종성) 여부를 반환합니다. (글자별 LRU 캐시)
+
+    Args:
+        last_char (str): 단어의 마지막 글자
+
+    Returns:
+        bool: 받침이 있으면 True
+            - 한글이 아니면 pyjosa와 같이 NotHangleException 발생
+    """
+    return Jongsung.has_jongsung(last_char)
+
+
+@lru_cache(maxsize=256)
+def resolve_josa(batchim: bool, josa: str) -> str:
+    """
+    받침 여부에 맞는 조사를 반환합니다. (받침 여부와 조사별 캐시)
+
+    Args:
+        batchim (bool): 앞 글자의 받침 여부
+        josa (str): 조사 (예: "을", "를", "은", "는")
+
+    Returns:
+        str: 받침 여부에 맞는 조사
+            - 지원하지 않는 조사는 pyjosa와 같이 JosaTypeException 발생
+    """
+    return Josa.get_josa(_REPRESENTATIVE[batchim], josa)
+
+
+def get_full_string(word: str, josa: str) -> str:
+    """
+    단어 뒤에 조사를 붙여서 반환합니다.
+    pyjosa의 Josa.get_full_string과 결과(예외 포함)가 같고, 마지막 글자와 조사별 캐시를 사용합니다.
+
+    Args:
+        word (str): 단어 (예: "홍길동")
+        josa (str): 조사 (예: "을")
+
+    Returns:
+        str: 단어와 조사를 붙인 문자열 (예: "홍길동을")
+    """
+    return word + resolve_josa(has_batchim(word[-1]), josa)
+
+
+def apply_josa(series: pd.Series, josa: str) -> pd.Series:
+    """
+    열 전체의 값 뒤에 조사를 붙입니다.
+    중복을 제거한 값에 대해서만 조사를 구한 뒤, 원래 행에 다시 대응시킵니다.
+
+    Args:
+        series (pd.Series): 단어 열 (예: 성명, 책임교수명)
+        josa (str): 조사 (예: "을")
+
+    Returns:
+        pd.Series: 조사가 붙은 열
+            - series.apply(lambda x: Josa.get_full_string(x, josa))와 같은 결과
+    """
+    uniques = series.unique()
+    resolved = {word: get_full_string(word, josa) for word in uniques}
+    return series.map(resolved)
@@ -1,11 +1,25 @@
+import os
 import warnings
-from typing import Any
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Literal
 
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from pandas import DataFrame
+from pandas import DataFrame, RangeIndex, concat
 
-from excel.formatter import format_cell
+from excel.formatter import ColumnFormat, format_columns, needs_cells, plan_column_formats
+
+# 시트 선택 방법: None(활성 시트), 시트 이름, 시트 번호(0부터), 이름 패턴("2024-*", "*"), 또는 그 목록
+SheetSelector = str | int | Sequence[str | int] | None
+
+# 여러 시트를 합칠 때 열 구성이 다른 경우의 처리 방법
+HeaderMode = Literal["same", "union", "common"]
+
+# 합친 데이터프레임에서 행의 원본(파일 이름, 시트 이름)을 기록하는 열
+SOURCE_COLUMNS = ("원본 파일", "원본 시트")
 
 
 def load_worksheet(path: str, **kwargs) -> Worksheet:
@@ -58,6 +72,53 @@ def data_loader(
         DataFrame: 엑셀 데이터로 생성된 데이터프레임
     """
 
+    chunks = list(
+        iter_data_chunks(
+            worksheet,
+            header_row=header_row,
+            start_row=start_row,
+            end_row=end_row,
+            key_columns=key_columns,
+        )
+    )
+
+    if not chunks:
+        raise ValueError("No valid data found in the specified range.")
+
+    return concat(chunks) if len(chunks) > 1 else chunks[0]
+
+
+def iter_data_chunks(
+    worksheet: Worksheet,
+    header_row: int = 1,
+    start_row: int | None = None,
+    end_row: int | None = None,
+    key_columns: list[Any] | None = None,
+    chunk_size: int = 1000,
+    sample_size: int = 20,
+) -> Iterator[DataFrame]:
+    """
+    엑셀 워크시트에서 데이터를 읽으면서 chunk_size 행씩 데이터프레임으로 반환합니다.
+    시트 전체를 읽기 전에 앞쪽 행부터 처리할 수 있고, 메모리 사용량은 chunk_size에 비례합니다.
+
+    Args:
+        worksheet (Worksheet): 엑셀 워크시트 객체
+        header_row (int): 헤더가 있는 행 번호 (1부터 시작)
+        start_row (int | None): 데이터 시작 행 번호
+            - 지정되지 않으면 header_row + 1로 설정됩니다.
+        end_row (int | None): 데이터 종료 행 번호
+            - 지정되지 않으면 시트 끝까지 읽습니다. (worksheet.max_row를 계산하지 않음)
+        key_columns (list[Any]): 기본키 열 이름의 리스트
+            - 키 열이 정의되지 않으면 첫 번째 열이 기본키로 사용됩니다.
+        chunk_size (int): 한 번에 반환할 최대 행 수
+        sample_size (int): 열별 서식을 판단할 때 사용할 표본 행 수
+            - 열마다 서식을 한 번만 판단하고, 열 전체를 한 번에 변환 (excel.formatter 참고)
+
+    Yields:
+        DataFrame: 데이터프레임 조각
+            - 인덱스는 조각 사이에서 이어지는 0부터의 번호 (data_loader 결과와 동일)
+    """
+
     # Suppress openpyxl warnings
     # UserWarning: Data Validation extension is not supported and will be removed
     warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
@@ -72,24 +133,297 @@ def data_loader(
         key_columns = [header[0]]
     key_column_indices = [header.index(col) for col in key_columns]
 
-    # print(f"key_columns: {key_columns}")
-    # print(f"key_column_indices: {key_column_indices}")
-
     # 데이터 시작 행 설정
     if start_row is None:
         start_row = header_row + 1
 
-    if end_row is None:
-        end_row = worksheet.max_row
+    # 표본 행의 셀 서식으로 열별 변환 방식을 한 번만 결정
+    sample_end = (
+        start_row + sample_size - 1
+        if end_row is None
+        else min(end_row, start_row + sample_size - 1)
+    )
+    sample = list(worksheet.iter_rows(min_row=start_row, max_row=sample_end))
+    column_formats = plan_column_formats(sample, len(header))
+
+    # 날짜 열과 서식이 섞인 열이 없으면 셀 객체 없이 값만 읽음
+    # (표본 뒤에서 날짜 값이 나온 조각은 셀 객체로 다시 읽어 셀 서식대로 변환)
+    values_only = all(plan.kind in ("text", "unknown") for plan in column_formats)
 
     # 데이터 로드
     fill_data = []
-    for row in worksheet.iter_rows(min_row=start_row, max_row=end_row):
+    fill_rows = []  # fill_data 행들의 시트 행 번호
+    offset = 0
+    rows = worksheet.iter_rows(min_row=start_row, max_row=end_row, values_only=values_only)
+    for row_number, row in enumerate(rows, start=start_row):
         # 모든 기본키 열의 값이 None이 아닌 경우에만 추가
-        if all(row[col].value is not None for col in key_column_indices):
-            fill_data.append([format_cell(cell) for cell in row])
+        if values_only:
+            is_valid = all(row[col] is not None for col in key_column_indices)
+        else:
+            is_valid = all(row[col].value is not None for col in key_column_indices)
+        if is_valid:
+            fill_data.append(row)
+            fill_rows.append(row_number)
 
-    if not fill_data:
-        raise ValueError("No valid data found in the specified range.")
+        if len(fill_data) >= chunk_size:
+            yield _to_frame(
+                _with_cells(worksheet, fill_data, fill_rows, column_formats, values_only),
+                header,
+                column_formats,
+                offset,
+            )
+            offset += len(fill_data)
+            fill_data, fill_rows = [], []
+
+    if fill_data:
+        yield _to_frame(
+            _with_cells(worksheet, fill_data, fill_rows, column_formats, values_only),
+            header,
+            column_formats,
+            offset,
+        )
+
+
+def _with_cells(
+    worksheet: Worksheet,
+    rows: list[tuple[Any, ...]],
+    row_numbers: list[int],
+    column_formats: list[ColumnFormat],
+    values_only: bool,
+) -> list[tuple[Any, ...]]:
+    """
+    값만 읽은 조각에 계획과 다른 서식의 값(텍스트 열의 날짜 등)이 있으면 같은 행들을 셀 객체로 다시 읽습니다.
+    """
+    if not values_only or not needs_cells(rows, column_formats):
+        return rows
+
+    wanted = set(row_numbers)
+    cells = worksheet.iter_rows(min_row=row_numbers[0], max_row=row_numbers[-1])
+    return [row for number, row in enumerate(cells, start=row_numbers[0]) if number in wanted]
+
+
+def _to_frame(
+    rows: list[tuple[Any, ...]],
+    header: list[Any],
+    column_formats: list[ColumnFormat],
+    offset: int,
+) -> DataFrame:
+    """
+    행 목록을 열 단위로 변환하여 offset부터 번호가 매겨진 데이터프레임으로 만듭니다.
+    """
+    columns = format_columns(rows, column_formats)
+    frame = DataFrame(
+        dict(enumerate(columns)),
+        index=RangeIndex(offset, offset + len(rows)),
+    )
+    frame.columns = header
+    return frame
+
+
+def resolve_sheets(path: str, sheets: SheetSelector = None) -> list[str]:
+    """
+    엑셀 파일에서 시트 선택에 해당하는 시트 이름 목록을 반환합니다.
+
+    Args:
+        path (str): 엑셀 파일 경로
+        sheets (SheetSelector): 시트 선택
+            - None: 활성 시트 (load_worksheet와 동일)
+            - str: 시트 이름 또는 이름 패턴 (예: "2024-*", 모든 시트는 "*")
+            - int: 시트 번호 (0부터 시작)
+            - list: 위 값들의 목록 (중복 제외, 파일의 시트 순서가 아니라 목록 순서)
+
+    Returns:
+        list[str]: 시트 이름 목록
+
+    Raises:
+        ValueError: 선택에 해당하는 시트가 없는 경우
+    """
+    wb = load_workbook(path, read_only=True)
+    try:
+        names = wb.sheetnames
+        if sheets is None:
+            active = wb.active or wb.worksheets[0]
+            return [active.title]
+        selectors = [sheets] if isinstance(sheets, str | int) else list(sheets)
+    finally:
+        wb.close()
+
+    selected: dict[str, None] = {}
+    for selector in selectors:
+        if isinstance(selector, int):
+            if not -len(names) <= selector < len(names):
+                raise ValueError(f"Sheet index {selector} is out of range in {path}.")
+            selected[names[selector]] = None
+            continue
+
+        matched = [name for name in names if name == selector or fnmatchcase(name, selector)]
+        if not matched:
+            raise ValueError(f"No sheet matches {selector!r} in {path} (sheets: {names}).")
+        selected.update(dict.fromkeys(matched))
+
+    return list(selected)
+
+
+def load_sheet(
+    path: str,
+    sheet_name: str,
+    header_row: int = 1,
+    start_row: int | None = None,
+    end_row: int | None = None,
+    key_columns: list[Any] | None = None,
+) -> DataFrame:
+    """
+    엑셀 파일의 시트 하나를 읽어 데이터프레임으로 반환합니다. (작업 프로세스에서도 실행)
+    data_loader와 달리 데이터가 없는 시트는 오류 대신 빈 데이터프레임을 반환하고,
+    읽은 뒤 엑셀 파일을 닫습니다.
+
+    Args:
+        path (str): 엑셀 파일 경로
+        sheet_name (str): 시트 이름
+        header_row, start_row, end_row, key_columns: data_loader 참고
+
+    Returns:
+        DataFrame: 시트 데이터프레임 (데이터가 없으면 빈 데이터프레임)
+    """
+    worksheet = load_worksheet(path, sheet_name=sheet_name)
+    try:
+        chunks = list(
+            iter_data_chunks(
+                worksheet,
+                header_row=header_row,
+                start_row=start_row,
+                end_row=end_row,
+                key_columns=key_columns,
+            )
+        )
+    finally:
+        worksheet.parent.close()
+
+    if not chunks:
+        return DataFrame()
+    return concat(chunks) if len(chunks) > 1 else chunks[0]
+
+
+def load_workbooks(
+    sources: Sequence[str | tuple[str, SheetSelector]],
+    sheets: SheetSelector = None,
+    header_row: int = 1,
+    start_row: int | None = None,
+    end_row: int | None = None,
+    key_columns: list[Any] | None = None,
+    headers: HeaderMode = "same",
+    source_columns: tuple[str, str] | None = SOURCE_COLUMNS,
+    workers: int | None = None,
+) -> DataFrame:
+    """
+    여러 엑셀 파일의 여러 시트를 읽어 하나의 데이터프레임으로 합칩니다.
+    (예: 팀별 엑셀 파일의 월별 시트를 한 번의 문서 생성으로 처리)
+
+    시트마다 작업 프로세스에서 따로 읽고(openpyxl 해석은 CPU 작업), 결과는 sources와 시트 순서대로 합칩니다.
+    모든 시트는 같은 header_row, start_row, end_row, key_columns로 읽습니다.
+
+    Args:
+        sources (Sequence[str | tuple[str, SheetSelector]]): 엑셀 파일 경로 목록
+            - (경로, 시트 선택) 형식이면 해당 파일만 sheets 대신 그 시트 선택을 사용
+        sheets (SheetSelector): 기본 시트 선택 (resolve_sheets 참고, 기본은 활성 시트)
+        header_row, start_row, end_row, key_columns: data_loader 참고
+        headers (HeaderMode): 시트마다 열 구성이 다를 때의 처리 방법
+            - "same": 모든 시트의 열 이름 집합이 같아야 함 (순서는 첫 시트 기준으로 맞춤)
+            - "union": 모든 열을 사용하고 없는 열은 빈 값
+            - "common": 모든 시트에 있는 열만 사용
+            - 제목이 없는 열(빈 헤더 셀)은 항상 제외
+        source_columns (tuple[str, str] | None): 원본 파일 이름과 시트 이름을 기록할 열 이름
+            - None인 경우, 원본 열을 추가하지 않음
+        workers (int | None): 작업 프로세스 수
+            - None인 경우, 시트 수와 CPU 수 중 작은 값
+            - 1 이하이거나 시트가 하나이면 프로세스 없이 현재 프로세스에서 읽음
+
+    Returns:
+        DataFrame: 합친 데이터프레임
+            - 인덱스는 0부터 이어지는 번호 (data_loader 결과와 동일, 행 번호 = 인덱스 + 1)
+
+    Raises:
+        ValueError: 시트가 없거나, 열 구성이 맞지 않거나, 원본 열 이름이 데이터 열과 겹치는 경우
+    """
+    tasks = []
+    for source in sources:
+        path, selector = source if isinstance(source, tuple) else (source, sheets)
+        tasks.extend((str(path), name) for name in resolve_sheets(str(path), selector))
+    if not tasks:
+        raise ValueError("No worksheets to load.")
+
+    options = {
+        "header_row": header_row,
+        "start_row": start_row,
+        "end_row": end_row,
+        "key_columns": key_columns,
+    }
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count() or 1)
+
+    if workers <= 1 or len(tasks) == 1:
+        frames = [load_sheet(path, name, **options) for path, name in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(load_sheet, path, name, **options) for path, name in tasks]
+            frames = [future.result() for future in futures]
+
+    # 제목이 없는 열은 이름으로 참조할 수 없으므로 제외하고, 데이터가 없는 시트는 건너뜀
+    loaded = [
+        (task, frame.loc[:, frame.columns.notna()])
+        for task, frame in zip(tasks, frames)
+        if len(frame)
+    ]
+    if not loaded:
+        raise ValueError("No valid data found in the specified worksheets.")
+
+    columns = _merge_headers([(task, list(frame.columns)) for task, frame in loaded], headers)
+    if source_columns is not None:
+        overlap = [col for col in source_columns if col in columns]
+        if overlap:
+            raise ValueError(f"Source columns {overlap} already exist in the worksheets.")
+
+    tagged = []
+    for (path, name), frame in loaded:
+        frame = frame.reindex(columns=columns)
+        if source_columns is not None:
+            file_column, sheet_column = source_columns
+            frame = frame.assign(**{file_column: Path(path).name, sheet_column: name})
+        tagged.append(frame)
+
+    return concat(tagged, ignore_index=True)
+
+
+def _merge_headers(
+    headers: list[tuple[tuple[str, str], list[Any]]],
+    mode: HeaderMode,
+) -> list[Any]:
+    """
+    시트별 열 이름 목록을 비교하여 합친 데이터프레임의 열 목록을 반환합니다. (첫 시트의 열 순서 기준)
+    """
+    (_, first), *rest = headers
+    columns = list(first)
+
+    if mode == "union":
+        for _, header in rest:
+            columns.extend(col for col in header if col not in columns)
+        return columns
+
+    if mode == "common":
+        common = set(first).intersection(*(header for _, header in rest))
+        return [col for col in columns if col in common]
 
-    return DataFrame(fill_data, columns=header)
+    expected = set(first)
+    mismatches = []
+    for (path, name), header in rest:
+        missing = [col for col in first if col not in header]
+        extra = [col for col in header if col not in expected]
+        if missing or extra:
+            mismatches.append(f"{Path(path).name}:{name} (missing: {missing}, extra: {extra})")
+    if mismatches:
+        first_path, first_name = headers[0][0]
+        raise ValueError(
+            f"Worksheet headers differ from {Path(first_path).name}:{first_name}: "
+            + "; ".join(mismatches)
+        )
+    return columns
@@ -0,0 +1,218 @@
+import json
+from collections.abc import Callable
+from typing import Annotated, Literal
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from excel.josa import apply_josa
+
+
+class ConstantStep(BaseModel):
+    """
+    모든 행에 같은 값을 넣습니다.
+    """
+
+    op: Literal["constant"] = "constant"
+    target: str = Field(..., title="결과 열", examples=["산학협력단장명"])
+    value: str = Field(..., title="값", examples=["홍길동"])
+
+
+class ConcatStep(BaseModel):
+    """
+    여러 열의 값을 구분자로 이어붙입니다. (값이 비어 있는 열이 있으면 결과도 비어 있음)
+    """
+
+    op: Literal["concat"] = "concat"
+    target: str = Field(..., title="결과 열", examples=["총 사업기간"])
+    sources: list[str] = Field(
+        ..., title="원본 열", examples=[["총 사업기간 시작", "총 사업기간 종료"]], min_length=1
+    )
+    sep: str = Field(" ", title="구분자", examples=[" ~ "])
+
+
+class JosaStep(BaseModel):
+    """
+    열의 값 뒤에 받침에 맞는 조사를 붙입니다.
+    """
+
+    op: Literal["josa"] = "josa"
+    target: str = Field(..., title="결과 열", examples=["성명(본문)"])
+    source: str = Field(..., title="원본 열", examples=["성명"])
+    josa: str = Field(..., title="조사", examples=["을", "은", "이"])
+
+
+class NumberStep(BaseModel):
+    """
+    열의 값을 정수로 바꾸고 숫자 서식을 적용합니다.
+    """
+
+    op: Literal["number"] = "number"
+    target: str = Field(..., title="결과 열", examples=["총 계약금액"])
+    source: str = Field(..., title="원본 열", examples=["총 계약금액"])
+    format: Literal["#,##0", "0"] = Field("#,##0", title="숫자 서식")
+
+
+class DateStep(BaseModel):
+    """
+    열의 값을 날짜로 해석하고 날짜 서식을 적용합니다.
+    """
+
+    op: Literal["date"] = "date"
+    target: str = Field(..., title="결과 열", examples=["계약일"])
+    source: str = Field(..., title="원본 열", examples=["계약일"])
+    format: str = Field("%Y.%m.%d.", title="날짜 서식 (strftime)", examples=["%Y년 %m월 %d일"])
+
+
+PipelineStep = Annotated[
+    ConstantStep | ConcatStep | JosaStep | NumberStep | DateStep,
+    Field(discriminator="op"),
+]
+
+
+class PreprocessPipeline(BaseModel):
+    """
+    엑셀 데이터프레임 전처리 단계 목록입니다. (JSON으로 저장하고 불러올 수 있음)
+    단계는 순서대로 적용되며, 앞 단계의 결과 열을 뒤 단계에서 원본 열로 사용할 수 있습니다.
+
+    Example:
+        pipeline = PreprocessPipeline(steps=[
+            {"op": "josa", "target": "성명(본문)", "source": "성명", "josa": "을"},
+            {"op": "concat", "target": "기간", "sources": ["시작", "종료"], "sep": " ~ "},
+        ])
+        df = pipeline.run(df)
+    """
+
+    steps: list[PipelineStep] = []
+
+    def compile(self, columns: list[str]) -> "CompiledPipeline":
+        """
+        단계 목록을 실행 계획으로 만들고, 참조하는 열이 모두 있는지 미리 확인합니다.
+
+        Args:
+            columns (list[str]): 입력 데이터프레임의 열 이름 목록
+
+        Returns:
+            CompiledPipeline: 실행 계획
+
+        Raises:
+            ValueError: 입력에도, 앞 단계의 결과에도 없는 열을 참조하는 경우
+        """
+        available = set(columns)
+        missing = []
+        for number, step in enumerate(self.steps, start=1):
+            sources = getattr(step, "sources", None) or (
+                [step.source] if hasattr(step, "source") else []
+            )
+            missing += [f"{number}단계({step.op}): {s}" for s in sources if s not in available]
+            available.add(step.target)
+
+        if missing:
+            raise ValueError(f"전처리 단계가 참조하는 열이 없습니다: {', '.join(missing)}")
+
+        return CompiledPipeline(self.steps)
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        데이터프레임에 전처리 단계를 적용합니다.
+
+        Args:
+            df (pd.DataFrame): 원본 데이터프레임
+
+        Returns:
+            pd.DataFrame: 전처리된 데이터프레임 (원본은 변경하지 않음)
+        """
+        return self.compile(list(df.columns)).run(df)
+
+
+def load_pipeline(data: str | bytes) -> PreprocessPipeline:
+    """
+    JSON에서 전처리 단계 목록을 불러옵니다.
+
+    Args:
+        data (str | bytes): PreprocessPipeline JSON 또는 "pipeline" 항목이 있는 설정(Config) JSON
+
+    Returns:
+        PreprocessPipeline: 전처리 단계 목록
+    """
+    content = json.loads(data)
+    if isinstance(content, dict) and "pipeline" in content:
+        content = content["pipeline"]
+    return PreprocessPipeline.model_validate(content)
+
+
+class CompiledPipeline:
+    """
+    검증이 끝난 전처리 실행 계획입니다.
+    단계마다 결과 열을 계산해서 모아 두고, 마지막에 한 번에 데이터프레임에 반영합니다.
+    원본 열은 단계마다 다시 읽지 않고 처음 읽은 값을 재사용합니다.
+    """
+
+    def __init__(self, steps: list[PipelineStep]):
+        self.steps = list(steps)
+        self.operations: list[tuple[str, Callable[[_ColumnView], pd.Series]]] = [
+            (step.target, _compile_step(step)) for step in self.steps
+        ]
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Args:
+            df (pd.DataFrame): 원본 데이터프레임
+
+        Returns:
+            pd.DataFrame: 전처리된 데이터프레임 (새 열은 단계 순서대로 뒤에 추가)
+        """
+        columns = _ColumnView(df)
+        outputs: dict[str, pd.Series] = {}
+        for target, operation in self.operations:
+            outputs[target] = columns[target] = operation(columns)
+
+        return df.assign(**outputs)
+
+
+class _ColumnView(dict):
+    """
+    원본 데이터프레임의 열을 처음 참조할 때 한 번만 읽어 두는 열 저장소입니다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        super().__init__()
+        self.df = df
+
+    def __missing__(self, column: str) -> pd.Series:
+        series = self[column] = self.df[column]
+        return series
+
+
+def _compile_step(step: PipelineStep) -> Callable[["_ColumnView"], pd.Series]:
+    """
+    단계 하나를 열 저장소를 받아 결과 열을 반환하는 함수로 만듭니다.
+    """
+    if isinstance(step, ConstantStep):
+        return lambda columns: pd.Series(step.value, index=columns.df.index)
+
+    if isinstance(step, ConcatStep):
+
+        def concat(columns):
+            first, *rest = (columns[source] for source in step.sources)
+            return first.str.cat(rest, sep=step.sep) if rest else first
+
+        return concat
+
+    if isinstance(step, JosaStep):
+        return lambda columns: apply_josa(columns[step.source], step.josa)
+
+    if isinstance(step, NumberStep):
+        pattern = "{:,}" if step.format == "#,##0" else "{}"
+
+        def number(columns):
+            values = columns[step.source].astype(int)
+            # 같은 금액이 반복되는 경우가 많으므로 서로 다른 값만 서식 적용
+            return values.map({value: pattern.format(value) for value in values.unique()})
+
+        return number
+
+    if isinstance(step, DateStep):
+        return lambda columns: pd.to_datetime(columns[step.source]).dt.strftime(step.format)
+
+    raise ValueError(f"지원하지 않는 전처리 단계입니다: {step.op}")
@@ -1,10 +1,47 @@
 import pandas as pd
-from pyjosa.josa import Josa
+
+from excel.pipeline import PreprocessPipeline
+
+
+def contract_pipeline(config: dict) -> PreprocessPipeline:
+    """
+    채용계약서 양식의 전처리 단계를 만듭니다.
+
+    Args:
+        config (dict): 설정 값
+            - const_sanhak: 산학협력단장명 열 이름
+            - sanhak_name: 산학협력단장 이름
+
+    Returns:
+        PreprocessPipeline: 전처리 단계 목록
+    """
+    return PreprocessPipeline(
+        steps=[
+            {"op": "constant", "target": config["const_sanhak"], "value": config["sanhak_name"]},
+            {"op": "josa", "target": "성명(본문)", "source": "성명", "josa": "을"},
+            {"op": "josa", "target": "책임교수명(본문)", "source": "책임교수명", "josa": "을"},
+            {
+                "op": "concat",
+                "target": "총 사업기간",
+                "sources": ["총 사업기간 시작", "총 사업기간 종료"],
+                "sep": " ~ ",
+            },
+            {
+                "op": "concat",
+                "target": "당해연도 사업기간",
+                "sources": ["당해연도 사업기간 시작", "당해연도 사업기간 종료"],
+                "sep": " ~ ",
+            },
+            {"op": "number", "target": "총 계약금액", "source": "총 계약금액"},
+            {"op": "number", "target": "월 계약금액", "source": "월 계약금액"},
+        ]
+    )
 
 
 def preprocess_dataframe(df: pd.DataFrame, config: dict) -> pd.DataFrame:
     """
     DataFrame을 가공하여 필요한 필드를 추가 및 포맷팅합니다.
+    (채용계약서 양식의 전처리 단계(contract_pipeline)를 적용)
 
     Args:
         df (pd.DataFrame): 원본 데이터프레임
@@ -13,12 +50,4 @@ def preprocess_dataframe(df: pd.DataFrame, config: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: 가공된 데이터프레임
     """
-    df[config["const_sanhak"]] = config["sanhak_name"]
-    df["성명(본문)"] = df["성명"].apply(lambda x: Josa.get_full_string(x, "을"))
-    df["책임교수명(본문)"] = df["책임교수명"].apply(lambda x: Josa.get_full_string(x, "을"))
-    df["총 사업기간"] = df["총 사업기간 시작"] + " ~ " + df["총 사업기간 종료"]
-    df["당해연도 사업기간"] = df["당해연도 사업기간 시작"] + " ~ " + df["당해연도 사업기간 종료"]
-    df["총 계약금액"] = df["총 계약금액"].astype(int).apply(lambda x: f"{x:,}")
-    df["월 계약금액"] = df["월 계약금액"].astype(int).apply(lambda x: f"{x:,}")
-
-    return df
+    return contract_pipeline(config).run(df)
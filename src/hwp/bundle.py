@@ -0,0 +1,143 @@
+import os
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Self
+
+from hwp.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from hwp.service import RowResult
+
+# flat: 모든 파일을 ZIP 최상위에 저장
+# key: 문서(행)마다 폴더를 만들어 저장 (예: "채용계약서_홍길동/채용계약서_홍길동.pdf")
+BundleLayout = Literal["flat", "key"]
+
+
+class ZipBundle:
+    """
+    생성된 문서 파일을 ZIP 파일로 묶는 내보내기 단계입니다.
+    process_documents(on_result=bundle.add)로 연결하면 행이 끝날 때마다 파일을 바로 추가하며,
+    파일은 디스크에서 조금씩 읽어 압축하므로 문서 전체를 메모리에 올리지 않습니다.
+
+    ZIP 파일은 임시 이름으로 작성하다가 닫을 때 최종 이름으로 바꿉니다.
+
+    Example:
+        with ZipBundle("output.zip", layout="key") as bundle:
+            process_documents(..., on_result=bundle.add)
+    """
+
+    def __init__(self, zip_path: str | Path, layout: BundleLayout = "flat"):
+        """
+        Args:
+            zip_path (str | Path): ZIP 파일 경로
+            layout (BundleLayout): ZIP 안의 폴더 구성
+                - "flat": 모든 파일을 최상위에 저장
+                - "key": 문서(행)마다 저장 파일 이름으로 폴더를 만들어 저장
+        """
+        if layout not in ("flat", "key"):
+            raise ValueError(f"지원하지 않는 ZIP 폴더 구성입니다: {layout}")
+
+        self.path = Path(zip_path)
+        self.layout = layout
+        self.count = 0
+        self._temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self._archive: zipfile.ZipFile | None = None
+        self._names: set[str] = set()
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        ZIP 파일 작성을 시작합니다.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._archive = zipfile.ZipFile(self._temp_path, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def close(self) -> None:
+        """
+        ZIP 파일 작성을 마치고 최종 이름으로 저장합니다.
+        """
+        if self._archive is None:
+            return
+
+        self._archive.close()
+        self._archive = None
+        self._temp_path.replace(self.path)
+        get_metrics().event(
+            "bundle_saved",
+            message=f"ZIP 저장 완료: {self.path.name} ({self.count}개 파일)",
+            path=str(self.path),
+            files=self.count,
+        )
+
+    def add_file(self, path: str | Path, key: str | None = None) -> bool:
+        """
+        파일 하나를 ZIP에 추가합니다.
+
+        Args:
+            path (str | Path): 파일 경로
+            key (str | None): "key" 폴더 구성에서 사용할 폴더 이름
+                - None인 경우, 파일 이름(확장자 제외)
+
+        Returns:
+            bool: 추가 여부 (파일이 없거나 이미 추가된 이름이면 False)
+        """
+        if self._archive is None:
+            raise RuntimeError("ZIP 파일이 열려 있지 않습니다. open()을 먼저 호출하세요.")
+
+        path = Path(path)
+        if self.layout == "key":
+            arcname = f"{key or path.stem}/{path.name}"
+        else:
+            arcname = path.name
+
+        if arcname in self._names or not path.is_file():
+            return False
+
+        self._archive.write(path, arcname=arcname)
+        self._names.add(arcname)
+        self.count += 1
+        return True
+
+    def add(self, result: "RowResult") -> None:
+        """
+        문서 한 건의 생성 결과 파일을 ZIP에 추가합니다. (실패한 행은 무시)
+
+        Args:
+            result (RowResult): 행별 문서 생성 결과
+        """
+        if not result.ok:
+            return
+
+        for path in result.paths:
+            self.add_file(path, key=result.filename)
+
+
+def write_bundle(
+    file_paths: Iterable[str | Path],
+    zip_path: str | Path,
+    layout: BundleLayout = "flat",
+) -> Path:
+    """
+    이미 생성된 파일들을 ZIP 파일로 묶습니다.
+
+    Args:
+        file_paths (Iterable[str | Path]): 묶을 파일 경로 목록
+        zip_path (str | Path): ZIP 파일 경로
+        layout (BundleLayout): ZIP 안의 폴더 구성
+            - "key"인 경우, 파일 이름(확장자 제외)이 같은 파일끼리 한 폴더에 저장
+
+    Returns:
+        Path: ZIP 파일 경로
+    """
+    with ZipBundle(zip_path, layout=layout) as bundle:
+        for file_path in file_paths:
+            bundle.add_file(file_path)
+
+    return bundle.path
@@ -0,0 +1,155 @@
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hwp.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from pyhwpx import Hwp
+
+# 인자 없이 HWP 객체(또는 같은 인터페이스의 대체 객체)를 생성하는 함수
+HwpFactory = Callable[[], "Hwp"]
+
+# 한글 프로그램(COM 서버)이 종료되었거나 응답하지 않을 때 HWP 객체가 발생시키는 예외
+# (pywin32가 없는 환경에서는 FakeHwp 등의 RuntimeError, OSError만 해당)
+try:
+    from pywintypes import com_error
+
+    HWP_ERRORS: tuple[type[Exception], ...] = (com_error, OSError, RuntimeError)
+except ImportError:
+    HWP_ERRORS = (OSError, RuntimeError)
+
+
+def create_hwp(visible: bool = False) -> "Hwp":
+    """
+    한글(HWP) 프로그램을 실행하고 보안모듈이 등록된 HWP 객체를 생성합니다.
+
+    Args:
+        visible (bool): HWP 창을 표시할지 여부
+
+    Returns:
+        Hwp: HWP 객체
+    """
+    from pyhwpx import Hwp
+
+    hwp = Hwp(new=True, visible=visible, register_module=False)
+    get_metrics().event(
+        "hwp_version", message=f"Hwp version: {hwp.Version}", version=str(hwp.Version)
+    )
+
+    register_security_module(hwp, "../resource/FilePathCheckerModule.dll")
+
+    return hwp
+
+
+@contextmanager
+def hwp_context(visible: bool = False, hwp_factory: HwpFactory | None = None):
+    """
+    HWP 객체를 생성하고 컨텍스트 매니저로 반환합니다.
+
+    Args:
+        visible (bool): HWP 창을 표시할지 여부
+        hwp_factory (HwpFactory | None): HWP 객체 생성 함수
+            - None인 경우, create_hwp로 한글(HWP) 프로그램을 실행
+            - 예: functools.partial(FakeHwp, fields=[...])
+
+    Returns:
+        Hwp: HWP 객체
+    """
+    with get_metrics().timer("hwp_start") as timer:
+        hwp = create_hwp(visible) if hwp_factory is None else hwp_factory()
+        timer.attrs["engine"] = type(hwp).__name__
+
+    try:
+        yield hwp
+    finally:
+        hwp.clear()
+        hwp.quit()
+
+
+def register_security_module(
+    hwp: "Hwp",
+    dll_filepath: str = "FilePathCheckerModule.dll",
+) -> bool:
+    """
+    한글 HwpAutomation에 보안모듈 DLL을 레지스트리에 등록하고, HWP 객체에 등록합니다.
+    레지스트리 등록을 위한 관리자 권한이 필요합니다.
+    레지스트리에 등록된 DLL은 HWP 객체에 보안모듈로 등록됩니다.
+
+    레지스트리 값 이름을 'FilePathCheckerModule' 이외 이름으로 레지스트리에 등록할 경우
+    pyhwpx 패키지 내부에서 `FileNotFoundError` 문제가 발생하여,
+    DLL 이름은 'FilePathCheckerModule.dll'로 고정합니다.
+        https://github.com/martiniifun/pyhwpx/issues/8
+
+    Args:
+        hwp (Hwp): pyhwpx로 생성된 Hwp 객체
+        dll_filepath (str): 등록할 보안모듈 DLL 파일 경로
+            (상대경로일 경우, 현재 작업 디렉토리 기준으로 해석됨)
+
+    Returns:
+        bool: 보안모듈 등록 결과
+    """
+
+    import winreg
+
+    metrics = get_metrics()
+    dll_path = Path(dll_filepath).resolve()
+    if not dll_path.exists():
+        raise FileNotFoundError(f"DLL 파일이 존재하지 않습니다: {dll_path}")
+
+    module_name = dll_path.stem  # 'FilePathCheckerModule'
+    reg_path = r"Software\HNC\HwpAutomation\Modules"
+
+    # 1-1. 레지스트리 문자열 값(FilePathCheckerModule) 존재 확인
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path) as key:
+            try:
+                _, _ = winreg.QueryValueEx(key, module_name)
+                # print("[✔] 레지스트리에 보안모듈 등록됨")
+            except FileNotFoundError:
+                metrics.event(
+                    "security_module",
+                    message="[✖] 레지스트리에 보안모듈이 등록되어 있지 않습니다. 새로 등록합니다.",
+                    labels={"status": "missing"},
+                )
+
+                with winreg.CreateKey(winreg.HKEY_CURRENT_USER, reg_path) as key:
+                    winreg.SetValueEx(key, module_name, 0, winreg.REG_SZ, str(dll_path))
+                    metrics.event(
+                        "security_module",
+                        message=f"[✔] 레지스트리에 보안모듈 등록 완료: {module_name} → {dll_path}",
+                        labels={"status": "registered"},
+                    )
+    except PermissionError:
+        metrics.event(
+            "security_module",
+            message="[✖] 레지스트리 접근 권한이 없습니다. 관리자 권한으로 실행하세요.",
+            labels={"status": "permission_denied"},
+        )
+        return False
+
+    # self.hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
+    # self.hwp.XHwpWindows.Active_XHwpWindow.Visible = visible
+
+    # 2. HWP 객체에 보안모듈 등록 (pyhwpx 활용)
+    result = hwp.RegisterModule("FilePathCheckDLL", module_name)
+
+    if not result:
+        guide = rf"""
+            아래 링크를 참조하여 보안모듈을 레지스트리에 수동으로 등록하세요. (관리자 권한 필요)
+                https://developer.hancom.com/hwpautomation
+
+            DLL 파일을 'C:\\Program Files (x86)\\HNC\\HwpAutomation\\Modules' 폴더(또는 원하는 위치)에 복사한 후,
+            레지스트리 편집기를 열고 아래 경로로 이동하여 DLL 경로를 문자열 값으로 등록하세요. (새로 만들기 → 문자열 값)
+                컴퓨터\HKEY_CURRENT_USER\Software\HNC\HwpAutomation\Modules
+                - 값 이름: {module_name}
+                - 값 데이터: {dll_path}
+            """
+        metrics.event(
+            "security_module",
+            message=f"[✖] HWP 객체에 보안모듈 활성화 실패: {module_name}\n{guide}",
+            labels={"status": "failed"},
+        )
+
+    return result
@@ -0,0 +1,96 @@
+import os
+import shutil
+from collections.abc import Sequence
+from pathlib import Path
+
+
+class DedupIndex:
+    """
+    입력 필드 값(매핑된 필드 값 목록)이 같은 행의 문서를 한 번만 생성하기 위한 색인입니다.
+    필드 값 해시(hwp.manifest.hash_row)별로 처음 생성한 문서의 파일을 기억해 두고,
+    같은 값의 행은 한글 프로그램으로 다시 만들지 않고 파일을 하드링크(또는 복사)합니다.
+
+    안내문처럼 파일 이름에 쓰는 열만 다르고 내용이 같은 행이 많은 작업에서 생성 시간을 줄입니다.
+    (파일 이름에 쓰는 열이 필드로 매핑되어 있으면 내용이 달라지므로 중복으로 보지 않음)
+
+    Example:
+        process_documents(..., deduplicate=True)
+    """
+
+    def __init__(self, link: bool = True):
+        """
+        Args:
+            link (bool): 하드링크 사용 여부
+                - True인 경우, 하드링크를 만들고 지원하지 않는 위치(다른 드라이브 등)면 복사
+                - False인 경우, 항상 복사
+        """
+        self.link = link
+        self.sources: dict[str, tuple[str, list[str]]] = {}  # 해시별 (원본 파일 이름, 파일 경로)
+
+    def get(self, row_hash: str) -> tuple[str, list[str]] | None:
+        """
+        같은 필드 값으로 이미 만든 문서를 찾습니다.
+
+        Args:
+            row_hash (str): 필드 값 해시
+
+        Returns:
+            tuple[str, list[str]] | None: (원본 파일 이름, 파일 경로 목록) 또는 None
+        """
+        return self.sources.get(row_hash)
+
+    def add(self, row_hash: str, filename: str, paths: Sequence[str]) -> None:
+        """
+        생성한 문서를 색인에 추가합니다. (같은 해시가 이미 있으면 처음 것을 유지)
+
+        Args:
+            row_hash (str): 필드 값 해시
+            filename (str): 저장 파일 이름 (확장자 제외)
+            paths (Sequence[str]): 저장된 파일 경로 목록
+        """
+        if paths:
+            self.sources.setdefault(row_hash, (filename, list(paths)))
+
+    def materialize(self, paths: Sequence[str], save_path: Path) -> list[Path]:
+        """
+        원본 파일들을 새 이름으로 하드링크(또는 복사)합니다.
+
+        Args:
+            paths (Sequence[str]): 원본 파일 경로 목록
+            save_path (Path): 확장자를 제외한 저장 경로 (확장자는 원본 파일과 같음)
+
+        Returns:
+            list[Path]: 만든 파일 경로 목록
+
+        Raises:
+            OSError: 원본 파일이 없는 등 링크와 복사에 모두 실패한 경우
+        """
+        targets = []
+        for source in map(Path, paths):
+            target = save_path.with_name(f"{save_path.name}{source.suffix}")
+            if target != source:
+                link_or_copy(source, target, self.link)
+            targets.append(target)
+
+        return targets
+
+
+def link_or_copy(source: str | Path, target: str | Path, link: bool = True) -> None:
+    """
+    파일을 하드링크하고, 하드링크를 만들 수 없으면 복사합니다. 대상 파일이 있으면 교체합니다.
+
+    Args:
+        source (str | Path): 원본 파일 경로
+        target (str | Path): 대상 파일 경로
+        link (bool): 하드링크를 먼저 시도할지 여부
+    """
+    target = Path(target)
+    target.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass  # 다른 드라이브, FAT32 등 하드링크를 지원하지 않는 위치
+
+    shutil.copy2(source, target)
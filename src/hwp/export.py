@@ -1,24 +1,128 @@
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tempfile import gettempdir
+from typing import TYPE_CHECKING, Literal
 from unicodedata import normalize
 
+from pandas import DataFrame
 from pathvalidate import sanitize_filename
-from pyhwpx import Hwp
 
+from hwp.context import HwpFactory
+from hwp.metrics import collect_events, get_metrics
+from hwp.rows import row_numbers
+from hwp.session import HwpSession
 
-def save_document(hwp: Hwp, folderNameOrPath: str, filename: str) -> None:
+if TYPE_CHECKING:
+    from pyhwpx import Hwp
+
+ExportFormat = Literal["hwp", "hwpx", "pdf"]
+DEFAULT_FORMATS: tuple[ExportFormat, ...] = ("hwp", "pdf")
+
+
+def save_document(
+    hwp: "Hwp",
+    folderNameOrPath: str,
+    filename: str,
+    formats: Sequence[ExportFormat] = DEFAULT_FORMATS,
+) -> list[Path]:
     """
-    HWP 문서를 저장하고 PDF로 변환합니다.
+    HWP 문서를 지정한 형식(HWP, PDF)으로 저장합니다.
 
     Args:
         hwp (Hwp): HWP 객체
         folderNameOrPath (str): 저장 폴더 이름 또는 경로
         filename (str): 저장 파일 이름
+        formats (Sequence[ExportFormat]): 저장 형식 목록
+            - 예: ("hwp",), ("pdf",), ("hwp", "pdf"), ("hwpx",)
 
     Returns:
-        None
+        list[Path]: 저장된 파일 경로 목록
+    """
+
+    with get_metrics().timer("prepare_folder"):
+        save_folder_path = resolve_output_folder(folderNameOrPath)
+        filename = clean_filename(filename)
+
+        if not save_folder_path.exists():
+            save_folder_path.mkdir(parents=True, exist_ok=True)
+
+    return export_document(hwp, save_folder_path / filename, formats)
+
+
+def export_document(
+    hwp: "Hwp",
+    save_path: Path,
+    formats: Sequence[ExportFormat] = DEFAULT_FORMATS,
+    replace: bool = False,
+) -> list[Path]:
     """
+    HWP 문서를 미리 정해 둔 경로에 지정한 형식으로 저장합니다.
+    파일 이름 정리와 폴더 확인/생성을 하지 않으므로, OutputPlanner로 계획한 경로에 사용합니다.
+
+    Args:
+        hwp (Hwp): HWP 객체
+        save_path (Path): 확장자를 제외한 저장 경로 (폴더는 이미 있어야 함)
+        formats (Sequence[ExportFormat]): 저장 형식 목록
+        replace (bool): 저장 전에 기존 파일을 삭제할지 여부
+            - False여도 하드링크된 파일(hwp.dedup)은 삭제 후 새 파일로 저장
+              (그대로 덮어쓰면 링크된 다른 문서도 함께 바뀜)
+
+    Returns:
+        list[Path]: 저장된 파일 경로 목록
+    """
+    metrics = get_metrics()
+    saved_paths = []
+
+    # 형식별 (저장 형식, 확장자, 완료 메시지 이름)
+    for format, suffix, label in (
+        ("hwp", ".hwp", "HWP"),
+        ("hwpx", ".hwpx", "HWPX"),
+        ("pdf", ".pdf", "PDF"),
+    ):
+        if format not in formats:
+            continue
+
+        path = save_path.with_name(f"{save_path.name}{suffix}")
+        if replace or _is_hard_linked(path):
+            path.unlink(missing_ok=True)
+        with metrics.timer("save_as", format=format) as timer:
+            saved = hwp.save_as(str(path), format=_SAVE_AS_FORMATS[format])
+            if saved:
+                timer.message = f"{label} 저장 완료: {path.name}"
+                timer.attrs["path"] = str(path)
+        if saved:
+            saved_paths.append(path)
+
+    return saved_paths
+
 
+def _is_hard_linked(path: Path) -> bool:
+    """
+    파일이 다른 이름과 내용을 공유하는 하드링크인지 확인합니다. (파일이 없으면 False)
+    """
+    try:
+        return path.stat().st_nlink > 1
+    except OSError:
+        return False
+
+
+# save_as에 전달하는 형식 이름
+_SAVE_AS_FORMATS: dict[ExportFormat, str] = {"hwp": "HWP", "hwpx": "HWPX", "pdf": "pdf"}
+
+
+def resolve_output_folder(folderNameOrPath: str | Path) -> Path:
+    """
+    문서를 저장할 폴더 경로를 반환합니다. (폴더는 만들지 않음)
+
+    Args:
+        folderNameOrPath (str | Path): 저장 폴더 이름 또는 경로
+            - 이미 있는 폴더 경로이면 그 폴더
+            - 폴더 이름이면 temp 폴더 아래의 폴더
+
+    Returns:
+        Path: 저장 폴더 경로 (폴더 이름은 Windows 파일 이름 규칙에 맞게 정리)
+    """
     folderpath = Path(folderNameOrPath)
     # 경로로 주어지면 경로에 저장, 폴더이름으로 주어지면 temp 폴더에 저장
     if not folderpath.is_dir():
@@ -26,22 +130,210 @@ def save_document(hwp: Hwp, folderNameOrPath: str, filename: str) -> None:
 
     foldername = folderpath.name if folderpath.is_dir() else folderpath.stem
 
-    foldername = sanitize_filename(foldername, platform="Windows", replacement_text="_")
-    filename = sanitize_filename(filename, platform="Windows", replacement_text="_")
+    foldername = clean_filename(foldername)
+
+    # save_folder_path = (Path("temp") / folder).resolve().absolute()
+    return folderpath.parent / foldername
 
+
+def clean_filename(name: str) -> str:
+    """
+    파일(폴더) 이름을 Windows 파일 이름 규칙에 맞게 정리합니다.
+
+    Args:
+        name (str): 파일 이름
+
+    Returns:
+        str: 사용할 수 없는 문자를 "_"로 바꾸고 NFC로 정규화한 이름
+    """
+    name = sanitize_filename(name, platform="Windows", replacement_text="_")
     # 파일경로 한글 자소분리 문제 해결 (NFD -> NFC)
-    foldername = normalize("NFC", foldername)
-    filename = normalize("NFC", filename)
+    return normalize("NFC", name)
 
-    # save_folder_path = (Path("temp") / folder).resolve().absolute()
-    save_folder_path = folderpath.parent / foldername
-    if not save_folder_path.exists():
-        save_folder_path.mkdir(parents=True, exist_ok=True)
 
-    save_path = save_folder_path / f"{filename}.hwp"
+# 미리 정한 저장 파일 이름 열 (이 열이 있으면 OutputPlanner는 열의 이름을 그대로 사용)
+FILENAME_COLUMN = "__filename__"
+
+
+class OutputPlanner:
+    """
+    문서 생성 전에 출력 폴더와 행별 저장 파일 이름을 한 번에 정합니다.
+
+    - 파일 이름은 데이터프레임(조각) 단위로 만들고, 같은 이름은 한 번만 정리(clean_filename)
+    - 출력 폴더는 처음 계획할 때 한 번만 생성하므로, 행마다 폴더를 확인하지 않음
+    - 이름이 겹치면(대소문자 무시) 뒤에 나온 행부터 "_2", "_3"을 붙여 덮어쓰지 않음
+      (행 순서가 같으면 항상 같은 이름)
+
+    여러 조각을 차례로 계획하면 앞 조각에서 정한 이름과도 겹치지 않게 정합니다.
+    데이터프레임에 FILENAME_COLUMN 열이 있으면 다른 계획기가 전체 행 순서로 미리 정한 이름으로 보고 그대로 사용합니다.
+    (CLI --shard, --rows로 행 일부만 생성하는 경우)
+
+    Example:
+        planner = OutputPlanner("output", "채용계약서", key_columns=["성명"])
+        filenames = planner.plan(dataframe)  # ["채용계약서_홍길동", "채용계약서_홍길동_2", ...]
+        export_document(hwp, planner.folder / filenames[0], formats)
+    """
+
+    def __init__(
+        self,
+        output_folder: str | Path,
+        workflow_name: str,
+        filename_suffixes: Sequence[str] | None = None,
+        key_columns: Sequence[str] | None = None,
+    ):
+        """
+        Args:
+            output_folder (str | Path): 출력 폴더 이름 또는 경로 (resolve_output_folder와 같은 규칙)
+            workflow_name (str): 워크플로우 이름 (파일 이름 앞부분)
+            filename_suffixes (Sequence[str] | None): 행 번호 순서의 파일 이름 접미사
+            key_columns (Sequence[str] | None): 파일 이름에 사용할 열 이름들
+                - filename_suffixes와 key_columns가 모두 None이면 행 번호를 사용
+        """
+        self.folder = resolve_output_folder(output_folder)
+        self.workflow_name = workflow_name
+        self.filename_suffixes = filename_suffixes
+        self.key_columns = key_columns
+        self._taken: set[str] = set()  # 이미 정한 이름 (대소문자 무시)
+        self._counters: dict[str, int] = {}  # 겹친 이름별 다음 번호
+        self._prepared = False
+
+    def plan(self, dataframe: DataFrame) -> list[str]:
+        """
+        데이터프레임 행마다 저장 파일 이름(확장자 제외)을 정합니다.
+
+        Args:
+            dataframe (DataFrame): 데이터프레임 객체 (전체 또는 조각)
+
+        Returns:
+            list[str]: 행 순서의 저장 파일 이름 목록 (정리되고 서로 겹치지 않는 이름)
+        """
+        with get_metrics().timer("plan_outputs") as timer:
+            if not self._prepared:
+                self.folder.mkdir(parents=True, exist_ok=True)
+                self._prepared = True
+
+            names = self._base_names(dataframe)
+            cleaned = {name: clean_filename(name) for name in dict.fromkeys(names)}
+            filenames = [self._claim(cleaned[name]) for name in names]
+            timer.attrs["rows"] = len(filenames)
+
+        return filenames
+
+    def _base_names(self, dataframe: DataFrame) -> list[str]:
+        """
+        정리 전의 파일 이름 목록을 만듭니다. ("<워크플로우 이름>_<접미사>")
+        """
+        if FILENAME_COLUMN in dataframe.columns:
+            return dataframe[FILENAME_COLUMN].map(str).tolist()
+        if self.filename_suffixes is not None:
+            parts = [str(self.filename_suffixes[number - 1]) for number in row_numbers(dataframe)]
+        elif self.key_columns is not None:
+            columns = [dataframe[col].map(str) for col in self.key_columns]
+            if columns:
+                parts = columns[0].str.cat(columns[1:], sep="_").tolist()
+            else:
+                parts = [""] * len(dataframe)
+        else:
+            parts = [str(number) for number in row_numbers(dataframe)]
+
+        return [f"{self.workflow_name}_{part}" for part in parts]
+
+    def _claim(self, name: str) -> str:
+        """
+        이름을 사용 중으로 표시합니다. 이미 사용 중이면 "_2", "_3" 등을 붙인 이름을 반환합니다.
+        """
+        key = name.casefold()
+        if key in self._taken:
+            number = self._counters.get(key, 2)
+            while f"{key}_{number}" in self._taken:
+                number += 1
+            self._counters[key] = number + 1
+            name, key = f"{name}_{number}", f"{key}_{number}"
+
+        self._taken.add(key)
+        return name
+
+
+def convert_to_pdf(
+    hwp_paths: Sequence[str | Path],
+    hwp_factory: HwpFactory | None = None,
+    workers: int = 1,
+    remove_source: bool = False,
+    session: HwpSession | None = None,
+) -> list[Path]:
+    """
+    저장이 끝난 HWP 파일들을 모아서 PDF로 변환합니다.
+    문서 생성(채워넣기) 단계와 분리된 후처리 단계로, 필요할 때만 실행합니다.
+
+    Args:
+        hwp_paths (Sequence[str | Path]): 변환할 HWP 파일 경로 목록
+        hwp_factory (HwpFactory | None): HWP 객체 생성 함수
+            - None인 경우, 한글(HWP) 프로그램을 실행
+            - workers가 1보다 크면 pickle 가능해야 함
+        workers (int): 작업 프로세스 수
+            - 1보다 크면 프로세스마다 HWP 객체를 하나씩 띄워 파일을 나누어 변환
+        remove_source (bool): 변환 후 원본 HWP 파일 삭제 여부
+            - PDF 저장에 성공한 파일만 삭제 (실패한 파일은 남겨 둠)
+        session (HwpSession | None): 변환에 사용할 HWP 세션 (workers가 1일 때만 사용)
+            - None인 경우, 변환용 HWP 객체를 새로 실행하고 끝나면 종료
+
+    Returns:
+        list[Path]: 변환된 PDF 파일 경로 목록
+    """
+    paths = [Path(path) for path in hwp_paths]
+    if not paths:
+        return []
+
+    if workers <= 1:
+        converted = _convert_chunk(paths, hwp_factory, session)
+    else:
+        metrics = get_metrics()
+        chunks = [paths[i::workers] for i in range(workers) if paths[i::workers]]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            converted = []
+            for pairs, events in executor.map(
+                collect_events, [_convert_chunk] * len(chunks), chunks, [hwp_factory] * len(chunks)
+            ):
+                metrics.replay(events)
+                converted += pairs
+
+    if remove_source:
+        for source, _ in converted:
+            source.unlink(missing_ok=True)
+
+    return [pdf_path for _, pdf_path in converted]
+
+
+def _convert_chunk(
+    paths: list[Path], hwp_factory: HwpFactory | None, session: HwpSession | None = None
+) -> list[tuple[Path, Path]]:
+    """
+    HWP 세션 하나로 HWP 파일 여러 개를 차례로 열어 PDF로 저장합니다.
+    세션을 받지 않으면 새로 만들고, 변환이 끝나면 종료합니다.
+    PDF 저장에 성공한 (HWP 파일, PDF 파일) 경로 쌍 목록을 반환합니다.
+    """
+    metrics = get_metrics()
+    owned = session is None
+    if session is None:
+        session = HwpSession(hwp_factory)
 
-    if hwp.save_as(str(save_path)):
-        print(f"HWP 저장 완료: {save_path.name}")
+    converted = []
+    try:
+        for path in paths:
+            pdf_path = path.with_suffix(".pdf")
+            with session.lease() as hwp:
+                with metrics.timer("open_document"):
+                    hwp.open(str(path))
+                with metrics.timer("save_as", format="pdf") as timer:
+                    saved = hwp.save_as(str(pdf_path), format="pdf")
+                    if saved:
+                        timer.message = f"PDF 저장 완료: {pdf_path.name}"
+                        timer.attrs["path"] = str(pdf_path)
+                session.count_documents()
+            if saved:
+                converted.append((path, pdf_path))
+    finally:
+        if owned:
+            session.close()
 
-    if hwp.save_as(str(save_path.with_suffix(".pdf")), format="pdf"):
-        print(f"PDF 저장 완료: {save_path.with_suffix('.pdf').name}")
+    return converted
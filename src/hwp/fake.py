@@ -0,0 +1,122 @@
+import time
+from pathlib import Path
+from typing import Any
+
+from hwp.template import (
+    FIELD_SEPARATOR,
+    index_field_instances,
+    number_field_names,
+    resolve_field_instances,
+)
+
+
+class FakeHwp:
+    """
+    pyhwpx.Hwp를 흉내내는 기록용 가짜 HWP 객체입니다.
+    한글(HWP) 프로그램 없이(Linux 등) 문서 생성 흐름을 실행하고,
+    호출 내역(`calls`)으로 행마다의 COM 호출 횟수를 확인하는 데 사용합니다.
+
+    save_as는 필드 값을 텍스트로 기록한 파일만 생성합니다.
+    latency를 지정하면 메서드마다 지연 시간을 넣어 실제 한글 프로그램의 속도를 흉내냅니다. (벤치마크용)
+    """
+
+    def __init__(
+        self,
+        fields: list[str] | None = None,
+        visible: bool = False,
+        latency: dict[str, float] | None = None,
+    ):
+        """
+        Args:
+            fields (list[str] | None): 문서 순서대로의 필드 이름 목록 (인스턴스 접미사 제외)
+                - 같은 이름이 여러 번 나오면 "{{0}}", "{{1}}" 순으로 번호가 매겨짐
+                - None인 경우, 템플릿을 열 때 빈 필드 목록으로 시작
+            visible (bool): Hwp와의 호환을 위한 인자 (사용하지 않음)
+            latency (dict[str, float] | None): 메서드 이름별 호출 지연 시간(초)
+                - 예: {"open": 0.05, "put_field_text": 0.002, "save_as": 0.02}
+        """
+        self.alive = True
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+        self._fields = list(fields or [])
+        self._index = index_field_instances(self._fields)
+        self._values: list[str] = [""] * len(self._fields)
+        self.path: str | None = None
+        self.latency = dict(latency or {})
+
+    @property
+    def Version(self) -> list[int]:
+        if not self.alive:
+            # 종료된 COM 서버처럼 속성 조회에서 예외 발생 (HwpSession 응답 확인용)
+            raise RuntimeError("HWP 프로그램이 종료되었습니다.")
+        return [0, 0, 0, 0]
+
+    def crash(self) -> None:
+        """
+        한글 프로그램이 비정상 종료된 상태를 흉내냅니다.
+        """
+        self.alive = False
+
+    def _record(self, method: str, *args: Any) -> None:
+        self.calls.append((method, args))
+        delay = self.latency.get(method)
+        if delay:
+            time.sleep(delay)
+
+    def count(self, method: str) -> int:
+        """
+        지정한 메서드의 호출 횟수를 반환합니다.
+
+        Args:
+            method (str): 메서드 이름 (예: "put_field_text")
+
+        Returns:
+            int: 호출 횟수
+        """
+        return sum(1 for name, _ in self.calls if name == method)
+
+    def RegisterModule(self, module_type: str, module_data: str) -> bool:
+        self._record("RegisterModule", module_type, module_data)
+        return True
+
+    def open(self, filename: str, format: str = "", arg: str = "") -> bool:
+        self._record("open", filename)
+        self.path = filename
+        self._values = [""] * len(self._fields)
+        return True
+
+    def get_field_list(self, number: int = 1, option: int = 0) -> str:
+        self._record("get_field_list", number, option)
+        names = number_field_names(self._fields) if number else self._fields
+        return FIELD_SEPARATOR.join(names)
+
+    def put_field_text(self, field: str = "", text: Any = "") -> None:
+        self._record("put_field_text", field, text)
+        fields = str(field).split(FIELD_SEPARATOR)
+        texts = str(text).split(FIELD_SEPARATOR)
+        for name, value in zip(fields, texts):
+            for position in resolve_field_instances(self._index, name):
+                self._values[position] = value
+
+    def get_field_text(self, field: str = "") -> str:
+        self._record("get_field_text", field)
+        texts = []
+        for name in str(field).split(FIELD_SEPARATOR):
+            positions = resolve_field_instances(self._index, name)
+            texts.append(self._values[positions[0]] if positions else "")
+        return FIELD_SEPARATOR.join(texts)
+
+    def save_as(self, path: str, format: str = "HWP", arg: str = "") -> bool:
+        self._record("save_as", path, format)
+        lines = [f"{name}\t{value}" for name, value in zip(self._fields, self._values)]
+        Path(path).write_text("\n".join(lines), encoding="utf-8")
+        return True
+
+    def clear(self, option: int = 1) -> None:
+        self._record("clear", option)
+        if not self.alive:
+            # 종료된 COM 서버처럼 예외 발생 (HwpSession 종료 처리 확인용)
+            raise RuntimeError("HWP 프로그램이 종료되었습니다.")
+
+    def quit(self, save: bool = False) -> None:
+        self._record("quit", save)
+        self.alive = False
@@ -1,21 +1,273 @@
-# 필드 매핑을 정의하는 파일입니다.
-# 예시로 필드 매핑을 작성합니다. 필요에 따라 수정하세요.
-
-# FIELD_MAPPING = {
-#     "책임교수명(본문){{0}}": "책임교수명(본문)",
-#     "계약당사자명(본문){{0}}": "성명(본문)",
-#     "프로젝트명{{0}}": "프로젝트명",
-#     "총 사업기간{{0}}": "총 사업기간",
-#     "당해연도 사업기간{{0}}": "당해연도 사업기간",
-#     "계약시작일{{0}}": "계약시작일",
-#     "계약종료일{{0}}": "계약종료일",
-#     "총 계약금액{{0}}": "총 계약금액",
-#     "월 계약금액{{0}}": "월 계약금액",
-#     "급여일{{0}}": "급여일",
-#     "계약일{{0}}": "계약일",
-#     "산학협력단장명(서명란){{0}}": "산학협력단장명",
-#     "책임교수명(서명란){{0}}": "책임교수명",
-#     "주소{{0}}": "주소",
-#     "계약당사자명(서명란){{0}}": "성명",
-#     "휴대폰번호{{0}}": "휴대폰번호",
-# }
+import datetime
+import hashlib
+import os
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Any
+from unicodedata import normalize
+
+from pydantic import BaseModel, ValidationError
+
+from hwp.template import FIELD_INSTANCE_PATTERN, FIELD_SEPARATOR
+
+# 확정된 필드 매핑을 저장하는 폴더
+MAPPING_STORE_DIR = Path(gettempdir()) / "autohwp" / ".mappings"
+
+
+def hash_names(names: Iterable[str]) -> str:
+    """
+    이름 집합(순서, 중복 무시)의 SHA-256 해시를 반환합니다.
+
+    Args:
+        names (Iterable[str]): 필드 이름 또는 열 이름 목록
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    data = FIELD_SEPARATOR.join(sorted({str(name) for name in names}))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def normalize_name(name: str) -> str:
+    """
+    비교용 이름을 만듭니다. (인스턴스 번호 접미사, 공백 제거, NFC 정규화, 대소문자 무시)
+
+    Args:
+        name (str): 필드 이름 또는 열 이름 (예: "계약 시작일{{0}}")
+
+    Returns:
+        str: 비교용 이름 (예: "계약시작일")
+    """
+    match = FIELD_INSTANCE_PATTERN.match(str(name))
+    name = match["name"] if match else str(name)
+    return "".join(normalize("NFC", name).casefold().split())
+
+
+def _ngrams(name: str, n: int) -> Counter[str]:
+    # 한 글자 이름도 n-gram이 생기도록 앞뒤에 경계 문자를 붙임
+    padded = f"\x00{name}\x00"
+    return Counter(padded[i : i + n] for i in range(max(len(padded) - n + 1, 1)))
+
+
+class ColumnIndex:
+    """
+    엑셀 열 이름의 n-gram 색인입니다. 업로드한 엑셀마다 한 번 만들고, 필드마다 가장 비슷한 열을 찾습니다.
+
+    필드와 열을 모두 비교(difflib.get_close_matches)하지 않고,
+    필드의 n-gram을 공유하는 열만 후보로 모아 Dice 계수(2 × 공통 n-gram 수 / 전체 n-gram 수)로 비교합니다.
+
+    Example:
+        index = ColumnIndex(dataframe.columns)
+        index.match("계약시작일{{0}}")  # "계약 시작일"
+    """
+
+    def __init__(self, columns: Iterable[str], n: int = 2):
+        """
+        Args:
+            columns (Iterable[str]): 열 이름 목록
+            n (int): n-gram 길이 (기본 2글자)
+        """
+        self.columns = [str(column) for column in columns]
+        self.n = n
+        self._exact: dict[str, int] = {}
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[tuple[int, int]]] = {}  # n-gram별 (열 위치, 개수)
+
+        for position, column in enumerate(self.columns):
+            name = normalize_name(column)
+            self._exact.setdefault(name, position)
+            grams = _ngrams(name, n)
+            self._sizes.append(sum(grams.values()))
+            for gram, count in grams.items():
+                self._postings.setdefault(gram, []).append((position, count))
+
+    def scores(self, field: str) -> dict[str, float]:
+        """
+        필드와 n-gram을 공유하는 열의 유사도를 반환합니다.
+
+        Args:
+            field (str): 필드 이름
+
+        Returns:
+            dict[str, float]: 열 이름별 유사도 (0~1, 같은 이름은 1)
+        """
+        name = normalize_name(field)
+        grams = _ngrams(name, self.n)
+        size = sum(grams.values())
+
+        common: dict[int, int] = {}
+        for gram, count in grams.items():
+            for position, column_count in self._postings.get(gram, ()):
+                common[position] = common.get(position, 0) + min(count, column_count)
+
+        scores = {
+            self.columns[position]: 2 * common[position] / (size + self._sizes[position])
+            for position in sorted(common)
+        }
+        if name in self._exact:
+            scores[self.columns[self._exact[name]]] = 1.0
+        return scores
+
+    def match(self, field: str, cutoff: float = 0.4) -> str | None:
+        """
+        필드와 가장 비슷한 열 이름을 반환합니다.
+
+        Args:
+            field (str): 필드 이름
+            cutoff (float): 최소 유사도 (0~1)
+
+        Returns:
+            str | None: 가장 비슷한 열 이름 (유사도가 cutoff 미만이면 None)
+        """
+        best, best_score = None, cutoff
+        for column, score in self.scores(field).items():
+            # 유사도가 같으면 먼저 나온(앞쪽) 열을 유지
+            if score > best_score or (best is None and score >= cutoff):
+                best, best_score = column, score
+        return best
+
+    def match_all(self, fields: Iterable[str], cutoff: float = 0.4) -> dict[str, str | None]:
+        """
+        필드마다 가장 비슷한 열 이름을 찾습니다.
+
+        Args:
+            fields (Iterable[str]): 필드 이름 목록
+            cutoff (float): 최소 유사도 (0~1)
+
+        Returns:
+            dict[str, str | None]: 필드별 열 이름 (없으면 None)
+        """
+        return {field: self.match(field, cutoff) for field in fields}
+
+
+class StoredMapping(BaseModel):
+    """
+    저장된 필드 매핑 하나입니다.
+    """
+
+    fields_hash: str  # 템플릿 필드 이름 집합 해시
+    columns_hash: str  # 엑셀 열 이름 집합 해시
+    columns: list[str]  # 저장할 때의 열 이름 목록
+    mapping: dict[str, Any]  # 필드별 매핑 (열 이름 또는 UI 설정)
+    saved: str  # 저장 시각 (ISO 8601)
+
+
+class MappingStore:
+    """
+    확정된 필드 매핑을 템플릿 필드 집합과 엑셀 열 집합의 해시별로 저장하고 다시 불러옵니다.
+    같은 양식과 같은 모양의 엑셀을 다시 올리면 자동 매칭 없이 저장된 매핑을 바로 사용합니다.
+
+    저장 위치: <folder>/<필드 집합 해시>/<열 집합 해시>.json
+
+    Example:
+        store = MappingStore()
+        mapping = store.load(field_names, dataframe.columns)
+        if mapping is None:
+            mapping = ColumnIndex(dataframe.columns).match_all(field_names)
+        ...
+        store.save(field_names, dataframe.columns, confirmed_mapping)
+    """
+
+    def __init__(self, folder: str | Path = MAPPING_STORE_DIR):
+        """
+        Args:
+            folder (str | Path): 매핑 JSON을 저장하는 폴더
+        """
+        self.folder = Path(folder)
+
+    def path(self, fields: Iterable[str], columns: Iterable[str]) -> Path:
+        """
+        필드 집합과 열 집합의 매핑 파일 경로를 반환합니다.
+        """
+        return self.folder / hash_names(fields)[:32] / f"{hash_names(columns)[:32]}.json"
+
+    def save(self, fields: Sequence[str], columns: Sequence[str], mapping: dict[str, Any]) -> Path:
+        """
+        확정된 매핑을 저장합니다. (같은 필드 집합과 열 집합의 이전 매핑은 교체)
+
+        Args:
+            fields (Sequence[str]): 템플릿 필드 이름 목록
+            columns (Sequence[str]): 엑셀 열 이름 목록
+            mapping (dict[str, Any]): 필드별 매핑 (JSON으로 저장할 수 있어야 함)
+
+        Returns:
+            Path: 저장 경로
+        """
+        columns = [str(column) for column in columns]
+        stored = StoredMapping(
+            fields_hash=hash_names(fields),
+            columns_hash=hash_names(columns),
+            columns=columns,
+            mapping=mapping,
+            saved=datetime.datetime.now().isoformat(timespec="seconds"),
+        )
+
+        path = self.path(fields, columns)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 여러 세션이 동시에 저장해도 깨진 파일이 남지 않도록 교체 방식으로 저장
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(stored.model_dump_json(), encoding="utf-8")
+        temp_path.replace(path)
+        return path
+
+    def load(
+        self,
+        fields: Sequence[str],
+        columns: Sequence[str],
+        fallback: bool = True,
+        options: Iterable[str] = (),
+    ) -> dict[str, Any] | None:
+        """
+        저장된 매핑을 불러옵니다.
+
+        Args:
+            fields (Sequence[str]): 템플릿 필드 이름 목록
+            columns (Sequence[str]): 엑셀 열 이름 목록
+            fallback (bool): 같은 열 집합의 매핑이 없을 때 같은 필드 집합의 최근 매핑을 사용할지 여부
+                - 이 경우, 지금 엑셀에 없는 열을 가리키는 필드는 제외
+            options (Iterable[str]): 열 이름 외에 매핑 값으로 쓸 수 있는 선택지 (예: "사용자 지정")
+
+        Returns:
+            dict[str, Any] | None: 필드별 매핑 (없으면 None)
+        """
+        stored = self._read(self.path(fields, columns))
+        if stored is not None:
+            return stored.mapping
+        if not fallback:
+            return None
+
+        folder = self.folder / hash_names(fields)[:32]
+        candidates = sorted(folder.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        available = {str(column) for column in columns} | set(options)
+        for candidate in candidates:
+            stored = self._read(candidate)
+            if stored is None:
+                continue
+            mapping = {
+                field: value
+                for field, value in stored.mapping.items()
+                if set(_mapped_columns(value)) <= available
+            }
+            return mapping or None
+
+        return None
+
+    @staticmethod
+    def _read(path: Path) -> StoredMapping | None:
+        try:
+            return StoredMapping.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError):
+            return None  # 없거나 손상된 파일
+
+
+def _mapped_columns(value: Any) -> list[str]:
+    """
+    매핑 값이 가리키는 열 이름 목록 (열 이름 문자열 또는 {"columns": [...]} 형식의 UI 설정)
+    """
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [str(column) for column in value.get("columns", [])]
+    return []
@@ -0,0 +1,314 @@
+import re
+import zipfile
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+from hwp.metrics import get_metrics
+from hwp.template import (
+    FIELD_SEPARATOR,
+    index_field_instances,
+    number_field_names,
+    resolve_field_instances,
+)
+
+# OWPML(HWPX) 문단 네임스페이스
+HP_NAMESPACE = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+SECTION_PATTERN = re.compile(r"^Contents/section(\d+)\.xml$")
+
+_P = f"{{{HP_NAMESPACE}}}p"
+_RUN = f"{{{HP_NAMESPACE}}}run"
+_CTRL = f"{{{HP_NAMESPACE}}}ctrl"
+_T = f"{{{HP_NAMESPACE}}}t"
+_FIELD_BEGIN = f"{{{HP_NAMESPACE}}}fieldBegin"
+_FIELD_END = f"{{{HP_NAMESPACE}}}fieldEnd"
+
+# 필드 값 자리표시자 (문서 본문에 쓰이지 않는 사용자 정의 영역 문자)
+_SLOT_MARKER = "\ue000{}\ue001"
+_SLOT_PATTERN = re.compile("\ue000(\\d+)\ue001".encode())
+
+
+class HwpxTemplate:
+    """
+    파싱이 끝난 HWPX 템플릿입니다.
+    섹션 XML은 고정된 바이트 조각과 필드 값 자리(slot) 번호의 목록으로 미리 나누어 두어,
+    문서를 저장할 때 XML을 다시 파싱하지 않고 값만 이어붙입니다.
+    """
+
+    def __init__(
+        self,
+        entries: list[tuple[zipfile.ZipInfo, bytes | None]],
+        sections: dict[str, list[bytes | int]],
+        fields: list[str],
+        defaults: list[str],
+        hp_prefix: str,
+    ):
+        """
+        Args:
+            entries (list[tuple[zipfile.ZipInfo, bytes | None]]): 패키지 파일 목록 (원본 순서)
+                - 섹션 파일은 내용 대신 None
+            sections (dict[str, list[bytes | int]]): 섹션 파일 이름별 바이트 조각/자리 번호 목록
+            fields (list[str]): 자리 번호 순서(문서 순서)의 필드 이름 목록
+            defaults (list[str]): 자리 번호 순서의 템플릿 기본 필드 값
+            hp_prefix (str): 문단 네임스페이스 접두사 (예: "hp")
+        """
+        self.entries = entries
+        self.sections = sections
+        self.fields = fields
+        self.defaults = defaults
+        self.hp_prefix = hp_prefix
+        self.index = index_field_instances(fields)
+
+    def encode(self, value: str) -> bytes:
+        """
+        필드 값을 <hp:t> 요소 안에 들어갈 XML 조각으로 변환합니다.
+
+        Args:
+            value (str): 필드 값
+
+        Returns:
+            bytes: XML 조각 (줄바꿈과 탭은 각각 lineBreak, tab 요소로 변환)
+        """
+        text = escape(value).replace("\r\n", "\n")
+        text = text.replace("\n", f"<{self.hp_prefix}:lineBreak/>")
+        text = text.replace("\t", f"<{self.hp_prefix}:tab/>")
+        return text.encode("utf-8")
+
+    def render(self, values: list[bytes]) -> bytes:
+        """
+        인코딩된 필드 값으로 HWPX 패키지(zip)를 만듭니다.
+
+        Args:
+            values (list[bytes]): 자리 번호 순서의 인코딩된 필드 값
+
+        Returns:
+            bytes: HWPX 파일 내용
+        """
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as package:
+            for info, data in self.entries:
+                if data is None:
+                    segments = self.sections[info.filename]
+                    data = b"".join(
+                        segment if isinstance(segment, bytes) else values[segment]
+                        for segment in segments
+                    )
+                package.writestr(info, data)
+
+        return buffer.getvalue()
+
+
+def load_template(path: str | Path) -> HwpxTemplate:
+    """
+    HWPX 템플릿을 파싱합니다.
+    같은 파일(경로, 수정 시각, 크기)은 한 번만 파싱하고 이후에는 파싱 결과를 재사용합니다.
+
+    Args:
+        path (str | Path): HWPX 템플릿 파일 경로
+
+    Returns:
+        HwpxTemplate: 파싱된 템플릿
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _load_template(str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_template(path: str, mtime_ns: int, size: int) -> HwpxTemplate:
+    entries: list[tuple[zipfile.ZipInfo, bytes | None]] = []
+    sections: dict[str, list[bytes | int]] = {}
+    fields: list[str] = []
+    defaults: list[str] = []
+    hp_prefix = "hp"
+
+    with zipfile.ZipFile(path) as package:
+        section_infos = sorted(
+            (info for info in package.infolist() if SECTION_PATTERN.match(info.filename)),
+            key=lambda info: int(SECTION_PATTERN.match(info.filename)[1]),
+        )
+        section_names = {info.filename for info in section_infos}
+
+        for info in package.infolist():
+            data = package.read(info)
+            entries.append((info, None if info.filename in section_names else data))
+
+        for info in section_infos:
+            data = package.read(info)
+            hp_prefix = _register_namespaces(data).get(HP_NAMESPACE, hp_prefix)
+            sections[info.filename] = _compile_section(data, fields, defaults)
+
+    return HwpxTemplate(entries, sections, fields, defaults, hp_prefix)
+
+
+def _register_namespaces(data: bytes) -> dict[str, str]:
+    """
+    섹션 XML의 네임스페이스 접두사를 ElementTree에 등록합니다.
+    (직렬화할 때 원본 접두사(hp, hs 등)를 유지하기 위함)
+
+    Returns:
+        dict[str, str]: 네임스페이스 URI별 접두사
+    """
+    prefixes = {}
+    for _, (prefix, uri) in ET.iterparse(BytesIO(data), events=("start-ns",)):
+        if prefix:
+            ET.register_namespace(prefix, uri)
+            prefixes[uri] = prefix
+
+    return prefixes
+
+
+def _compile_section(data: bytes, fields: list[str], defaults: list[str]) -> list[bytes | int]:
+    """
+    섹션 XML에서 누름틀(CLICK_HERE) 필드를 찾아 값 자리를 자리표시자로 바꾸고,
+    직렬화한 XML을 바이트 조각과 자리 번호 목록으로 나눕니다.
+    찾은 필드 이름과 기본 값은 fields, defaults에 문서 순서대로 추가됩니다.
+    """
+    root = ET.fromstring(data)
+
+    for paragraph in root.iter(_P):
+        field = None  # (필드 id, 필드 이름, 시작 ctrl이 있는 run, 시작 ctrl, [(run, t)])
+        for run in paragraph.findall(_RUN):
+            for child in list(run):
+                if child.tag == _T and field is not None:
+                    field[4].append((run, child))
+                    continue
+                if child.tag != _CTRL:
+                    continue
+
+                begin = child.find(_FIELD_BEGIN)
+                if begin is not None and begin.get("type") == "CLICK_HERE" and begin.get("name"):
+                    field = (begin.get("id"), begin.get("name"), run, child, [])
+                    continue
+
+                end = child.find(_FIELD_END)
+                if end is not None and field is not None and end.get("beginIDRef") == field[0]:
+                    _, name, begin_run, begin_ctrl, texts = field
+                    fields.append(name)
+                    defaults.append("".join("".join(t.itertext()) for _, t in texts))
+                    _place_slot(begin_run, begin_ctrl, texts, len(fields) - 1)
+                    field = None
+
+    # 원본의 XML 선언(standalone 등)을 유지
+    declaration = data[: data.index(b"?>") + 2] if data.startswith(b"<?xml") else b""
+    serialized = declaration + ET.tostring(root, encoding="unicode").encode("utf-8")
+
+    parts = _SLOT_PATTERN.split(serialized)
+    # split 결과는 [조각, 자리 번호, 조각, 자리 번호, ..., 조각] 순서
+    return [int(part) if i % 2 else part for i, part in enumerate(parts) if i % 2 or part]
+
+
+def _place_slot(
+    begin_run: ET.Element,
+    begin_ctrl: ET.Element,
+    texts: list[tuple[ET.Element, ET.Element]],
+    slot: int,
+) -> None:
+    """
+    필드 값 <hp:t> 요소를 하나만 남기고 자리표시자를 넣습니다.
+    값 요소가 없는 빈 필드는 시작 ctrl 바로 뒤에 <hp:t> 요소를 만듭니다.
+    """
+    marker = _SLOT_MARKER.format(slot)
+    if not texts:
+        text = ET.Element(_T)
+        begin_run.insert(list(begin_run).index(begin_ctrl) + 1, text)
+    else:
+        _, text = texts[0]
+        for run, extra in texts[1:]:
+            run.remove(extra)
+
+    tail = text.tail
+    text.clear()
+    text.text = marker
+    text.tail = tail
+
+
+class HwpxDocument:
+    """
+    한글(HWP) 프로그램 없이 HWPX 파일의 누름틀 필드를 채우는 Hwp 호환 객체입니다.
+    open_template / write_fields / save_document에서 pyhwpx.Hwp 대신 사용할 수 있으며,
+    HWPX 파일만 열고 저장할 수 있습니다. (PDF 변환 불가)
+
+    Example:
+        process_documents(..., hwp_factory=HwpxDocument, formats=("hwpx",))
+    """
+
+    def __init__(self, visible: bool = False):
+        """
+        Args:
+            visible (bool): Hwp와의 호환을 위한 인자 (사용하지 않음)
+        """
+        self.Version = ["HWPX", 0, 0, 0]
+        self._template: HwpxTemplate | None = None
+        self._values: list[str] = []
+        self._encoded: list[bytes] = []
+
+    @property
+    def template(self) -> HwpxTemplate:
+        if self._template is None:
+            raise RuntimeError("열린 HWPX 문서가 없습니다. open()을 먼저 호출하세요.")
+        return self._template
+
+    def RegisterModule(self, module_type: str, module_data: str) -> bool:
+        return True
+
+    def open(self, filename: str, format: str = "", arg: str = "") -> bool:
+        self._template = load_template(filename)
+        self._values = list(self._template.defaults)
+        self._encoded = [self._template.encode(value) for value in self._values]
+        return True
+
+    def get_field_list(self, number: int = 1, option: int = 0) -> str:
+        fields = self.template.fields
+        return FIELD_SEPARATOR.join(number_field_names(fields) if number else fields)
+
+    def put_field_text(self, field: Any = "", text: Any = "") -> None:
+        template = self.template
+        for name, value in zip(str(field).split(FIELD_SEPARATOR), str(text).split(FIELD_SEPARATOR)):
+            encoded = template.encode(value)
+            for position in resolve_field_instances(template.index, name):
+                self._values[position] = value
+                self._encoded[position] = encoded
+
+    def put_slot_text(self, offsets: list[int], texts: list[str]) -> None:
+        """
+        필드 이름 대신 템플릿 계획의 필드 위치(값 자리 번호)로 값을 입력합니다.
+
+        Args:
+            offsets (list[int]): 필드 위치 목록 (TemplatePlan의 FieldSlot.offset)
+            texts (list[str]): 위치별 입력 값
+        """
+        template = self.template
+        for offset, value in zip(offsets, texts):
+            self._values[offset] = value
+            self._encoded[offset] = template.encode(value)
+
+    def get_field_text(self, field: Any = "") -> str:
+        texts = []
+        for name in str(field).split(FIELD_SEPARATOR):
+            positions = resolve_field_instances(self.template.index, name)
+            texts.append(self._values[positions[0]] if positions else "")
+        return FIELD_SEPARATOR.join(texts)
+
+    def save_as(self, path: str, format: str = "HWP", arg: str = "") -> bool:
+        if format.upper() != "HWPX":
+            get_metrics().event(
+                "unsupported_format",
+                message=f"[✖] HWPX 엔진은 {format} 형식 저장을 지원하지 않습니다: {Path(path).name}",
+                labels={"format": format.lower()},
+            )
+            return False
+
+        Path(path).write_bytes(self.template.render(self._encoded))
+        return True
+
+    def clear(self, option: int = 1) -> None:
+        self._template = None
+        self._values = []
+        self._encoded = []
+
+    def quit(self, save: bool = False) -> None:
+        self.clear()
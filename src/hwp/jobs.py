@@ -0,0 +1,295 @@
+import queue
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from pydantic import BaseModel
+
+from hwp.context import HwpFactory
+from hwp.service import RowResult, process_documents
+from hwp.session import DEFAULT_MAX_DOCUMENTS, HwpSession
+
+T = TypeVar("T")
+
+JobState = Literal["queued", "running", "done", "failed", "cancelled"]
+
+
+class JobCancelled(Exception):
+    """
+    작업 취소 요청으로 문서 생성을 멈출 때 발생하는 예외입니다.
+    """
+
+
+class JobStatus(BaseModel):
+    """
+    문서 생성 작업의 진행 상태입니다.
+    """
+
+    job_id: str
+    state: JobState
+    done: int = 0  # 끝난 행 수 (건너뛴 행과 실패한 행 포함)
+    failed: int = 0  # 실패한 행 수
+    total: int | None = None  # 전체 행 수 (알 수 없으면 None)
+    error: str | None = None  # 작업 실패 시 오류 메시지
+    last: str | None = None  # 마지막으로 끝난 문서 이름
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("done", "failed", "cancelled")
+
+
+class Job:
+    """
+    백그라운드에서 실행되는 문서 생성 작업 하나입니다.
+    행 결과는 작업 스레드가 큐에 넣고, 상태를 조회할 때 꺼내서 집계합니다.
+    """
+
+    def __init__(self, job_id: str, total: int | None):
+        self.job_id = job_id
+        self.total = total
+        self.progress: queue.Queue[RowResult] = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.started = threading.Event()
+        self.future: Future[list[RowResult]] | None = None
+        self.rows: list[RowResult] = []
+
+    def on_result(self, result: RowResult) -> None:
+        """
+        process_documents의 행 결과 콜백입니다. 취소 요청이 있으면 다음 행으로 넘어가지 않습니다.
+        """
+        self.progress.put(result)
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"작업이 취소되었습니다: {self.job_id}")
+
+    def drain(self) -> None:
+        """
+        큐에 쌓인 행 결과를 꺼내서 rows에 추가합니다.
+        """
+        while True:
+            try:
+                self.rows.append(self.progress.get_nowait())
+            except queue.Empty:
+                return
+
+
+class JobRunner:
+    """
+    문서 생성(process_documents)을 백그라운드 스레드에서 실행하는 작업 관리자입니다.
+    동시에 실행되는 작업 수(HWP 프로그램 수)는 max_workers로 제한되며,
+    나머지 작업은 제출한 순서대로 대기합니다.
+
+    작업 스레드마다 HWP 세션(hwp.session.HwpSession)을 하나씩 두고, 작업이 끝나도 한글 프로그램을
+    종료하지 않고 다음 작업과 call()에서 재사용합니다.
+
+    Streamlit에서는 st.cache_resource로 하나만 만들어 여러 세션과 재실행에 걸쳐 공유합니다.
+
+    Example:
+        runner = JobRunner(max_workers=1)
+        job_id = runner.submit(template_path=..., dataframe=df, ...)
+        runner.status(job_id)  # JobStatus(state="running", done=3, total=10, ...)
+        runner.result(job_id)  # list[RowResult]
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        hwp_factory: HwpFactory | None = None,
+        max_documents: int | None = DEFAULT_MAX_DOCUMENTS,
+    ):
+        """
+        Args:
+            max_workers (int): 동시에 실행할 작업 수
+                - 작업 스레드마다 HWP 객체를 하나씩 사용하므로, 동시에 띄울 HWP 프로그램 수와 같음
+            hwp_factory (HwpFactory | None): HWP 객체 생성 함수 (None이면 한글 프로그램 실행)
+            max_documents (int | None): 한글 프로그램을 다시 시작하기 전까지 만들 문서 수
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="autohwp",
+            initializer=_initialize_com,
+        )
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._hwp_factory = hwp_factory
+        self._max_documents = max_documents
+        self._local = threading.local()
+        self._sessions: list[HwpSession] = []
+
+    def _session(self) -> HwpSession:
+        """
+        현재 작업 스레드의 HWP 세션을 반환합니다. (처음 호출할 때 생성, 한글 프로그램은 처음 사용할 때 실행)
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = HwpSession(
+                self._hwp_factory, max_documents=self._max_documents
+            )
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def submit(self, **kwargs: Any) -> str:
+        """
+        문서 생성 작업을 제출합니다.
+
+        Args:
+            **kwargs: process_documents에 전달할 인자
+                - on_result는 작업 진행 상황 집계에, session은 작업 스레드의 HWP 재사용에
+                  사용하므로 전달할 수 없음
+
+        Returns:
+            str: 작업 ID
+        """
+        if "on_result" in kwargs or "session" in kwargs:
+            raise ValueError("on_result와 session은 작업 관리자가 사용하므로 전달할 수 없습니다.")
+
+        dataframe = kwargs.get("dataframe")
+        total = len(dataframe) if hasattr(dataframe, "__len__") else None
+
+        job = Job(uuid.uuid4().hex[:12], total)
+        with self._lock:
+            self._jobs[job.job_id] = job
+        job.future = self._executor.submit(self._run, job, kwargs)
+        return job.job_id
+
+    def _run(self, job: Job, kwargs: dict[str, Any]) -> list[RowResult]:
+        job.started.set()
+        if job.cancel_event.is_set():
+            raise JobCancelled(f"작업이 취소되었습니다: {job.job_id}")
+
+        return process_documents(on_result=job.on_result, session=self._session(), **kwargs)
+
+    def call(self, func: Callable[[HwpSession], T], timeout: float | None = None) -> T:
+        """
+        작업 스레드에서 그 스레드의 HWP 세션으로 함수를 실행하고 결과를 기다립니다.
+        (예: 업로드한 양식의 필드 목록 읽기) 실행 중인 작업이 있으면 작업이 끝난 뒤 실행됩니다.
+
+        Args:
+            func (Callable[[HwpSession], T]): HWP 세션을 받는 함수
+            timeout (float | None): 최대 대기 시간(초)
+
+        Returns:
+            T: 함수의 반환값
+        """
+        return self._executor.submit(lambda: func(self._session())).result(timeout=timeout)
+
+    def _get(self, job_id: str) -> Job:
+        with self._lock:
+            if job_id not in self._jobs:
+                raise KeyError(f"작업을 찾을 수 없습니다: {job_id}")
+            return self._jobs[job_id]
+
+    def status(self, job_id: str) -> JobStatus:
+        """
+        작업의 진행 상태를 반환합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            JobStatus: 진행 상태
+        """
+        job = self._get(job_id)
+        job.drain()
+
+        state: JobState = "running" if job.started.is_set() else "queued"
+        error = None
+        if job.future is not None and job.future.done():
+            exception = None if job.future.cancelled() else job.future.exception()
+            if job.future.cancelled() or isinstance(exception, JobCancelled):
+                state = "cancelled"
+            elif exception is not None:
+                state, error = "failed", repr(exception)
+            else:
+                state = "done"
+
+        return JobStatus(
+            job_id=job_id,
+            state=state,
+            done=len(job.rows),
+            failed=sum(1 for row in job.rows if not row.ok),
+            total=job.total,
+            error=error,
+            last=job.rows[-1].filename if job.rows else None,
+        )
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업을 취소합니다.
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 현재 행이 끝난 뒤 멈춥니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            bool: 취소 요청 여부 (이미 끝난 작업이면 False)
+        """
+        job = self._get(job_id)
+        if job.future is None or job.future.done():
+            return False
+
+        job.cancel_event.set()
+        job.future.cancel()
+        return True
+
+    def result(self, job_id: str, timeout: float | None = None) -> list[RowResult]:
+        """
+        작업이 끝날 때까지 기다린 뒤 행별 결과를 반환합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            timeout (float | None): 최대 대기 시간(초)
+
+        Returns:
+            list[RowResult]: 행별 문서 생성 결과
+                - 작업이 취소되었으면 취소 전까지 끝난 행의 결과
+        """
+        job = self._get(job_id)
+        try:
+            return job.future.result(timeout=timeout)
+        except (CancelledError, JobCancelled):
+            job.drain()
+            return list(job.rows)
+
+    def forget(self, job_id: str) -> None:
+        """
+        끝난 작업을 목록에서 지웁니다.
+
+        Args:
+            job_id (str): 작업 ID
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.future is not None and job.future.done():
+                del self._jobs[job_id]
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """
+        작업 관리자를 종료합니다.
+
+        Args:
+            cancel (bool): 대기 중이거나 실행 중인 작업을 취소할지 여부
+        """
+        if cancel:
+            for job_id in list(self._jobs):
+                self.cancel(job_id)
+        self._executor.shutdown(wait=True)
+
+        # 작업 스레드가 모두 끝났으므로 남은 한글 프로그램 종료
+        for session in self._sessions:
+            session.close()
+
+
+def _initialize_com() -> None:
+    """
+    작업 스레드에서 COM(한글 프로그램)을 사용하기 위해 스레드를 시작할 때 한 번 초기화합니다.
+    HWP 객체를 작업 사이에 재사용하므로, 스레드가 끝날 때까지 초기화 상태를 유지합니다.
+    """
+    try:
+        import pythoncom
+    except ImportError:
+        return
+
+    pythoncom.CoInitialize()
@@ -0,0 +1,185 @@
+import csv
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from pydantic import BaseModel, ValidationError
+
+from hwp.export import ExportFormat, resolve_output_folder
+from hwp.writer import to_field_text
+
+if TYPE_CHECKING:
+    from hwp.rows import FeedRow
+    from hwp.service import RowResult
+
+# 출력 폴더 옆에 만드는 실행 기록 파일의 접미사 (예: "채용계약서.manifest.jsonl")
+MANIFEST_SUFFIX = ".manifest.jsonl"
+
+# 출력 폴더 옆에 만드는 실패한 행 목록 파일의 접미사 (예: "채용계약서.failed.csv")
+FAILURE_REPORT_SUFFIX = ".failed.csv"
+
+
+class ManifestEntry(BaseModel):
+    """
+    문서 한 건의 생성 기록입니다.
+    """
+
+    key: str  # 저장 파일 이름 (확장자 제외)
+    row_hash: str  # 입력 행(매핑된 필드 값) 해시
+    template_hash: str  # 템플릿 내용 해시
+    paths: list[str] = []  # 저장된 파일 경로 목록
+
+
+class RunManifest:
+    """
+    문서 생성 실행 기록(매니페스트)입니다.
+    저장 파일 이름별로 입력 행 해시, 템플릿 해시, 저장 경로를 기록해 두고,
+    다시 실행할 때 입력과 템플릿이 그대로이고 파일도 남아 있는 행은 건너뜁니다.
+
+    기록은 한 줄에 한 건씩 JSON으로 이어 쓰므로(JSON Lines), 실행이 중간에 멈춰도
+    그때까지 생성한 행의 기록이 남고, 같은 키는 마지막 줄이 유효합니다.
+    여러 작업 프로세스(hwp.pool)가 같은 파일에 기록할 수 있습니다.
+    """
+
+    def __init__(self, path: str | Path, formats: Sequence[ExportFormat]):
+        """
+        Args:
+            path (str | Path): 매니페스트 파일 경로
+            formats (Sequence[ExportFormat]): 이번 실행의 저장 형식 목록
+                - 기록된 파일 중 이 형식의 파일이 모두 있어야 최신으로 판단
+        """
+        self.path = Path(path)
+        self.formats = tuple(formats)
+        self.entries: dict[str, ManifestEntry] = {}
+        self.load()
+
+    @classmethod
+    def for_output(
+        cls, output_folder: str | Path, formats: Sequence[ExportFormat]
+    ) -> "RunManifest":
+        """
+        출력 폴더 옆의 매니페스트를 엽니다.
+
+        Args:
+            output_folder (str | Path): 출력 폴더 이름 또는 경로 (save_document와 같은 규칙)
+            formats (Sequence[ExportFormat]): 이번 실행의 저장 형식 목록
+
+        Returns:
+            RunManifest: 실행 기록
+        """
+        folder = resolve_output_folder(output_folder)
+        return cls(folder.parent / f"{folder.name}{MANIFEST_SUFFIX}", formats)
+
+    def load(self) -> None:
+        """
+        파일에서 기록을 불러옵니다. 같은 키가 여러 번 기록되어 있으면 마지막 기록을 사용합니다.
+        """
+        self.entries = {}
+        if not self.path.exists():
+            return
+
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = ManifestEntry.model_validate_json(line)
+                except ValidationError:
+                    continue  # 기록 도중 멈춰서 잘린 줄은 무시
+                self.entries[entry.key] = entry
+
+    def compact(self) -> None:
+        """
+        키별 마지막 기록만 남기도록 파일을 다시 씁니다.
+        """
+        if not self.entries:
+            return
+
+        # 기록 중 멈춰도 기존 파일이 깨지지 않도록 교체 방식으로 저장
+        temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        lines = (entry.model_dump_json() + "\n" for entry in self.entries.values())
+        temp_path.write_text("".join(lines), encoding="utf-8")
+        temp_path.replace(self.path)
+
+    def is_current(self, key: str, row_hash: str, template_hash: str) -> bool:
+        """
+        행의 문서가 이미 같은 입력과 템플릿으로 생성되어 있는지 확인합니다.
+
+        Args:
+            key (str): 저장 파일 이름
+            row_hash (str): 입력 행 해시 (hash_row)
+            template_hash (str): 템플릿 내용 해시
+
+        Returns:
+            bool: 해시가 같고 이번 실행의 형식별 파일이 모두 있으면 True
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry.row_hash != row_hash or entry.template_hash != template_hash:
+            return False
+
+        existing = {Path(path).suffix.lstrip(".") for path in entry.paths if Path(path).exists()}
+        return existing.issuperset(self.formats)
+
+    def record(self, key: str, row_hash: str, template_hash: str, paths: list[str]) -> None:
+        """
+        행의 생성 기록을 파일에 추가합니다.
+
+        Args:
+            key (str): 저장 파일 이름
+            row_hash (str): 입력 행 해시
+            template_hash (str): 템플릿 내용 해시
+            paths (list[str]): 저장된 파일 경로 목록
+        """
+        entry = ManifestEntry(key=key, row_hash=row_hash, template_hash=template_hash, paths=paths)
+        self.entries[key] = entry
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(entry.model_dump_json() + "\n")
+
+
+def hash_row(row: "pd.Series | FeedRow", mapping: dict[str, str]) -> str:
+    """
+    문서에 입력되는 필드 값(매핑된 열의 값)의 해시를 반환합니다.
+
+    Args:
+        row (pd.Series | FeedRow): 데이터프레임의 행 (hwp.rows.RowFeed의 행도 가능)
+        mapping (Dict[str, str]): 필드와 컬럼 매핑 딕셔너리
+
+    Returns:
+        str: 16진수 해시 문자열
+            - 필드 입력 문자열(to_field_text) 기준이므로 NaN과 None은 빈 값과 같음
+    """
+    payload = [[field, to_field_text(row[column])] for field, column in mapping.items()]
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_failure_report(results: Sequence["RowResult"], path: str | Path) -> int:
+    """
+    실패한 행 목록을 CSV 파일로 저장합니다. (엑셀에서 바로 열 수 있도록 UTF-8 BOM 사용)
+    실패한 행이 없으면 이전 실행의 목록 파일을 삭제합니다.
+
+    Args:
+        results (Sequence[RowResult]): 행별 문서 생성 결과
+        path (str | Path): 저장 경로
+
+    Returns:
+        int: 실패한 행 수
+    """
+    path = Path(path)
+    failures = [result for result in results if not result.ok]
+    if not failures:
+        path.unlink(missing_ok=True)
+        return 0
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["index", "filename", "attempts", "error"])
+        for result in failures:
+            writer.writerow([result.index, result.filename, result.attempts, result.error])
+
+    return len(failures)
@@ -0,0 +1,457 @@
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, Any, Self
+
+from pydantic import BaseModel, Field
+
+# 구간 시간 히스토그램의 버킷 경계(초)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class Event(BaseModel):
+    """
+    계측 이벤트 하나입니다. (구간 시간 측정 결과 또는 상태 알림)
+    """
+
+    name: str  # 이벤트 이름 (예: "save_as", "row")
+    time: float = Field(default_factory=time.time)  # 발생 시각 (UNIX 시간)
+    seconds: float | None = None  # 구간 시간(초), 시간 측정이 아니면 None
+    labels: dict[str, str] = {}  # 집계 기준 (예: {"format": "pdf"}), 값 종류가 적어야 함
+    attrs: dict[str, Any] = {}  # 이벤트별 정보 (예: 파일 이름, 행 번호)
+    message: str | None = None  # 사람이 읽는 메시지 (LogSink가 출력)
+
+    @property
+    def key(self) -> MetricKey:
+        return self.name, tuple(sorted(self.labels.items()))
+
+
+class Histogram:
+    """
+    구간 시간의 누적 분포입니다. (버킷별 개수, 합계, 최소/최대)
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf 버킷
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), -1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        버킷 안에서 선형 보간한 분위수를 반환합니다. (근사값)
+
+        Args:
+            q (float): 분위 (0~1, 예: 0.95)
+
+        Returns:
+            float: 분위수(초)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, count in zip((*self.buckets, self.max), self.counts):
+            if count and seen + count >= rank:
+                # 버킷 경계를 관측된 최소/최대값 안으로 좁혀서 보간
+                low, high = max(lower, self.min), min(upper, self.max)
+                return low + (high - low) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "max": round(self.max, 6),
+        }
+
+
+class Sink:
+    """
+    계측 이벤트를 내보내는 곳의 기본 클래스입니다.
+    """
+
+    # 작업 프로세스에서 모아 온 이벤트도 받을지 여부 (작업 프로세스가 직접 출력하는 싱크는 False)
+    remote = True
+
+    def emit(self, event: Event) -> None:
+        pass
+
+    def flush(self, metrics: "Metrics") -> None:
+        """
+        집계 결과를 내보냅니다. (Metrics.flush, Metrics.close에서 호출)
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class LogSink(Sink):
+    """
+    이벤트 메시지를 화면(표준 출력)에 출력합니다.
+    """
+
+    remote = False
+
+    def __init__(self, verbose: bool = False, stream: IO[str] | None = None):
+        """
+        Args:
+            verbose (bool): 메시지가 없는 구간 시간 측정 결과도 출력할지 여부
+            stream (IO[str] | None): 출력 대상 (None이면 sys.stdout)
+        """
+        self.verbose = verbose
+        self.stream = stream
+
+    def emit(self, event: Event) -> None:
+        stream = self.stream or sys.stdout
+        if event.message is not None:
+            print(event.message, file=stream)
+        elif self.verbose and event.seconds is not None:
+            labels = ", ".join(f"{k}={v}" for k, v in sorted(event.labels.items()))
+            print(
+                f"[{event.name}{f' {labels}' if labels else ''}] {event.seconds:.3f}s", file=stream
+            )
+
+
+class JsonlSink(Sink):
+    """
+    이벤트를 JSON Lines 파일에 한 줄씩 추가합니다.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path (str | Path): JSON Lines 파일 경로 (있으면 뒤에 추가)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event) -> None:
+        line = event.model_dump_json() + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def flush(self, metrics: "Metrics") -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusSink(Sink):
+    """
+    집계 결과를 Prometheus 텍스트 형식 파일로 저장합니다. (node_exporter textfile collector 등)
+    이벤트마다 쓰지 않고, flush/close 때 파일 전체를 교체합니다.
+    """
+
+    def __init__(self, path: str | Path, prefix: str = "autohwp"):
+        """
+        Args:
+            path (str | Path): 저장 경로 (예: "autohwp.prom")
+            prefix (str): 지표 이름 앞에 붙일 접두사
+        """
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def flush(self, metrics: "Metrics") -> None:
+        lines = []
+        histograms, counters = metrics.snapshot()
+
+        for name in sorted({name for name, _ in histograms}):
+            metric = f"{self.prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for (key_name, labels), histogram in sorted(histograms.items()):
+                if key_name != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, math.inf), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f"{metric}_bucket{_labels(labels, le=le)} {cumulative}")
+                lines.append(f"{metric}_sum{_labels(labels)} {histogram.total}")
+                lines.append(f"{metric}_count{_labels(labels)} {histogram.count}")
+
+        for name in sorted({name for name, _ in counters}):
+            metric = f"{self.prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (key_name, labels), count in sorted(counters.items()):
+                if key_name == name:
+                    lines.append(f"{metric}{_labels(labels)} {count}")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 수집기가 쓰는 중인 파일을 읽지 않도록 교체 방식으로 저장
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        temp_path.replace(self.path)
+
+
+class MemorySink(Sink):
+    """
+    이벤트를 메모리에 모아 둡니다. (작업 프로세스의 이벤트를 메인 프로세스로 전달할 때 사용)
+    """
+
+    def __init__(self):
+        self.events: list[Event] = []
+
+    def emit(self, event: Event) -> None:
+        self.events.append(event)
+
+
+def _labels(labels: tuple[tuple[str, str], ...], **extra: str) -> str:
+    items = [*labels, *extra.items()]
+    if not items:
+        return ""
+    return "{" + ",".join(f"{k}={json.dumps(str(v), ensure_ascii=False)}" for k, v in items) + "}"
+
+
+class Timer:
+    """
+    with 블록의 실행 시간을 재서 이벤트로 기록합니다. (Metrics.timer가 반환)
+    블록 안에서 message와 attrs를 채우면 이벤트에 함께 기록됩니다.
+    """
+
+    def __init__(self, metrics: "Metrics", name: str, labels: dict[str, str]):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.attrs: dict[str, Any] = {}
+        self.message: str | None = None
+        self.seconds: float | None = None
+
+    def __enter__(self) -> Self:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.seconds = time.perf_counter() - self._start
+        labels, message = self.labels, self.message
+        if exc_type is not None:
+            labels = {**labels, "status": "error"}
+            self.attrs["error"] = repr(exc_value)
+            message = None
+
+        self.metrics.emit(
+            Event(
+                name=self.name,
+                seconds=self.seconds,
+                labels=labels,
+                attrs=self.attrs,
+                message=message,
+            )
+        )
+
+
+class Metrics:
+    """
+    문서 생성 단계별 시간과 이벤트를 집계하고 싱크로 내보내는 계측기입니다.
+    구간 시간은 (이름, 레이블)별 히스토그램으로, 이벤트는 (이름, 레이블)별 개수로 집계합니다.
+
+    Example:
+        metrics = Metrics([LogSink(), JsonlSink("run.jsonl"), PrometheusSink("run.prom")])
+        with use_metrics(metrics):
+            process_documents(...)
+        metrics.summary()  # {"save_as{format=pdf}": {"count": 10, "p95": 0.8, ...}, ...}
+        metrics.close()
+    """
+
+    def __init__(self, sinks: list[Sink] | None = None, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            sinks (list[Sink] | None): 이벤트를 내보낼 곳 목록
+                - None인 경우, 메시지를 화면에 출력(LogSink)
+            buckets (Iterable[float]): 히스토그램 버킷 경계(초)
+        """
+        self.sinks = [LogSink()] if sinks is None else list(sinks)
+        self.buckets = tuple(buckets)
+        self.histograms: dict[MetricKey, Histogram] = {}
+        self.counters: dict[MetricKey, int] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, event: Event) -> None:
+        key = event.key
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            if event.seconds is not None:
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram(self.buckets)
+                histogram.observe(event.seconds)
+
+    def emit(self, event: Event) -> None:
+        """
+        이벤트를 집계하고 모든 싱크로 내보냅니다.
+        """
+        self._record(event)
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def event(
+        self, name: str, message: str | None = None, labels: dict[str, str] | None = None, **attrs
+    ) -> None:
+        """
+        상태 이벤트를 기록합니다.
+
+        Args:
+            name (str): 이벤트 이름
+            message (str | None): 사람이 읽는 메시지
+            labels (dict[str, str] | None): 집계 기준
+            **attrs: 이벤트별 정보
+        """
+        self.emit(Event(name=name, labels=labels or {}, attrs=attrs, message=message))
+
+    def observe(
+        self,
+        name: str,
+        seconds: float,
+        message: str | None = None,
+        labels: dict[str, str] | None = None,
+        **attrs,
+    ) -> None:
+        """
+        이미 잰 구간 시간을 기록합니다.
+        """
+        self.emit(
+            Event(name=name, seconds=seconds, labels=labels or {}, attrs=attrs, message=message)
+        )
+
+    def timer(self, name: str, **labels: str) -> Timer:
+        """
+        with 블록의 실행 시간을 재는 타이머를 반환합니다.
+
+        Args:
+            name (str): 구간 이름 (예: "save_as")
+            **labels: 집계 기준 (예: format="pdf")
+
+        Returns:
+            Timer: 타이머
+        """
+        return Timer(self, name, labels)
+
+    def replay(self, events: Iterable[Event]) -> None:
+        """
+        작업 프로세스에서 모아 온 이벤트를 집계하고, 작업 프로세스가 직접 내보내지 않는 싱크로 보냅니다.
+        """
+        remote_sinks = [sink for sink in self.sinks if sink.remote]
+        for event in events:
+            self._record(event)
+            for sink in remote_sinks:
+                sink.emit(event)
+
+    def snapshot(self) -> tuple[dict[MetricKey, Histogram], dict[MetricKey, int]]:
+        with self._lock:
+            return dict(self.histograms), dict(self.counters)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        구간별 시간 요약을 반환합니다.
+
+        Returns:
+            dict[str, dict[str, float]]: "이름{레이블=값}"별 count, sum, mean, p50, p95, max
+        """
+        histograms, _ = self.snapshot()
+        summary = {}
+        for (name, labels), histogram in sorted(histograms.items()):
+            label_text = ",".join(f"{k}={v}" for k, v in labels)
+            summary[f"{name}{{{label_text}}}" if labels else name] = histogram.summary()
+        return summary
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush(self)
+
+    def close(self) -> None:
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+
+_DEFAULT_METRICS = Metrics()
+_CURRENT_METRICS: ContextVar[Metrics | None] = ContextVar("autohwp_metrics", default=None)
+
+
+def get_metrics() -> Metrics:
+    """
+    현재 사용 중인 계측기를 반환합니다. (use_metrics로 지정하지 않았으면 화면 출력만 하는 기본 계측기)
+    """
+    return _CURRENT_METRICS.get() or _DEFAULT_METRICS
+
+
+@contextmanager
+def use_metrics(metrics: Metrics | None):
+    """
+    with 블록 안에서(같은 스레드) 사용할 계측기를 지정합니다.
+
+    Args:
+        metrics (Metrics | None): 계측기 (None이면 현재 계측기를 그대로 사용)
+    """
+    if metrics is None:
+        yield get_metrics()
+        return
+
+    token = _CURRENT_METRICS.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _CURRENT_METRICS.reset(token)
+
+
+def collect_events(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, list[Event]]:
+    """
+    작업 프로세스에서 함수를 실행하고, 결과와 그동안의 계측 이벤트를 함께 반환합니다.
+    메시지는 작업 프로세스에서 바로 출력하고, 이벤트는 메인 프로세스에서 Metrics.replay로 집계합니다.
+
+    Args:
+        func (Callable[..., Any]): 실행할 함수 (pickle 가능해야 함)
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        tuple[Any, list[Event]]: (함수 결과, 계측 이벤트 목록)
+    """
+    collector = MemorySink()
+    with use_metrics(Metrics([LogSink(), collector])):
+        result = func(*args, **kwargs)
+    return result, collector.events
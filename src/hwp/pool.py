@@ -0,0 +1,179 @@
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any
+
+from pandas import DataFrame
+
+from hwp.context import HwpFactory
+from hwp.export import OutputPlanner
+from hwp.metrics import collect_events, get_metrics
+from hwp.rows import number_rows, row_numbers
+from hwp.service import RowResult, _render_with_session
+from hwp.session import DEFAULT_MAX_DOCUMENTS, HwpSession
+
+
+def split_shards(dataframe: DataFrame, workers: int) -> list[DataFrame]:
+    """
+    데이터프레임을 작업 프로세스 수만큼 연속된 행 구간으로 나눕니다.
+
+    Args:
+        dataframe (DataFrame): 데이터프레임 객체
+        workers (int): 작업 프로세스 수
+
+    Returns:
+        list[DataFrame]: 나누어진 데이터프레임 목록 (빈 구간 제외)
+    """
+    size, remainder = divmod(len(dataframe), workers)
+
+    shards = []
+    start = 0
+    for i in range(workers):
+        stop = start + size + (1 if i < remainder else 0)
+        if stop > start:
+            shards.append(dataframe.iloc[start:stop])
+        start = stop
+
+    return shards
+
+
+def render_shard(
+    template_path: str,
+    shard: DataFrame,
+    hwp_factory: HwpFactory | None,
+    render_kwargs: dict[str, Any],
+    max_documents: int | None = DEFAULT_MAX_DOCUMENTS,
+) -> list[RowResult]:
+    """
+    작업 프로세스에서 실행되는 함수로, 프로세스의 HWP 세션으로 할당된 행들의 문서를 생성합니다.
+    메인 프로세스와 같이 max_documents개의 문서를 만들 때마다, 그리고 응답이 없거나 오류가 나면
+    HWP 객체를 새로 띄우고 템플릿을 다시 엽니다. (hwp.service._render_with_session)
+    재시도 정책(render_kwargs의 retry)이 재시작을 요청할 때도 같습니다.
+
+    Args:
+        template_path (str): 템플릿 파일 경로
+        shard (DataFrame): 할당된 행 구간
+        hwp_factory (HwpFactory | None): HWP 객체 생성 함수
+        render_kwargs (dict[str, Any]): render_rows에 전달할 인자
+            - total은 진행 표시용 전체 행 수, filenames는 구간의 저장 파일 이름 (없으면 구간에서 계획)
+        max_documents (int | None): 다시 시작하기 전까지 만들 문서 수 (None이면 제한 없음)
+
+    Returns:
+        list[RowResult]: 할당된 행들의 문서 생성 결과
+    """
+    # 행 단위 오류는 기록하고 다음 행을 처리 (render_kwargs에 raise_errors가 있으면 그 값을 사용)
+    render_kwargs = {"raise_errors": False, **render_kwargs}
+    total = render_kwargs.pop("total", None)
+    filenames = render_kwargs.pop("filenames", None)
+
+    planner = None
+    if filenames is None:
+        planner = OutputPlanner(
+            render_kwargs["output_folder"],
+            render_kwargs["workflow_name"],
+            render_kwargs.get("filename_suffixes"),
+            render_kwargs.get("key_columns"),
+        )
+
+    # 템플릿 계획은 내용 해시로 캐시되므로, 두 번째 프로세스부터는 필드 분석을 생략
+    with HwpSession(hwp_factory, max_documents=max_documents) as session:
+        return _render_with_session(
+            session, template_path, [shard], total, None, planner, render_kwargs, filenames
+        )
+
+
+def run_pool(
+    template_path: str,
+    dataframe: DataFrame,
+    hwp_factory: HwpFactory | None = None,
+    workers: int = 2,
+    on_result: Callable[[RowResult], None] | None = None,
+    max_documents: int | None = DEFAULT_MAX_DOCUMENTS,
+    **render_kwargs: Any,
+) -> list[RowResult]:
+    """
+    여러 작업 프로세스에 행을 나누어 HWP 양식문서를 작성(채워넣기) 및 저장합니다.
+    각 프로세스는 자신의 HWP 객체를 사용하며, 행 단위 오류는 결과에 기록하고 계속 진행합니다.
+
+    Args:
+        template_path (str): 템플릿 파일 경로
+        dataframe (DataFrame): 데이터프레임 객체
+        hwp_factory (HwpFactory | None): HWP 객체 생성 함수 (pickle 가능해야 함)
+            - None인 경우, 프로세스마다 한글(HWP) 프로그램을 실행
+            - 예: functools.partial(FakeHwp, fields=[...])
+        workers (int): 작업 프로세스 수
+        on_result (Callable[[RowResult], None] | None): 행 결과를 전달받을 함수
+            - 작업 프로세스의 구간이 끝날 때마다 메인 프로세스에서 구간의 행마다 호출
+            - 작업 프로세스의 계측 이벤트도 구간이 끝날 때 메인 프로세스의 계측기(get_metrics)로 모음
+        max_documents (int | None): 작업 프로세스마다 한글 프로그램을 다시 시작하기 전까지 만들 문서 수
+        **render_kwargs: render_rows에 전달할 인자
+            - output_folder, workflow_name, field_mapping 등
+            - filenames(OutputPlanner.plan 결과)는 구간별로 나누어 전달 (없으면 여기서 한 번에 계획)
+
+    Returns:
+        list[RowResult]: 행별 문서 생성 결과 (행 번호 순)
+    """
+    if workers < 1:
+        raise ValueError(f"작업 프로세스 수는 1 이상이어야 합니다: {workers}")
+
+    # 구간으로 나누어도 행 번호가 전체 기준으로 유지되도록 고정
+    dataframe = number_rows(dataframe)
+    shards = split_shards(dataframe, workers)
+    render_kwargs["total"] = len(dataframe)
+    # 저장 파일 이름은 구간 사이에서도 겹치지 않도록 한 번에 정하고, 구간과 같은 위치로 나누어 전달
+    filenames = render_kwargs.pop("filenames", None)
+    if filenames is None:
+        filenames = OutputPlanner(
+            render_kwargs["output_folder"],
+            render_kwargs["workflow_name"],
+            render_kwargs.get("filename_suffixes"),
+            render_kwargs.get("key_columns"),
+        ).plan(dataframe)
+
+    metrics = get_metrics()
+    results: list[RowResult] = []
+    with ProcessPoolExecutor(max_workers=len(shards) or 1) as executor:
+        futures = {}
+        start = 0
+        for shard in shards:
+            shard_names = filenames[start : start + len(shard)]
+            shard_kwargs = {**render_kwargs, "filenames": shard_names}
+            start += len(shard)
+            future = executor.submit(
+                collect_events,
+                render_shard,
+                template_path,
+                shard,
+                hwp_factory,
+                shard_kwargs,
+                max_documents,
+            )
+            futures[future] = (shard, shard_names)
+
+        for future in as_completed(futures):
+            try:
+                shard_results, events = future.result()
+                metrics.replay(events)
+            except Exception as e:  # noqa: BLE001
+                # HWP 실행 실패 등 프로세스 단위 오류는 해당 구간의 모든 행을 실패로 기록
+                # (작업 프로세스의 traceback은 __cause__에 담겨 오므로 함께 남김)
+                shard, shard_names = futures[future]
+                error = "".join(traceback.format_exception(e)).strip()
+                metrics.event(
+                    "shard_failed",
+                    message=f"[✖] 작업 프로세스 실패: {e}",
+                    rows=len(shard),
+                    error=repr(e),
+                    traceback=error,
+                )
+                shard_results = [
+                    RowResult(index=number, filename=filename, error=error)
+                    for number, filename in zip(row_numbers(shard), shard_names)
+                ]
+
+            results.extend(shard_results)
+            if on_result is not None:
+                for result in shard_results:
+                    on_result(result)
+
+    return sorted(results, key=lambda result: result.index)
@@ -0,0 +1,64 @@
+from pydantic import BaseModel
+
+# 입력 값 문제(없는 열, 변환할 수 없는 값 등)로 다시 시도해도 같은 결과가 나오는 오류
+NON_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (KeyError, ValueError, TypeError)
+
+
+class RetryPolicy(BaseModel):
+    """
+    행 단위 문서 생성(필드 입력, 저장)이 실패했을 때의 재시도 정책입니다.
+
+    한글 프로그램(COM)의 일시적인 오류나 잠긴 파일은 잠시 기다렸다가 다시 시도하면 대부분 해결되고,
+    같은 행에서 실패가 반복되면 한글 프로그램을 다시 시작하고 템플릿을 다시 연 뒤 시도합니다.
+    모든 시도가 실패한 행은 결과에 오류로 기록하고 다음 행으로 넘어갑니다.
+
+    Example:
+        process_documents(..., retry=RetryPolicy(attempts=5, backoff=1.0))
+    """
+
+    attempts: int = 3  # 행마다 최대 시도 횟수 (1이면 재시도 없음)
+    backoff: float = 0.5  # 첫 재시도 전 대기 시간(초)
+    multiplier: float = 2.0  # 재시도마다 대기 시간을 늘리는 배수
+    max_backoff: float = 10.0  # 최대 대기 시간(초)
+    restart_after: int = 2  # 같은 행에서 이만큼 실패하면 한글 프로그램 재시작 (0이면 안 함)
+
+    def delay(self, failures: int) -> float:
+        """
+        실패 횟수에 따른 다음 시도 전 대기 시간을 반환합니다.
+
+        Args:
+            failures (int): 지금까지의 실패 횟수 (1부터 시작)
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        return min(self.backoff * self.multiplier ** (failures - 1), self.max_backoff)
+
+    def should_retry(self, error: Exception, failures: int) -> bool:
+        """
+        실패한 행을 다시 시도할지 여부를 반환합니다.
+
+        Args:
+            error (Exception): 발생한 오류
+            failures (int): 지금까지의 실패 횟수
+
+        Returns:
+            bool: 다시 시도할지 여부 (입력 값 오류이거나 시도 횟수를 다 쓰면 False)
+        """
+        return failures < self.attempts and not isinstance(error, NON_RETRYABLE_ERRORS)
+
+    def should_restart(self, failures: int) -> bool:
+        """
+        다음 시도 전에 한글 프로그램을 다시 시작할지 여부를 반환합니다.
+
+        Args:
+            failures (int): 지금까지의 실패 횟수
+
+        Returns:
+            bool: 다시 시작할지 여부
+        """
+        return self.restart_after > 0 and failures >= self.restart_after
+
+
+# 재시도 없이 실패를 기록만 하는 정책
+NO_RETRY = RetryPolicy(attempts=1, restart_after=0)
@@ -0,0 +1,117 @@
+from collections.abc import Iterable, Iterator, Mapping
+
+from pandas import DataFrame, RangeIndex
+from pandas.api.types import is_integer_dtype
+
+from hwp.writer import to_field_text
+
+
+def row_numbers(dataframe: DataFrame) -> list[int]:
+    """
+    데이터프레임 행마다 1부터 시작하는 행 번호를 반환합니다.
+
+    Args:
+        dataframe (DataFrame): 데이터프레임 객체 (전체 또는 조각)
+
+    Returns:
+        list[int]: 행 번호 목록
+            - 인덱스가 정수이면 인덱스 + 1 (엑셀을 조각으로 읽어도 전체 기준 번호 유지)
+            - 정수가 아니면(문자열, 날짜 등) 데이터프레임 안의 위치 + 1
+              (조각으로 나누면 조각 안의 위치가 되므로, 나누기 전에 number_rows로 번호를 고정)
+    """
+    if is_integer_dtype(dataframe.index.dtype):
+        return (dataframe.index.to_numpy() + 1).tolist()
+    return list(range(1, len(dataframe) + 1))
+
+
+def number_rows(dataframe: DataFrame, offset: int = 0) -> DataFrame:
+    """
+    데이터프레임을 조각이나 구간으로 나누어도 행 번호가 바뀌지 않도록 인덱스를 고정합니다.
+
+    Args:
+        dataframe (DataFrame): 데이터프레임 객체
+        offset (int): 앞 조각들의 행 수 (인덱스가 정수가 아닌 조각을 이어서 번호를 매길 때)
+
+    Returns:
+        DataFrame: 인덱스가 정수이면 그대로,
+            정수가 아니면(문자열, 날짜 등) 인덱스를 offset부터의 위치 번호로 바꾼 데이터프레임
+    """
+    if is_integer_dtype(dataframe.index.dtype):
+        return dataframe
+    return dataframe.set_axis(RangeIndex(offset, offset + len(dataframe)))
+
+
+def iter_numbered(chunks: Iterable[DataFrame]) -> Iterator[DataFrame]:
+    """
+    데이터프레임 조각들에 number_rows를 적용합니다. (정수가 아닌 인덱스는 조각 사이에서 이어지는 번호)
+
+    Args:
+        chunks (Iterable[DataFrame]): 데이터프레임 조각 목록
+
+    Yields:
+        DataFrame: 행 번호가 고정된 조각
+    """
+    offset = 0
+    for chunk in chunks:
+        yield number_rows(chunk, offset)
+        offset += len(chunk)
+
+
+class FeedRow:
+    """
+    RowFeed가 만든 행 하나입니다. row[열 이름]으로 필드 입력 문자열을 꺼냅니다.
+    (write_fields, hash_row에 pd.Series 대신 전달)
+    """
+
+    __slots__ = ("positions", "values")
+
+    def __init__(self, positions: Mapping[str, int], values: tuple[str, ...]):
+        self.positions = positions
+        self.values = values
+
+    def __getitem__(self, column: str) -> str:
+        return self.values[self.positions[column]]
+
+
+class RowFeed:
+    """
+    데이터프레임에서 매핑된 열만 매핑 순서대로 한 번에 꺼내 둔 행 데이터입니다.
+
+    iterrows처럼 행마다 pd.Series를 만들지 않고, 열 단위로 필드 입력 문자열(to_field_text)로
+    변환한 뒤 행마다 튜플 하나로 묶어 둡니다.
+    열마다 값을 그대로 꺼내므로, 숫자 열이 다른 실수 열 때문에 실수로 바뀌는(예: 5 → "5.0") 일도 없습니다.
+
+    Example:
+        feed = RowFeed(dataframe, {"성명": "이름", "생년월일": "생년월일"})
+        for number, row in zip(feed.numbers, feed):
+            write_fields(hwp, row, mapping)
+    """
+
+    def __init__(self, dataframe: DataFrame, mapping: Mapping[str, str]):
+        """
+        Args:
+            dataframe (DataFrame): 데이터프레임 객체 (전체 또는 조각)
+            mapping (Mapping[str, str]): 필드와 컬럼 매핑 딕셔너리
+                - 데이터프레임에 없는 열은 제외 (해당 열을 읽는 행에서 KeyError 발생)
+        """
+        columns = [col for col in dict.fromkeys(mapping.values()) if col in dataframe.columns]
+        self.columns = columns
+        self.positions = {col: position for position, col in enumerate(columns)}
+        self.numbers = row_numbers(dataframe)
+
+        texts = [[to_field_text(value) for value in dataframe[col].tolist()] for col in columns]
+        if texts:
+            self.values: list[tuple[str, ...]] = list(zip(*texts))
+        else:
+            self.values = [()] * len(dataframe)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[FeedRow]:
+        positions = self.positions
+        for values in self.values:
+            yield FeedRow(positions, values)
+
+    def __getitem__(self, position: int) -> FeedRow:
+        return FeedRow(self.positions, self.values[position])
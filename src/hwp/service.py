@@ -1,124 +1,84 @@
-import winreg
-from contextlib import contextmanager
+import time
+from collections.abc import Callable, Iterable, Sequence
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List
-
-from pandas import DataFrame
-from pyhwpx import Hwp
-
-from hwp.export import save_document
-from hwp.template import open_template
+from typing import TYPE_CHECKING
+
+from pandas import DataFrame, concat
+from pydantic import BaseModel
+
+from hwp.context import HwpFactory, create_hwp, hwp_context, register_security_module
+from hwp.dedup import DedupIndex
+from hwp.export import (
+    DEFAULT_FORMATS,
+    FILENAME_COLUMN,
+    ExportFormat,
+    OutputPlanner,
+    convert_to_pdf,
+    export_document,
+)
+from hwp.manifest import FAILURE_REPORT_SUFFIX, RunManifest, hash_row, write_failure_report
+from hwp.metrics import Metrics, get_metrics, use_metrics
+from hwp.retry import NO_RETRY, RetryPolicy
+from hwp.rows import RowFeed, iter_numbered, number_rows
+from hwp.session import DEFAULT_MAX_DOCUMENTS, HwpSession
+from hwp.template import TemplatePlan, open_template
 from hwp.writer import write_fields
 
+if TYPE_CHECKING:
+    from pyhwpx import Hwp
 
-@contextmanager
-def hwp_context(visible: bool = False):
-    """
-    HWP 객체를 생성하고 컨텍스트 매니저로 반환합니다.
 
-    Args:
-        visible (bool): HWP 창을 표시할지 여부
-
-    Returns:
-        Hwp: HWP 객체
+class RowResult(BaseModel):
     """
-    hwp = Hwp(new=True, visible=visible, register_module=False)
-    print("Hwp version:", hwp.Version)
-
-    register_security_module(hwp, "../resource/FilePathCheckerModule.dll")
-
-    try:
-        yield hwp
-    finally:
-        hwp.clear()
-        hwp.quit()
-
-
-def register_security_module(
-    hwp: Hwp,
-    dll_filepath: str = "FilePathCheckerModule.dll",
-) -> bool:
+    문서 한 건(데이터프레임의 한 행)의 생성 결과입니다.
     """
-    한글 HwpAutomation에 보안모듈 DLL을 레지스트리에 등록하고, HWP 객체에 등록합니다.
-    레지스트리 등록을 위한 관리자 권한이 필요합니다.
-    레지스트리에 등록된 DLL은 HWP 객체에 보안모듈로 등록됩니다.
 
-    레지스트리 값 이름을 'FilePathCheckerModule' 이외 이름으로 레지스트리에 등록할 경우
-    pyhwpx 패키지 내부에서 `FileNotFoundError` 문제가 발생하여,
-    DLL 이름은 'FilePathCheckerModule.dll'로 고정합니다.
-        https://github.com/martiniifun/pyhwpx/issues/8
+    index: int  # 데이터프레임 행 번호 (1부터 시작)
+    filename: str  # 저장 파일 이름 (확장자 제외)
+    paths: list[str] = []  # 저장된 파일 경로 목록
+    error: str | None = None  # 실패 시 오류 메시지
+    skipped: bool = False  # 실행 기록상 변경이 없어 생성을 건너뛰었는지 여부
+    source: str | None = None  # 같은 내용의 문서를 링크(복사)해 온 경우, 원본 파일 이름
+    attempts: int = 1  # 생성 시도 횟수 (재시도 포함)
 
-    Args:
-        hwp (Hwp): pyhwpx로 생성된 Hwp 객체
-        dll_filepath (str): 등록할 보안모듈 DLL 파일 경로
-            (상대경로일 경우, 현재 작업 디렉토리 기준으로 해석됨)
-
-    Returns:
-        bool: 보안모듈 등록 결과
-    """
-
-    dll_path = Path(dll_filepath).resolve()
-    if not dll_path.exists():
-        raise FileNotFoundError(f"DLL 파일이 존재하지 않습니다: {dll_path}")
-
-    module_name = dll_path.stem  # 'FilePathCheckerModule'
-    reg_path = r"Software\HNC\HwpAutomation\Modules"
-
-    # 1-1. 레지스트리 문자열 값(FilePathCheckerModule) 존재 확인
-    try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path) as key:
-            try:
-                _, _ = winreg.QueryValueEx(key, module_name)
-                # print("[✔] 레지스트리에 보안모듈 등록됨")
-            except FileNotFoundError:
-                print("[✖] 레지스트리에 보안모듈이 등록되어 있지 않습니다. 새로 등록합니다.")
-
-                with winreg.CreateKey(winreg.HKEY_CURRENT_USER, reg_path) as key:
-                    winreg.SetValueEx(key, module_name, 0, winreg.REG_SZ, str(dll_path))
-                    print(f"[✔] 레지스트리에 보안모듈 등록 완료: {module_name} → {dll_path}")
-    except PermissionError:
-        print("[✖] 레지스트리 접근 권한이 없습니다. 관리자 권한으로 실행하세요.")
-        return False
-
-    # self.hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
-    # self.hwp.XHwpWindows.Active_XHwpWindow.Visible = visible
-
-    # 2. HWP 객체에 보안모듈 등록 (pyhwpx 활용)
-    result = hwp.RegisterModule("FilePathCheckDLL", module_name)
-
-    if not result:
-        print(f"[✖] HWP 객체에 보안모듈 활성화 실패: {module_name}")
-        print(
-            rf"""
-            아래 링크를 참조하여 보안모듈을 레지스트리에 수동으로 등록하세요. (관리자 권한 필요)
-                https://developer.hancom.com/hwpautomation
-
-            DLL 파일을 'C:\\Program Files (x86)\\HNC\\HwpAutomation\\Modules' 폴더(또는 원하는 위치)에 복사한 후,
-            레지스트리 편집기를 열고 아래 경로로 이동하여 DLL 경로를 문자열 값으로 등록하세요. (새로 만들기 → 문자열 값)
-                컴퓨터\HKEY_CURRENT_USER\Software\HNC\HwpAutomation\Modules
-                - 값 이름: {module_name}
-                - 값 데이터: {dll_path}
-            """
-        )
-
-    return result
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 def process_documents(
     template_path: str,
-    dataframe: DataFrame,
+    dataframe: DataFrame | Iterable[DataFrame],
     output_folder: str,
     workflow_name: str,
-    filename_suffixes: List[str] | None = None,
-    key_columns: List[str] | None = None,
-    field_mapping: Dict[str, str] | None = None,
-) -> None:
+    filename_suffixes: list[str] | None = None,
+    key_columns: list[str] | None = None,
+    field_mapping: dict[str, str] | None = None,
+    batch_write: bool = False,
+    reset_fields: bool = True,
+    hwp_factory: HwpFactory | None = None,
+    workers: int = 1,
+    formats: Sequence[ExportFormat] = DEFAULT_FORMATS,
+    defer_pdf: bool = False,
+    resume: bool = False,
+    manifest_path: str | Path | None = None,
+    on_result: Callable[[RowResult], None] | None = None,
+    session: HwpSession | None = None,
+    metrics: Metrics | None = None,
+    deduplicate: bool = False,
+    dedup_link: bool = True,
+    retry: RetryPolicy | None = None,
+    failure_report: str | Path | None = None,
+) -> list[RowResult]:
     """
     HWP 양식문서 작성(채워넣기) 및 저장
 
     Args:
         template_path (str): 템플릿 파일 경로
-        dataframe (DataFrame): 데이터프레임 객체
+        dataframe (DataFrame | Iterable[DataFrame]): 데이터프레임 객체
+            - 데이터프레임 조각의 반복자(excel.loader.iter_data_chunks)를 넘기면
+              엑셀을 읽는 동안 앞쪽 조각부터 문서를 생성 (workers가 1보다 크면 모두 읽은 뒤 처리)
         output_folder (str): 출력 폴더 이름
         workflow_name (str): 워크플로우 이름
         filename_suffixes (List[str] | None): 저장할 파일 이름 접미사
@@ -131,31 +91,478 @@ def process_documents(
         field_mapping (Dict[str, str] | None): 필드 매핑 정보
             - None인 경우, 데이터프레임의 열 이름을 그대로 사용하여 매핑됨
             - 예: {'이름': '이름', '생년월일': '생년월일'}
+        batch_write (bool): 필드 일괄 입력 여부
+            - True인 경우, 문서마다 put_field_text를 한 번만 호출
+        reset_fields (bool): 행마다 매핑되지 않은 필드를 템플릿 기본값으로 되돌릴지 여부
+            - 템플릿을 다시 열지 않고, 같은 입력 호출에 템플릿 전체 필드 값을 포함하여 초기화
+            - 앞 행의 값이 다음 문서에 남지 않도록 기본으로 사용 (hwp.writer.write_fields 참고)
+        hwp_factory (HwpFactory | None): HWP 객체 생성 함수
+            - None인 경우, 한글(HWP) 프로그램을 실행
+        workers (int): 작업 프로세스 수
+            - 1보다 크면 프로세스마다 HWP 객체를 하나씩 띄워 행을 나누어 처리 (hwp.pool 참고)
+            - 이 경우, hwp_factory는 pickle 가능해야 함
+        formats (Sequence[ExportFormat]): 저장 형식 목록
+            - 예: ("hwp",), ("pdf",), ("hwp", "pdf"), ("hwpx",)
+            - HwpxDocument(hwp.hwpx)를 사용하는 경우, ("hwpx",)만 지원
+        defer_pdf (bool): PDF 변환을 문서 생성 이후 단계로 미룰지 여부
+            - True인 경우, 행마다 HWP만 저장하고 모든 행이 끝난 뒤 convert_to_pdf로 일괄 변환
+            - formats에 "hwp"가 없으면 변환 후 HWP 파일은 삭제됨
+        resume (bool): 실행 기록(매니페스트)으로 이어서 실행할지 여부
+            - True인 경우, 출력 폴더 옆의 실행 기록(hwp.manifest)을 읽어
+              입력 행과 템플릿이 바뀌지 않았고 파일이 남아 있는 행은 건너뜀
+            - 생성한 행은 바로 기록하므로, 중간에 멈춘 실행을 다시 실행하면 남은 행만 생성
+        manifest_path (str | Path | None): 실행 기록 파일 경로
+            - None인 경우, 출력 폴더 옆의 "<폴더 이름>.manifest.jsonl"
+            - 같은 출력 폴더를 여러 프로세스가 나누어 생성하는 경우(CLI --shard) 프로세스마다 지정
+        on_result (Callable[[RowResult], None] | None): 행이 끝날 때마다 호출할 함수
+            - 예: ZIP 내보내기(hwp.bundle.ZipBundle.add)
+            - workers가 1보다 크면 작업 프로세스의 구간이 끝날 때마다 호출
+            - defer_pdf로 PDF 변환을 미룬 경우, 변환이 끝난 뒤 행마다 호출
+        session (HwpSession | None): 재사용할 HWP 세션 (hwp.session)
+            - None인 경우, 이번 호출에서만 사용할 한글 프로그램을 실행하고 끝나면 종료
+            - 세션을 넘기면 호출이 끝나도 한글 프로그램을 종료하지 않고 다음 호출에서 재사용
+            - workers가 1보다 크면 작업 프로세스마다 HWP 세션을 따로 만들고, 이 세션의 max_documents만 사용
+              (세션이 없으면 hwp.session.DEFAULT_MAX_DOCUMENTS)
+        metrics (Metrics | None): 단계별 시간과 이벤트를 기록할 계측기 (hwp.metrics)
+            - None인 경우, 현재 계측기(기본은 메시지 화면 출력)를 사용
+        deduplicate (bool): 입력 필드 값이 같은 행의 문서를 한 번만 생성할지 여부 (hwp.dedup)
+            - True인 경우, 같은 값의 두 번째 행부터는 처음 만든 문서 파일을 링크(복사)하고
+              RowResult.source에 원본 파일 이름을 기록
+            - workers가 1보다 크면 작업 프로세스의 구간마다 따로 확인
+        dedup_link (bool): 중복 문서를 하드링크로 만들지 여부 (False이면 복사)
+        retry (RetryPolicy | None): 행 생성 실패 시 재시도 정책 (hwp.retry)
+            - None인 경우, 기본 정책(3회 시도, 2회 실패하면 한글 프로그램 재시작)
+            - 모든 시도가 실패한 행은 RowResult.error에 기록하고 다음 행을 계속 처리
+        failure_report (str | Path | None): 실패한 행 목록(CSV) 저장 경로
+            - None인 경우, 출력 폴더 옆의 "<폴더 이름>.failed.csv"
+            - 실패한 행이 없으면 파일을 만들지 않음 (이전 실행의 목록은 삭제)
+
+    Returns:
+        list[RowResult]: 행별 문서 생성 결과
+    """
+
+    with use_metrics(metrics):
+        # 행 번호(RowResult.index)는 조각, 세션 재시작, 작업 프로세스 구간으로 나누기 전에 고정
+        if isinstance(dataframe, DataFrame):
+            dataframe = number_rows(dataframe)
+            chunks: Iterable[DataFrame] = [dataframe]
+            total = len(dataframe)
+        else:
+            chunks = iter_numbered(dataframe)
+            total = None  # 전체 행 수를 미리 알 수 없음
+
+        if field_mapping is None:
+            # 첫 조각의 열 이름으로 매핑을 만들고, 꺼낸 조각은 다시 앞에 붙임
+            first = next(iter(chunks), None)
+            columns = first.columns if first is not None else []
+            field_mapping = {col: col for col in columns if col != FILENAME_COLUMN}
+            chunks = chain([first] if first is not None else [], chunks)
+
+        render_formats = formats
+        row_callback = on_result
+        if defer_pdf and "pdf" in formats:
+            # PDF는 나중에 HWP 파일에서 변환하므로, 채워넣기 단계에서는 HWP만 저장
+            render_formats = ("hwp",)
+            # 결과 파일은 PDF 변환 후에 확정되므로, 행 단위 호출도 변환 후로 미룸
+            row_callback = None
+
+        manifest = None
+        if resume:
+            if manifest_path is not None:
+                manifest = RunManifest(manifest_path, formats)
+            else:
+                manifest = RunManifest.for_output(output_folder, formats)
+            manifest.compact()
+
+        render_kwargs = {
+            "output_folder": output_folder,
+            "workflow_name": workflow_name,
+            "field_mapping": field_mapping,
+            "filename_suffixes": filename_suffixes,
+            "key_columns": key_columns,
+            "batch_write": batch_write,
+            "reset_fields": reset_fields,
+            "formats": render_formats,
+            "manifest": manifest,
+            "dedup": DedupIndex(link=dedup_link) if deduplicate else None,
+            "retry": retry if retry is not None else RetryPolicy(),
+            "raise_errors": False,  # 행 단위 오류는 기록하고 다음 행을 처리
+        }
+
+        # 저장 경로(폴더 생성, 파일 이름 정리와 중복 처리)는 문서 생성 전에 조각 단위로 계획
+        planner = OutputPlanner(output_folder, workflow_name, filename_suffixes, key_columns)
+
+        if workers > 1:
+            # hwp.pool이 이 모듈의 render_rows를 사용하므로 순환 참조를 피해 여기서 import
+            from hwp.pool import run_pool
+
+            # 행을 프로세스 수만큼 나누어야 하므로 조각을 모두 모은 뒤 처리
+            if not isinstance(dataframe, DataFrame):
+                chunks = list(chunks)
+                dataframe = concat(chunks) if chunks else DataFrame()
+
+            # 프로세스 사이에서도 이름이 겹치지 않도록 메인 프로세스에서 한 번에 계획
+            results = run_pool(
+                template_path,
+                dataframe,
+                hwp_factory,
+                workers,
+                on_result=row_callback,
+                max_documents=(
+                    session.max_documents if session is not None else DEFAULT_MAX_DOCUMENTS
+                ),
+                filenames=planner.plan(dataframe),
+                **render_kwargs,
+            )
+            if render_formats != formats:
+                _export_deferred_pdf(
+                    results, formats, hwp_factory, workers, manifest, dedup=render_kwargs["dedup"]
+                )
+        else:
+            # 세션을 받지 않으면 이번 호출에서만 사용할 세션을 만들고, 끝나면 한글 프로그램 종료
+            owned = session is None
+            if session is None:
+                session = HwpSession(hwp_factory)
+            try:
+                results = _render_with_session(
+                    session, template_path, chunks, total, row_callback, planner, render_kwargs
+                )
+                if render_formats != formats:
+                    _export_deferred_pdf(
+                        results,
+                        formats,
+                        hwp_factory,
+                        workers,
+                        manifest,
+                        session,
+                        dedup=render_kwargs["dedup"],
+                    )
+            finally:
+                if owned:
+                    session.close()
+
+        if deduplicate:
+            _report_dedup(results)
+
+        if failure_report is None:
+            failure_report = planner.folder.with_name(
+                f"{planner.folder.name}{FAILURE_REPORT_SUFFIX}"
+            )
+        failed = write_failure_report(results, failure_report)
+        if failed:
+            get_metrics().event(
+                "failure_report",
+                message=f"[✖] 문서 생성 실패 {failed}건 (실패 목록: {failure_report})",
+                failed=failed,
+                path=str(failure_report),
+            )
+
+        if render_formats != formats and on_result is not None:
+            for result in results:
+                on_result(result)
+
+        return results
+
+
+def _report_dedup(results: list[RowResult]) -> None:
+    """
+    중복 문서 링크(복사) 결과를 계측 이벤트로 남깁니다. (생성 대상 행 중 링크한 행의 비율)
+    """
+    targets = [result for result in results if not result.skipped and result.ok]
+    copied = sum(1 for result in targets if result.source is not None)
+    ratio = copied / len(targets) if targets else 0.0
+    get_metrics().event(
+        "dedup",
+        message=f"같은 내용의 문서 {copied}/{len(targets)}건을 다시 만들지 않고 복사했습니다. ({ratio:.1%})",
+        rendered=len(targets) - copied,
+        copied=copied,
+        ratio=round(ratio, 4),
+    )
+
+
+def _render_with_session(
+    session: HwpSession,
+    template_path: str,
+    chunks: Iterable[DataFrame],
+    total: int | None,
+    on_result: Callable[[RowResult], None] | None,
+    planner: OutputPlanner | None,
+    render_kwargs: dict,
+    filenames: Sequence[str] | None = None,
+) -> list[RowResult]:
+    """
+    HWP 세션으로 데이터프레임 조각들의 문서를 생성합니다.
+    세션이 문서 수 제한이나 오류로 한글 프로그램을 다시 시작하면, 새 HWP 객체에서 템플릿을 다시 엽니다.
+    저장 파일 이름은 조각마다 생성 전에 planner로 정하거나,
+    미리 정한 filenames(모든 조각의 행 순서)를 조각 위치대로 나누어 사용합니다. (hwp.pool)
+    """
+    results: list[RowResult] = []
+    planned = 0  # filenames에서 앞 조각들이 사용한 개수
+    hwp, plan = None, None
+
+    def restart() -> tuple["Hwp", TemplatePlan]:
+        # 재시도 정책이 같은 행의 반복 실패로 재시작을 요청하면, 새 HWP 객체에서 템플릿을 다시 엶
+        nonlocal hwp, plan
+        hwp = session.restart("retry")
+        plan = open_template(hwp, template_path)
+        return hwp, plan
+
+    for chunk in chunks:
+        if filenames is not None:
+            names = filenames[planned : planned + len(chunk)]
+            planned += len(chunk)
+        else:
+            names = planner.plan(chunk)
+        start = 0
+        while start < len(chunk):
+            with session.lease() as leased:
+                if leased is not hwp:
+                    hwp = leased
+                    plan = open_template(hwp, template_path)
+
+                # 다시 시작하기 전까지 만들 수 있는 만큼만 처리
+                remaining = session.remaining
+                part = chunk.iloc[start : start + remaining] if remaining else chunk.iloc[start:]
+                rendered = render_rows(
+                    hwp,
+                    part,
+                    plan=plan,
+                    total=total,
+                    on_result=on_result,
+                    filenames=names[start : start + len(part)],
+                    restart=restart,
+                    **render_kwargs,
+                )
+                session.count_documents(sum(1 for result in rendered if not result.skipped))
+
+            results += rendered
+            start += len(part)
+
+    return results
+
+
+def _export_deferred_pdf(
+    results: list[RowResult],
+    formats: Sequence[ExportFormat],
+    hwp_factory: HwpFactory | None,
+    workers: int,
+    manifest: RunManifest | None = None,
+    session: HwpSession | None = None,
+    dedup: DedupIndex | None = None,
+) -> None:
+    """
+    채워넣기 단계에서 저장된 HWP 파일들을 일괄로 PDF 변환하고, 결과의 파일 경로를 갱신합니다.
+    실행 기록이 있으면 변환된 파일 경로도 기록합니다. (건너뛴 행은 이미 변환되어 있음)
+    세션을 받으면 채워넣기에 사용한 한글 프로그램으로 이어서 변환합니다.
+    중복 문서(RowResult.source)는 변환하지 않고 원본의 변환 결과를 다시 링크(복사)합니다.
+    """
+    rendered = [result for result in results if not result.skipped]
+    copies = [result for result in rendered if result.source is not None]
+    rendered = [result for result in rendered if result.source is None]
+    hwp_paths = [path for result in rendered for path in result.paths if path.endswith(".hwp")]
+    pdf_paths = convert_to_pdf(
+        hwp_paths,
+        hwp_factory=hwp_factory,
+        workers=workers,
+        remove_source="hwp" not in formats,
+        session=session,
+    )
+
+    converted = {path.with_suffix(".hwp") for path in pdf_paths}
+    for result in rendered:
+        paths = []
+        for path in map(Path, result.paths):
+            failed = path.suffix == ".hwp" and path not in converted
+            # PDF로 변환하지 못한 HWP 파일은 삭제하지 않으므로 결과에도 남겨 둠
+            if "hwp" in formats or failed:
+                paths.append(str(path))
+            if path in converted:
+                paths.append(str(path.with_suffix(".pdf")))
+            if failed and result.error is None:
+                result.error = f"PDF 변환 실패: {path.name}"
+        result.paths = paths
+
+    if copies and dedup is not None:
+        sources = {result.filename: result for result in results}
+        for result in copies:
+            source = sources.get(result.source or "")
+            if source is None or not source.paths or not result.paths:
+                continue
+            previous = set(result.paths)
+            save_path = Path(result.paths[0]).with_suffix("")
+            result.paths = [str(path) for path in dedup.materialize(source.paths, save_path)]
+            # 원본에서 삭제된 형식(formats에 없는 HWP)은 중복 문서에서도 삭제
+            for path in previous - set(result.paths):
+                Path(path).unlink(missing_ok=True)
+        rendered += copies
+
+    if manifest is not None:
+        # 작업 프로세스가 기록한 내용까지 다시 읽은 뒤, 변환 결과를 덧붙여 기록
+        manifest.load()
+        for result in rendered:
+            entry = manifest.entries.get(result.filename)
+            if result.ok and entry is not None:
+                manifest.record(entry.key, entry.row_hash, entry.template_hash, result.paths)
+
+
+def render_rows(
+    hwp: "Hwp",
+    dataframe: DataFrame,
+    output_folder: str,
+    workflow_name: str,
+    field_mapping: dict[str, str],
+    filename_suffixes: list[str] | None = None,
+    key_columns: list[str] | None = None,
+    batch_write: bool = False,
+    reset_fields: bool = True,
+    formats: Sequence[ExportFormat] = DEFAULT_FORMATS,
+    total: int | None = None,
+    raise_errors: bool = True,
+    plan: TemplatePlan | None = None,
+    manifest: RunManifest | None = None,
+    on_result: Callable[[RowResult], None] | None = None,
+    filenames: Sequence[str] | None = None,
+    dedup: DedupIndex | None = None,
+    retry: RetryPolicy = NO_RETRY,
+    restart: Callable[[], tuple["Hwp", TemplatePlan]] | None = None,
+) -> list[RowResult]:
+    """
+    템플릿이 열린 HWP 객체로 데이터프레임의 행마다 문서를 작성하고 저장합니다.
+
+    Args:
+        hwp (Hwp): 템플릿이 열린 HWP 객체
+        dataframe (DataFrame): 데이터프레임 객체 (전체 또는 일부 행)
+        output_folder (str): 출력 폴더 이름
+        workflow_name (str): 워크플로우 이름
+        field_mapping (Dict[str, str]): 필드 매핑 정보
+        filename_suffixes (List[str] | None): 저장할 파일 이름 접미사
+        key_columns (List[str] | None): 기본 열 이름들
+        batch_write (bool): 필드 일괄 입력 여부
+        reset_fields (bool): 행마다 매핑되지 않은 필드를 템플릿 기본값으로 되돌릴지 여부
+        formats (Sequence[ExportFormat]): 저장 형식 목록
+        total (int | None): 진행 상황 표시에 사용할 전체 행 수
+            - None인 경우, 전체 행 수 없이 행 번호만 표시
+        raise_errors (bool): 행 처리 중 오류 발생 시 예외를 그대로 발생시킬지 여부
+            - True인 경우, 재시도 정책의 시도를 모두 실패하면 예외 발생
+            - False인 경우, 오류를 RowResult.error에 기록하고 다음 행을 처리
+        plan (TemplatePlan | None): open_template이 반환한 템플릿 계획
+        manifest (RunManifest | None): 실행 기록
+            - 기록과 입력 행, 템플릿이 같고 파일이 남아 있는 행은 건너뛰고, 생성한 행은 기록
+        on_result (Callable[[RowResult], None] | None): 행이 끝날 때마다 결과를 전달받을 함수
+        filenames (Sequence[str] | None): OutputPlanner.plan으로 미리 정한 행 순서의 저장 파일 이름
+            - None인 경우, 이 행들만으로 계획 (다른 호출의 행과 이름이 겹치는지는 확인하지 않음)
+        dedup (DedupIndex | None): 중복 문서 색인
+            - 필드 값이 같은 문서가 이미 있으면 생성하지 않고 파일을 링크(복사)
+        retry (RetryPolicy): 행 생성 실패 시 재시도 정책 (기본은 재시도 없음)
+        restart (Callable[[], tuple[Hwp, TemplatePlan]] | None): HWP 객체 재시작 함수
+            - 재시도 정책이 재시작을 요청하면 호출하여, 템플릿이 다시 열린 새 HWP 객체와 계획을 받음
+            - None인 경우, 재시작 없이 같은 HWP 객체로 재시도
 
     Returns:
-        None
+        list[RowResult]: 행별 문서 생성 결과
     """
 
-    if field_mapping is None:
-        field_mapping = {col: col for col in dataframe.columns}
+    template_hash = plan.template_hash if plan is not None else ""
+    metrics = get_metrics()
+
+    planner = OutputPlanner(output_folder, workflow_name, filename_suffixes, key_columns)
+    if filenames is None:
+        filenames = planner.plan(dataframe)
+
+    # 매핑된 열만 한 번에 꺼내 두고 행마다 튜플로 전달 (행마다 pd.Series를 만들지 않음)
+    feed = RowFeed(dataframe, field_mapping)
 
-    with hwp_context(visible=False) as hwp:
-        # 템플릿 열기
-        _ = open_template(hwp, template_path)
+    results = []
+    for position, row in enumerate(feed):
+        started = time.perf_counter()
+        idx = feed.numbers[position]
+        progress = f"{idx}/{total}" if total is not None else f"{idx}"
+        metrics.event("row_start", message=f"문서 만드는중... ({progress})", index=idx)
 
-        # 문서 생성 및 저장
-        for index, row in dataframe.iterrows():
-            idx = int(str(index)) + 1
-            print(f"문서 만드는중... ({idx}/{len(dataframe)})")
+        save_filename = filenames[position]
 
-            write_fields(hwp, row, field_mapping)
+        result = None
+        message = None
+        save_path = planner.folder / save_filename
+        if manifest is not None or dedup is not None:
+            row_hash = hash_row(row, field_mapping)
 
-            if filename_suffixes is not None:
-                save_filename = f"{workflow_name}_{filename_suffixes[idx - 1]}"
-            elif key_columns is not None:
-                name_combined = "_".join(str(row[col]) for col in key_columns)
-                save_filename = f"{workflow_name}_{name_combined}"
+        if manifest is not None and manifest.is_current(save_filename, row_hash, template_hash):
+            message = f"변경 없음, 건너뜀 ({progress}): {save_filename}"
+            paths = manifest.entries[save_filename].paths
+            result = RowResult(index=idx, filename=save_filename, paths=paths, skipped=True)
+
+        source = dedup.get(row_hash) if dedup is not None and result is None else None
+        if source is not None:
+            try:
+                with metrics.timer("copy_document"):
+                    copied_paths = [str(p) for p in dedup.materialize(source[1], save_path)]
+            except OSError:
+                pass  # 원본 파일이 없어졌으면 새로 생성
+            else:
+                message = f"같은 내용 문서 복사 ({progress}): {save_filename} ← {source[0]}"
+                if manifest is not None:
+                    manifest.record(save_filename, row_hash, template_hash, copied_paths)
+                result = RowResult(
+                    index=idx, filename=save_filename, paths=copied_paths, source=source[0]
+                )
+
+        failures = 0
+        while result is None:
+            try:
+                with metrics.timer("write_fields"):
+                    write_fields(
+                        hwp, row, field_mapping, batch=batch_write, plan=plan, reset=reset_fields
+                    )
+                paths = export_document(hwp, save_path, formats=formats, replace=dedup is not None)
+            except Exception as e:
+                failures += 1
+                if not retry.should_retry(e, failures):
+                    if raise_errors:
+                        raise
+                    message = f"[✖] 문서 생성 실패 ({progress}, {failures}회 시도): {e}"
+                    result = RowResult(
+                        index=idx, filename=save_filename, error=repr(e), attempts=failures
+                    )
+                    break
+
+                delay = retry.delay(failures)
+                metrics.event(
+                    "row_retry",
+                    message=f"[!] 문서 생성 재시도 ({progress}, {failures}회 실패, {delay:.1f}초 후): {e}",
+                    labels={"error": type(e).__name__},
+                    index=idx,
+                    attempt=failures,
+                    error=repr(e),
+                )
+                time.sleep(delay)
+                if restart is not None and retry.should_restart(failures):
+                    hwp, plan = restart()
             else:
-                save_filename = f"{workflow_name}_{idx}"
+                saved_paths = [str(p) for p in paths]
+                if manifest is not None:
+                    manifest.record(save_filename, row_hash, template_hash, saved_paths)
+                result = RowResult(
+                    index=idx, filename=save_filename, paths=saved_paths, attempts=failures + 1
+                )
+
+        if dedup is not None and result.ok and result.source is None:
+            dedup.add(row_hash, save_filename, result.paths)
+
+        # 행 단위 이벤트 (건너뜀/실패/성공별 시간 분포)
+        status = "skipped" if result.skipped else "ok" if result.ok else "failed"
+        metrics.observe(
+            "row",
+            time.perf_counter() - started,
+            message=message,
+            labels={"status": status},
+            index=idx,
+            filename=save_filename,
+            error=result.error,
+        )
+
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
 
-            save_document(hwp, output_folder, save_filename)
+    return results
@@ -0,0 +1,201 @@
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Self
+
+from hwp.context import HWP_ERRORS, HwpFactory, create_hwp
+from hwp.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from pyhwpx import Hwp
+
+# 한글 프로그램(COM 서버)의 메모리 누수를 막기 위해 다시 시작하기 전까지 만들 문서 수
+DEFAULT_MAX_DOCUMENTS = 500
+
+
+def check_hwp(hwp: "Hwp") -> bool:
+    """
+    HWP 객체가 아직 응답하는지 확인합니다. (COM 서버가 종료되었으면 속성 조회에서 예외 발생)
+
+    Args:
+        hwp (Hwp): HWP 객체
+
+    Returns:
+        bool: 정상 여부
+    """
+    try:
+        _ = hwp.Version
+    except AttributeError:
+        return True  # 버전 정보가 없는 대체 객체(HwpxDocument)
+    except HWP_ERRORS as e:
+        get_metrics().event(
+            "hwp_unresponsive", message=f"한글 프로그램이 응답하지 않습니다: {e!r}", error=repr(e)
+        )
+        return False
+    return True
+
+
+class HwpSession:
+    """
+    여러 번의 문서 생성에 걸쳐 재사용하는 HWP 객체(한글 프로그램) 관리자입니다.
+
+    - 처음 사용할 때 한글 프로그램을 실행합니다. (lazy start)
+    - 빌려줄 때마다 응답 여부를 확인하고, 응답하지 않으면 다시 실행합니다.
+    - max_documents개의 문서를 만들었거나 사용 중 오류가 나면 종료하고 다음에 새로 실행합니다.
+
+    COM 객체는 만든 스레드에서만 사용할 수 있으므로, 세션은 스레드마다 따로 둡니다.
+    (hwp.jobs.JobRunner는 작업 스레드마다 세션을 하나씩 유지)
+
+    Example:
+        session = HwpSession(max_documents=200)
+        process_documents(..., session=session)  # 한글 프로그램 실행
+        process_documents(..., session=session)  # 같은 한글 프로그램 재사용
+        session.close()
+    """
+
+    def __init__(
+        self,
+        hwp_factory: HwpFactory | None = None,
+        visible: bool = False,
+        max_documents: int | None = DEFAULT_MAX_DOCUMENTS,
+        health_check: Callable[["Hwp"], bool] = check_hwp,
+    ):
+        """
+        Args:
+            hwp_factory (HwpFactory | None): HWP 객체 생성 함수
+                - None인 경우, create_hwp로 한글(HWP) 프로그램을 실행
+                - 예: functools.partial(FakeHwp, fields=[...])
+            visible (bool): HWP 창을 표시할지 여부
+            max_documents (int | None): 다시 시작하기 전까지 만들 문서 수 (None이면 제한 없음)
+            health_check (Callable[[Hwp], bool]): HWP 객체 응답 확인 함수
+        """
+        if max_documents is not None and max_documents < 1:
+            raise ValueError(f"max_documents는 1 이상이어야 합니다: {max_documents}")
+
+        self.hwp_factory = hwp_factory
+        self.visible = visible
+        self.max_documents = max_documents
+        self.health_check = health_check
+
+        self.hwp: Hwp | None = None
+        self.documents = 0  # 현재 HWP 객체로 만든 문서 수
+        self.starts = 0  # 한글 프로그램을 실행한 횟수
+        self.recycles = 0  # 한글 프로그램을 다시 시작한 횟수 (오류, 문서 수, 응답 없음)
+        self._lock = threading.RLock()
+
+    @property
+    def remaining(self) -> int | None:
+        """
+        다시 시작하기 전까지 더 만들 수 있는 문서 수 (제한이 없으면 None)
+        """
+        if self.max_documents is None:
+            return None
+        return max(self.max_documents - self.documents, 0)
+
+    def _start(self) -> "Hwp":
+        with get_metrics().timer("hwp_start") as timer:
+            if self.hwp_factory is None:
+                hwp = create_hwp(self.visible)
+            else:
+                hwp = self.hwp_factory()
+            timer.attrs["engine"] = type(hwp).__name__
+
+        self.hwp = hwp
+        self.documents = 0
+        self.starts += 1
+        return hwp
+
+    def _stop(self) -> None:
+        hwp, self.hwp = self.hwp, None
+        if hwp is None:
+            return
+        try:
+            hwp.clear()
+            hwp.quit()
+        except HWP_ERRORS as e:
+            # 이미 종료된 COM 서버는 닫을 수 없으므로 기록만 하고 새로 실행
+            get_metrics().event(
+                "hwp_stop_failed",
+                message=f"한글 프로그램을 종료하지 못했습니다: {e!r}",
+                error=repr(e),
+            )
+
+    def recycle(self, reason: str) -> None:
+        """
+        현재 HWP 객체를 종료합니다. 다음에 빌릴 때 새로 실행됩니다.
+
+        Args:
+            reason (str): 다시 시작하는 이유 (예: "error", "max_documents", "unhealthy")
+        """
+        with self._lock:
+            if self.hwp is None:
+                return
+            documents = self.documents
+            self._stop()
+            self.recycles += 1
+            get_metrics().event(
+                "hwp_recycle",
+                message=f"한글 프로그램을 다시 시작합니다. (사유: {reason}, 문서 {documents}건)",
+                labels={"reason": reason},
+                documents=documents,
+            )
+
+    def restart(self, reason: str) -> "Hwp":
+        """
+        현재 HWP 객체를 종료하고 바로 새로 실행합니다. (빌린 상태에서 재시도 전에 사용)
+
+        Args:
+            reason (str): 다시 시작하는 이유
+
+        Returns:
+            Hwp: 새 HWP 객체
+        """
+        with self._lock:
+            self.recycle(reason)
+            return self._start()
+
+    @contextmanager
+    def lease(self) -> Iterator["Hwp"]:
+        """
+        HWP 객체를 빌려줍니다. with 블록이 끝날 때까지 다른 스레드는 기다립니다.
+        블록 안에서 예외가 발생하면 HWP 객체를 종료하고 예외를 다시 발생시킵니다.
+
+        Returns:
+            Hwp: 응답이 확인된 HWP 객체
+        """
+        with self._lock:
+            if self.hwp is not None and not self.health_check(self.hwp):
+                self.recycle("unhealthy")
+            hwp = self.hwp if self.hwp is not None else self._start()
+
+            try:
+                yield hwp
+            except BaseException:
+                self.recycle("error")
+                raise
+
+            if self.remaining == 0:
+                self.recycle("max_documents")
+
+    def count_documents(self, count: int = 1) -> None:
+        """
+        빌린 HWP 객체로 만든 문서 수를 더합니다. (max_documents에 도달하면 lease가 끝날 때 다시 시작)
+
+        Args:
+            count (int): 만든 문서 수
+        """
+        with self._lock:
+            self.documents += count
+
+    def close(self) -> None:
+        """
+        HWP 객체를 종료합니다. (세션은 다시 사용할 수 있으며, 다음에 빌릴 때 새로 실행)
+        """
+        with self._lock:
+            self._stop()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
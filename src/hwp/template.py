@@ -1,21 +1,300 @@
-from pyhwpx import Hwp
+import hashlib
+import os
+import re
+from pathlib import Path
+from tempfile import gettempdir
+from typing import TYPE_CHECKING
 
+from pydantic import BaseModel, PrivateAttr
 
-def open_template(hwp: Hwp, path: str) -> list[str]:
+from hwp.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from pyhwpx import Hwp
+
+# HWP 자동화 API의 필드/값 목록 구분자
+FIELD_SEPARATOR = "\x02"
+
+# "필드명{{0}}" 형식의 인스턴스 번호 접미사
+FIELD_INSTANCE_PATTERN = re.compile(r"^(?P<name>.*)\{\{(?P<index>\d+)\}\}$")
+
+# 템플릿 계획 JSON 캐시 폴더
+PLAN_CACHE_DIR = Path(gettempdir()) / "autohwp" / ".plans"
+
+# HWP 객체 종류와 템플릿 내용 해시별 템플릿 계획 (프로세스 내 캐시)
+_PLAN_CACHE: dict[str, "TemplatePlan"] = {}
+
+
+class FieldSlot(BaseModel):
+    """
+    템플릿 안의 필드 인스턴스 하나의 위치입니다.
+    """
+
+    field: str  # 인스턴스 번호가 붙은 필드 이름 (예: "성명{{1}}")
+    name: str  # 필드 이름 (예: "성명")
+    instance: int  # 같은 이름 안에서의 인스턴스 번호
+    offset: int  # 문서 순서의 필드 위치 (HwpxDocument에서는 값 자리 번호)
+
+
+class FieldBinding:
+    """
+    필드 매핑을 템플릿 계획에 맞춰 미리 풀어 둔 결과입니다.
+    매핑의 필드 하나가 여러 인스턴스를 가리키면 인스턴스마다 자리가 하나씩 생깁니다.
+    """
+
+    def __init__(
+        self,
+        fields: list[str],
+        offsets: list[int],
+        columns: list[str | None],
+        defaults: list[str] | None = None,
+    ):
+        """
+        Args:
+            fields (list[str]): 자리별 필드 이름 (인스턴스 번호 포함)
+            offsets (list[int]): 자리별 필드 위치
+            columns (list[str | None]): 자리별 데이터프레임 열 이름
+                - None인 자리는 매핑되지 않은 필드로, defaults의 템플릿 기본값을 입력
+            defaults (list[str] | None): 자리별 템플릿 기본값 (초기화 자리 목록인 경우)
+        """
+        self.fields = fields
+        self.offsets = offsets
+        self.columns = columns
+        self.defaults = defaults if defaults is not None else [""] * len(fields)
+        self.field_string = FIELD_SEPARATOR.join(fields)
+
+        # 매핑되지 않은 자리만 모은 초기화 목록 (필드마다 입력하는 경우 한 번에 되돌리는 데 사용)
+        unmapped = [i for i, column in enumerate(columns) if column is None]
+        self.unmapped_field_string = FIELD_SEPARATOR.join(fields[i] for i in unmapped)
+        self.unmapped_values = FIELD_SEPARATOR.join(self.defaults[i] for i in unmapped)
+
+
+class TemplatePlan(BaseModel):
+    """
+    템플릿을 분석한 결과(필드별 인스턴스와 위치)를 담은 계획입니다.
+    템플릿 내용의 해시로 캐시되며, JSON으로 저장하고 불러올 수 있습니다.
+    """
+
+    template_hash: str
+    fields: dict[str, list[FieldSlot]]  # 필드 이름별 인스턴스 목록 (처음 나온 순서)
+    defaults: list[str] | None = None  # 템플릿을 처음 열었을 때의 필드 값 (문서 순서)
+
+    _bindings: dict[tuple, FieldBinding] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def from_field_list(cls, template_hash: str, field_names: list[str]) -> "TemplatePlan":
+        """
+        get_field_list 형식의 필드 이름 목록으로 계획을 만듭니다.
+
+        Args:
+            template_hash (str): 템플릿 내용 해시
+            field_names (list[str]): 문서 순서의 필드 이름 목록
+                - 인스턴스 번호가 없으면 같은 이름이 나온 순서로 번호를 매김
+
+        Returns:
+            TemplatePlan: 템플릿 계획
+        """
+        fields: dict[str, list[FieldSlot]] = {}
+        for offset, field in enumerate(field_names):
+            match = FIELD_INSTANCE_PATTERN.match(field)
+            name = match["name"] if match else field
+            slots = fields.setdefault(name, [])
+            instance = int(match["index"]) if match else len(slots)
+            slots.append(
+                FieldSlot(
+                    field=f"{name}{{{{{instance}}}}}",
+                    name=name,
+                    instance=instance,
+                    offset=offset,
+                )
+            )
+
+        return cls(template_hash=template_hash, fields=fields)
+
+    @property
+    def field_names(self) -> list[str]:
+        """
+        문서 순서의 필드 이름 목록 (인스턴스 번호 포함)
+        """
+        slots = sorted(
+            (slot for slots in self.fields.values() for slot in slots),
+            key=lambda slot: slot.offset,
+        )
+        return [slot.field for slot in slots]
+
+    def resolve(self, field: str) -> list[FieldSlot]:
+        """
+        필드 이름이 가리키는 인스턴스 목록을 반환합니다.
+
+        Args:
+            field (str): 필드 이름 ("필드명{{0}}" 또는 "필드명")
+
+        Returns:
+            list[FieldSlot]: 인스턴스 목록 (없으면 빈 리스트)
+        """
+        match = FIELD_INSTANCE_PATTERN.match(field)
+        if match is None:
+            return list(self.fields.get(field, []))
+
+        instance = int(match["index"])
+        return [slot for slot in self.fields.get(match["name"], []) if slot.instance == instance]
+
+    def bind(self, mapping: dict[str, str], reset: bool = False) -> FieldBinding:
+        """
+        필드 매핑을 인스턴스 단위의 자리 목록으로 풉니다. (매핑별로 한 번만 계산)
+
+        Args:
+            mapping (dict[str, str]): 필드와 컬럼 매핑 딕셔너리
+            reset (bool): 템플릿의 모든 필드 자리를 포함할지 여부
+                - True이고 템플릿 기본값(defaults)이 있으면, 매핑되지 않은 자리도 기본값으로 포함하여
+                  한 번의 입력으로 문서 전체가 템플릿을 새로 연 상태와 같아짐
+
+        Returns:
+            FieldBinding: 자리별 필드 이름, 위치, 열 이름
+        """
+        reset = reset and self.defaults is not None
+        key = (tuple(mapping.items()), reset)
+        if key in self._bindings:
+            return self._bindings[key]
+
+        fields, offsets, columns = [], [], []
+        for field, column in mapping.items():
+            slots = self.resolve(field)
+            if not slots:
+                get_metrics().event(
+                    "missing_field", message=f"[✖] 템플릿에 없는 필드입니다: {field}", field=field
+                )
+            for slot in slots:
+                fields.append(slot.field)
+                offsets.append(slot.offset)
+                columns.append(column)
+
+        if reset:
+            # 문서 순서의 전체 자리에 열 이름을 배정 (같은 자리를 여러 번 매핑하면 나중 것이 적용)
+            assigned = dict(zip(offsets, columns))
+            fields = self.field_names
+            offsets = list(range(len(fields)))
+            columns = [assigned.get(offset) for offset in offsets]
+            binding = FieldBinding(fields, offsets, columns, defaults=self.defaults)
+        else:
+            binding = FieldBinding(fields, offsets, columns)
+
+        self._bindings[key] = binding
+        return binding
+
+    def save(self, path: str | Path) -> None:
+        """
+        계획을 JSON 파일로 저장합니다.
+
+        Args:
+            path (str | Path): 저장 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 여러 작업 프로세스가 동시에 저장해도 깨진 파일이 남지 않도록 교체 방식으로 저장
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(self.model_dump_json(), encoding="utf-8")
+        temp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "TemplatePlan":
+        """
+        JSON 파일에서 계획을 불러옵니다.
+
+        Args:
+            path (str | Path): JSON 파일 경로
+
+        Returns:
+            TemplatePlan: 템플릿 계획
+        """
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+def hash_template(path: str | Path) -> str:
     """
-    HWP 템플릿을 열고 필드 목록을 반환합니다.
+    템플릿 파일 내용의 SHA-256 해시를 반환합니다.
+
+    Args:
+        path (str | Path): 템플릿 파일 경로
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def open_template(
+    hwp: "Hwp",
+    path: str,
+    plan: TemplatePlan | None = None,
+    cache_dir: str | Path | None = PLAN_CACHE_DIR,
+) -> TemplatePlan:
+    """
+    HWP 템플릿을 열고 템플릿 계획(필드 목록과 위치)을 반환합니다.
+    같은 내용의 템플릿은 필드 분석을 다시 하지 않고 캐시된 계획을 사용합니다.
 
     Args:
         hwp (Hwp): HWP 객체
         path (str): 템플릿 파일 경로
+        plan (TemplatePlan | None): 미리 만든 템플릿 계획
+            - 템플릿 해시가 같으면 분석 없이 그대로 사용
+        cache_dir (str | Path | None): 계획 JSON을 저장하는 캐시 폴더
+            - None인 경우, 메모리 캐시만 사용
 
     Returns:
-        list[str]: 필드 이름 목록
+        TemplatePlan: 템플릿 계획 (필드 이름 목록은 plan.field_names)
     """
+    metrics = get_metrics()
 
-    hwp.open(path)
+    with metrics.timer("open_document"):
+        hwp.open(path)
     # print("Opened document title:", hwp.get_title())
 
+    # 계획을 어디서 가져왔는지(given, memory, disk, analyzed)별로 시간을 집계
+    with metrics.timer("open_template") as timer:
+        plan, source = _resolve_plan(hwp, path, plan, cache_dir)
+        timer.labels = {"source": source}
+        timer.attrs["fields"] = len(plan.field_names)
+
+    return plan
+
+
+def _resolve_plan(
+    hwp: "Hwp",
+    path: str,
+    plan: TemplatePlan | None,
+    cache_dir: str | Path | None,
+) -> tuple[TemplatePlan, str]:
+    """
+    열린 템플릿의 계획과 계획을 가져온 곳을 반환합니다.
+    """
+    template_hash = hash_template(path)
+    if plan is not None and plan.template_hash == template_hash:
+        if plan.defaults is None:
+            plan.defaults = read_field_values(hwp, plan.field_names)
+        return plan, "given"
+
+    # 같은 템플릿이라도 HWP 객체 종류(Hwp, HwpxDocument, FakeHwp)별로 따로 캐시
+    cache_key = f"{type(hwp).__name__}_{template_hash}"
+    if cache_key in _PLAN_CACHE:
+        return _PLAN_CACHE[cache_key], "memory"
+
+    cache_path = Path(cache_dir) / f"{cache_key}.json" if cache_dir is not None else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            plan = TemplatePlan.load(cache_path)
+        except ValueError:
+            plan = None  # 손상된 캐시는 무시하고 다시 분석
+        # 기본값이 없는 이전 형식의 캐시도 다시 분석
+        if plan is not None and plan.defaults is not None:
+            _PLAN_CACHE[cache_key] = plan
+            return plan, "disk"
+
     fields_hwp = hwp.get_field_list()
     # fields_hwp = "title{{0}}\x02body{{0}}\x02title{{1}}\x02body{{1}}\x02footer{{0}}"
     # 구분자 "\x02"로 필드를 나눔
@@ -24,7 +303,94 @@ def open_template(hwp: Hwp, path: str) -> list[str]:
     # fields = [ "title{{0}}", "body{{0}}", "title{{1}}", "body{{1}}", "footer{{0}}" ]
 
     # 필드 이름을 추출하여 리스트로 변환
-    fields = [field.strip() for field in fields_hwp.split("\x02") if field.strip()]
+    fields = [field.strip() for field in fields_hwp.split(FIELD_SEPARATOR) if field.strip()]
     # print("Total number of fields:", len(fields))
 
-    return fields
+    plan = TemplatePlan.from_field_list(template_hash, fields)
+    # 행마다 매핑되지 않은 필드를 되돌릴 수 있도록, 열린 직후의 필드 값을 함께 저장
+    plan.defaults = read_field_values(hwp, plan.field_names)
+    _PLAN_CACHE[cache_key] = plan
+    if cache_path is not None:
+        plan.save(cache_path)
+
+    return plan, "analyzed"
+
+
+def read_field_values(hwp: "Hwp", field_names: list[str]) -> list[str]:
+    """
+    필드들의 현재 값을 한 번의 get_field_text 호출로 읽습니다.
+
+    Args:
+        hwp (Hwp): HWP 객체
+        field_names (list[str]): 인스턴스 번호가 붙은 필드 이름 목록
+
+    Returns:
+        list[str]: 필드별 값 (필드 이름 목록과 같은 길이)
+    """
+    if not field_names:
+        return []
+
+    values = str(hwp.get_field_text(FIELD_SEPARATOR.join(field_names))).split(FIELD_SEPARATOR)
+    # 값 개수가 맞지 않으면(빈 응답 등) 빈 값으로 채움
+    return (values + [""] * len(field_names))[: len(field_names)]
+
+
+def number_field_names(names: list[str]) -> list[str]:
+    """
+    문서 순서의 필드 이름 목록에 인스턴스 번호 접미사를 붙입니다.
+    (HWP get_field_list(number=1)과 같은 형식)
+
+    Args:
+        names (list[str]): 문서 순서의 필드 이름 목록
+            - 예: ["title", "body", "title"]
+
+    Returns:
+        list[str]: 인스턴스 번호가 붙은 필드 이름 목록
+            - 예: ["title{{0}}", "body{{0}}", "title{{1}}"]
+    """
+    seen: dict[str, int] = {}
+    numbered = []
+    for name in names:
+        index = seen.get(name, 0)
+        seen[name] = index + 1
+        numbered.append(f"{name}{{{{{index}}}}}")
+
+    return numbered
+
+
+def index_field_instances(names: list[str]) -> dict[str, list[int]]:
+    """
+    문서 순서의 필드 이름 목록에서 필드 이름별 위치 목록을 만듭니다.
+
+    Args:
+        names (list[str]): 문서 순서의 필드 이름 목록
+
+    Returns:
+        dict[str, list[int]]: 필드 이름별 위치 목록 (인스턴스 번호 순)
+    """
+    index: dict[str, list[int]] = {}
+    for position, name in enumerate(names):
+        index.setdefault(name, []).append(position)
+
+    return index
+
+
+def resolve_field_instances(index: dict[str, list[int]], field: str) -> list[int]:
+    """
+    필드 이름이 가리키는 위치 목록을 반환합니다.
+
+    Args:
+        index (dict[str, list[int]]): index_field_instances로 만든 필드 위치 색인
+        field (str): 필드 이름
+            - "필드명{{0}}"처럼 인스턴스 번호가 있으면 해당 인스턴스만
+            - 번호가 없으면 같은 이름의 모든 인스턴스
+
+    Returns:
+        list[int]: 필드 위치 목록 (없으면 빈 리스트)
+    """
+    match = FIELD_INSTANCE_PATTERN.match(field)
+    if match is None:
+        return index.get(field, [])
+
+    index_number = int(match["index"])
+    return index.get(match["name"], [])[index_number : index_number + 1]
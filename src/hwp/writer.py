@@ -1,19 +1,92 @@
+from typing import TYPE_CHECKING, Any
+
 import pandas as pd
-from pyhwpx import Hwp
 
+from hwp.template import FIELD_SEPARATOR, TemplatePlan
+
+if TYPE_CHECKING:
+    from pyhwpx import Hwp
+
+    from hwp.rows import FeedRow
 
-def write_fields(hwp: Hwp, row: pd.Series, mapping: dict[str, str]) -> None:
+
+def write_fields(
+    hwp: "Hwp",
+    row: "pd.Series | FeedRow",
+    mapping: dict[str, str],
+    batch: bool = False,
+    plan: TemplatePlan | None = None,
+    reset: bool = False,
+) -> None:
     """
     HWP 필드에 DataFrame 행 데이터를 입력합니다.
 
     Args:
         hwp (Hwp): HWP 객체
-        row (pd.Series): 데이터프레임의 행
+        row (pd.Series | FeedRow): 데이터프레임의 행 (hwp.rows.RowFeed의 행도 가능)
         mapping (dict[str, str]): 필드와 컬럼 매핑 딕셔너리
+        batch (bool): 일괄 입력 여부
+            - True인 경우, 모든 필드를 "\\x02"로 이어붙여 put_field_text를 한 번만 호출
+            - False인 경우, 필드마다 put_field_text를 호출
+        plan (TemplatePlan | None): 템플릿 계획
+            - 일괄 입력 시, 매핑을 계획의 필드 인스턴스로 미리 풀어 둔 결과를 재사용
+            - HWP 객체가 put_slot_text를 지원하면(HwpxDocument) 필드 위치에 바로 입력
+        reset (bool): 매핑되지 않은 필드를 템플릿 기본값으로 되돌릴지 여부
+            - 템플릿을 한 번 열고 행마다 덮어쓰므로, 되돌리지 않으면 앞 행에서 입력된 값이 남을 수 있음
+            - 템플릿 계획에 기본값(TemplatePlan.defaults)이 있어야 하며, 일괄 입력 시 추가 호출 없이
+              같은 put_field_text 호출에 포함됨 (필드마다 입력하는 경우 호출 한 번 추가)
 
     Returns:
         None
+
+    Raises:
+        ValueError: reset이 True인데 기본값이 있는 템플릿 계획이 없는 경우
     """
+    if reset and (plan is None or plan.defaults is None):
+        # 기본값을 모르면 되돌릴 수 없으므로, 앞 행의 값이 조용히 남지 않도록 미리 알림
+        raise ValueError("필드를 되돌리려면 기본값이 있는 템플릿 계획(plan)이 필요합니다.")
+
+    if batch and plan is not None:
+        binding = plan.bind(mapping, reset=reset)
+        values = [
+            to_field_text(row[col]) if col is not None else default
+            for col, default in zip(binding.columns, binding.defaults)
+        ]
+        if hasattr(hwp, "put_slot_text"):
+            hwp.put_slot_text(binding.offsets, values)
+        else:
+            hwp.put_field_text(binding.field_string, FIELD_SEPARATOR.join(values))
+        return
+
+    if batch:
+        field_names = FIELD_SEPARATOR.join(mapping.keys())
+        field_values = FIELD_SEPARATOR.join(to_field_text(row[col]) for col in mapping.values())
+        hwp.put_field_text(field_names, field_values)
+        return
+
+    if reset and plan is not None:
+        binding = plan.bind(mapping, reset=True)
+        if binding.unmapped_field_string:
+            hwp.put_field_text(binding.unmapped_field_string, binding.unmapped_values)
+
     for field_name, column_name in mapping.items():
-        column_value = row[column_name]
+        # 빈 값(None, NaN)도 빈 문자열로 입력해야 앞 행의 값이 남지 않음
+        column_value = to_field_text(row[column_name])
         hwp.put_field_text(field_name, column_value)
+
+
+def to_field_text(value: Any) -> str:
+    """
+    필드에 입력할 값을 문자열로 변환합니다.
+
+    Args:
+        value (Any): 셀 값
+
+    Returns:
+        str: 필드 입력 문자열
+            - None 또는 NaN은 빈 문자열로 변환
+            - 구분자("\\x02")는 목록을 깨뜨리므로 제거
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    return str(value).replace(FIELD_SEPARATOR, "")
@@ -0,0 +1,108 @@
+import hashlib
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from hwp.field_mapper import ColumnIndex, MappingStore
+from hwp.template import open_template
+from ui.jobs import get_job_runner
+
+
+def hash_content(content: bytes) -> str:
+    """
+    업로드 파일 내용의 SHA-256 해시를 반환합니다. (캐시 키로 사용)
+
+    Args:
+        content (bytes): 파일 내용
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+@st.cache_data(max_entries=64, show_spinner="양식 필드를 읽는 중...")
+def load_template_fields(content_hash: str, _template_path: str) -> list[str]:
+    """
+    HWP 양식의 필드 이름 목록을 반환합니다.
+    같은 내용의 양식은 세션과 사용자에 관계없이 한 번만 한글(HWP) 프로그램으로 분석합니다.
+    한글 프로그램은 새로 실행하지 않고 문서 생성 작업 관리자의 HWP 세션을 재사용합니다.
+    (문서 생성 작업이 실행 중이면 작업이 끝난 뒤 분석)
+
+    Args:
+        content_hash (str): 양식 파일 내용 해시 (캐시 키)
+        _template_path (str): 양식 파일 경로 (캐시 키에서 제외, 처음 분석할 때만 사용)
+
+    Returns:
+        list[str]: 문서 순서의 필드 이름 목록 (인스턴스 번호 포함)
+    """
+
+    def read_fields(session):
+        with session.lease() as hwp:
+            return open_template(hwp, _template_path).field_names
+
+    return get_job_runner().call(read_fields)
+
+
+@st.cache_data(max_entries=16, show_spinner="엑셀 파일을 읽는 중...")
+def load_excel(content_hash: str, _content: bytes) -> pd.DataFrame:
+    """
+    엑셀 파일을 데이터프레임으로 읽습니다.
+    같은 내용의 파일은 세션과 사용자에 관계없이 한 번만 읽고, 호출마다 복사본을 반환합니다.
+
+    Args:
+        content_hash (str): 엑셀 파일 내용 해시 (캐시 키)
+        _content (bytes): 엑셀 파일 내용 (캐시 키에서 제외)
+
+    Returns:
+        pd.DataFrame: 첫 번째 시트의 데이터프레임
+    """
+    return pd.read_excel(BytesIO(_content))
+
+
+@st.cache_resource(max_entries=16)
+def column_index(columns: tuple[str, ...]) -> ColumnIndex:
+    """
+    엑셀 열 이름의 자동 매칭 색인을 반환합니다. 같은 열 구성이면 한 번만 만듭니다.
+
+    Args:
+        columns (tuple[str, ...]): 열 이름 목록 (캐시 키)
+
+    Returns:
+        ColumnIndex: 열 이름 n-gram 색인
+    """
+    return ColumnIndex(columns)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def saved_field_settings(
+    fields: tuple[str, ...], columns: tuple[str, ...], options: tuple[str, ...] = ()
+) -> dict[str, dict] | None:
+    """
+    같은 양식 필드와 엑셀 열 구성으로 저장해 둔 필드 매칭 설정을 반환합니다.
+
+    Args:
+        fields (tuple[str, ...]): 양식 필드 이름 목록
+        columns (tuple[str, ...]): 엑셀 열 이름 목록
+        options (tuple[str, ...]): 열 이름 외의 선택지 (예: "사용자 지정")
+
+    Returns:
+        dict[str, dict] | None: 필드별 {"columns": [...], "fixed_value": str} (없으면 None)
+    """
+    return MappingStore().load(fields, columns, options=options)
+
+
+def save_field_settings(
+    fields: tuple[str, ...], columns: tuple[str, ...], field_settings: dict[str, dict]
+) -> None:
+    """
+    확정된 필드 매칭 설정을 저장합니다. (다음에 같은 양식과 엑셀을 올리면 기본값으로 사용)
+
+    Args:
+        fields (tuple[str, ...]): 양식 필드 이름 목록
+        columns (tuple[str, ...]): 엑셀 열 이름 목록
+        field_settings (dict[str, dict]): 필드별 {"columns": [...], "fixed_value": str}
+    """
+    MappingStore().save(fields, columns, field_settings)
+    saved_field_settings.clear()
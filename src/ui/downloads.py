@@ -0,0 +1,147 @@
+import tempfile
+from math import ceil
+from pathlib import Path
+
+import streamlit as st
+
+from hwp.bundle import write_bundle
+
+ICON_FOLDER = Path(__file__).parent.parent / "icons"
+ICON_FILES = {
+    ".hwp": "hwp_icon.png",
+    ".pdf": "pdf_icon.png",
+    "default": "default_icon.png",
+}
+MIME_TYPES = {
+    ".hwp": "application/x-hwp",
+    ".hwpx": "application/hwp+zip",
+    ".pdf": "application/pdf",
+}
+
+
+@st.cache_data(show_spinner=False)
+def load_icon(suffix: str) -> bytes:
+    """
+    파일 형식 아이콘 이미지를 읽습니다. (세션과 재실행에 걸쳐 한 번만 읽음)
+
+    Args:
+        suffix (str): 파일 확장자 (예: ".hwp")
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    icon_file = ICON_FILES.get(suffix, ICON_FILES["default"])
+    return (ICON_FOLDER / icon_file).read_bytes()
+
+
+def list_output_files(output_folder: str | Path, patterns: tuple[str, ...]) -> list[Path]:
+    """
+    출력 폴더의 생성 문서 목록을 반환합니다. (파일 내용은 읽지 않음)
+
+    Args:
+        output_folder (str | Path): 출력 폴더 경로
+        patterns (tuple[str, ...]): 파일 패턴 목록 (예: ("*.hwp", "*.pdf"))
+
+    Returns:
+        list[Path]: 파일 이름 순으로 정렬된 파일 경로 목록
+    """
+    folder = Path(output_folder)
+    return sorted(
+        (file for pattern in patterns for file in folder.glob(pattern)),
+        key=lambda file: file.name,
+    )
+
+
+def render_file_browser(
+    output_folder: str | Path,
+    workflow_name: str,
+    patterns: tuple[str, ...] = ("*.hwp", "*.pdf"),
+    page_size: int = 24,
+    columns: int = 6,
+) -> None:
+    """
+    생성된 문서 목록을 페이지 단위로 표시합니다.
+    파일 내용은 다운로드를 요청한 파일만 읽고, 전체 다운로드는 ZIP 파일로 제공합니다.
+
+    Args:
+        output_folder (str | Path): 출력 폴더 경로
+        workflow_name (str): 워크플로우 이름 (표시 파일명에서 접두사 제거에 사용)
+        patterns (tuple[str, ...]): 표시할 파일 패턴 목록
+        page_size (int): 한 페이지의 파일 수
+        columns (int): 한 줄의 파일 수
+    """
+    file_paths = list_output_files(output_folder, patterns)
+
+    st.header("생성된 문서")
+    if not file_paths:
+        st.write(
+            "<span style='color: gray; font-size: 14px'> 생성된 문서가 없습니다.</span>",
+            unsafe_allow_html=True,
+        )
+        return
+
+    st.write(
+        """<span style='color: gray; font-size: 14px'>
+            파일을 선택해 다운로드합니다.
+            <br>파일명은 워크플로우 이름을 기준으로 생성됩니다. (예: 20XX_양식문서_홍길동.hwp)
+        </span>""",
+        unsafe_allow_html=True,
+    )
+
+    # 전체 다운로드 (ZIP 파일은 요청했을 때만 디스크에 만들고, 파일 핸들로 전달)
+    zip_col, layout_col, page_col = st.columns([2, 1, 2], vertical_alignment="bottom")
+    with layout_col:
+        layout = st.selectbox(
+            "ZIP 폴더 구성",
+            options=["flat", "key"],
+            format_func=lambda value: {"flat": "폴더 없이", "key": "문서별 폴더"}[value],
+        )
+    with zip_col:
+        if st.button(f"모두 다운로드 준비 (ZIP, {len(file_paths)}개)", use_container_width=True):
+            zip_path = Path(tempfile.gettempdir()) / "autohwp" / f"{Path(output_folder).name}.zip"
+            with st.spinner("ZIP 파일 만드는 중..."):
+                zip_path = write_bundle(file_paths, zip_path, layout=layout)
+                st.session_state["download_zip_path"] = str(zip_path)
+
+        zip_path = st.session_state.get("download_zip_path")
+        if zip_path and Path(zip_path).exists():
+            with open(zip_path, "rb") as file:
+                st.download_button(
+                    "ZIP 다운로드",
+                    data=file,
+                    file_name=Path(zip_path).name,
+                    mime="application/zip",
+                    type="primary",
+                    use_container_width=True,
+                )
+
+    pages = ceil(len(file_paths) / page_size)
+    with page_col:
+        page = st.number_input(
+            f"페이지 (전체 {pages})", min_value=1, max_value=pages, value=1, step=1
+        )
+
+    page_files = file_paths[(page - 1) * page_size : page * page_size]
+    selected = st.session_state.get("download_file")
+
+    for start in range(0, len(page_files), columns):
+        for column, file_path in zip(st.columns(columns), page_files[start : start + columns]):
+            with column:
+                suffix = file_path.suffix.lower()
+                st.image(load_icon(suffix), width=48)
+                st.caption(file_path.name.replace(f"{workflow_name}_", ""))
+
+                if selected == str(file_path) and file_path.exists():
+                    # 선택한 파일만 디스크에서 읽어 다운로드 버튼으로 전달
+                    with open(file_path, "rb") as file:
+                        st.download_button(
+                            "저장",
+                            data=file,
+                            file_name=file_path.name,
+                            mime=MIME_TYPES.get(suffix, "application/octet-stream"),
+                            key=f"download_{file_path.name}",
+                            type="primary",
+                        )
+                elif st.button("다운로드", key=f"select_{file_path.name}"):
+                    st.session_state["download_file"] = str(file_path)
+                    st.rerun()
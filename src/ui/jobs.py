@@ -0,0 +1,67 @@
+import streamlit as st
+
+from hwp.jobs import JobRunner
+
+
+@st.cache_resource
+def get_job_runner() -> JobRunner:
+    """
+    모든 세션이 함께 사용하는 문서 생성 작업 관리자를 반환합니다.
+    페이지를 다시 실행해도 같은 작업 관리자(와 실행 중인 작업)를 사용합니다.
+
+    Returns:
+        JobRunner: 작업 관리자 (동시에 HWP 프로그램 하나만 실행)
+    """
+    return JobRunner(max_workers=1)
+
+
+@st.fragment(run_every=1.0)
+def render_job_progress() -> None:
+    """
+    현재 세션의 문서 생성 작업 진행 상황을 표시합니다. (1초마다 이 부분만 다시 실행)
+    작업이 끝나면 전체 페이지를 한 번 다시 실행해 생성된 문서 목록을 갱신합니다.
+    """
+    job_id = st.session_state.get("job_id")
+    if job_id is None:
+        # 끝난 작업의 결과 메시지
+        if "job_message" in st.session_state:
+            level, message = st.session_state["job_message"]
+            getattr(st, level)(message)
+        return
+
+    runner = get_job_runner()
+    try:
+        status = runner.status(job_id)
+    except KeyError:
+        del st.session_state["job_id"]
+        return
+
+    if not status.finished:
+        if status.state == "queued":
+            st.info("다른 작업이 끝나기를 기다리는 중입니다...")
+        else:
+            total = status.total or 0
+            ratio = min(status.done / total, 1.0) if total else 0.0
+            text = f"문서 생성 중... ({status.done}/{total or '?'})"
+            if status.last:
+                text += f" {status.last}"
+            st.progress(ratio, text=text)
+
+        if st.button("취소", key=f"cancel_{job_id}"):
+            runner.cancel(job_id)
+        return
+
+    if status.state == "done" and status.failed:
+        message = ("warning", f"문서 생성 완료 (실패 {status.failed}건)")
+    elif status.state == "done":
+        message = ("success", "문서 생성 완료!")
+    elif status.state == "cancelled":
+        message = ("warning", f"문서 생성이 취소되었습니다. ({status.done}건 완료)")
+    else:
+        message = ("error", f"문서 생성 실패: {status.error}")
+
+    # 끝난 작업은 목록에서 지우고, 파일 목록을 갱신하기 위해 전체 페이지를 다시 실행
+    st.session_state["job_message"] = message
+    runner.forget(job_id)
+    del st.session_state["job_id"]
+    st.rerun(scope="app")
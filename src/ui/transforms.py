@@ -0,0 +1,221 @@
+from collections.abc import Hashable
+from typing import Any
+
+import pandas as pd
+
+from excel.josa import apply_josa
+
+# 필드 매칭의 특수 선택지 (엑셀 컬럼이 아님)
+CUSTOM_VALUE = "사용자 지정"
+JOSA_VALUE = "조사(은/는)"
+
+
+def convert_column(series: pd.Series, dtype: str, fmt: str) -> pd.Series:
+    """
+    컬럼 하나에 데이터 타입과 포맷을 적용합니다.
+
+    Args:
+        series (pd.Series): 원본 컬럼
+        dtype (str): 데이터 타입 ("문자열", "숫자", "날짜")
+        fmt (str): 포맷
+            - 날짜: strftime 형식 (예: "%Y.%m.%d.")
+            - 숫자: "#,##0", "0", "0.00", "0.##"
+
+    Returns:
+        pd.Series: 변환된 컬럼 (변환 실패 시 원본)
+    """
+    if dtype == "날짜":
+        try:
+            return pd.to_datetime(series).dt.strftime(fmt)
+        except (ValueError, TypeError, OverflowError):
+            return series  # 변환 실패 시 원본 유지
+
+    if dtype == "숫자":
+        try:
+            numbers = pd.to_numeric(series)
+        except (ValueError, TypeError, OverflowError):
+            return series
+
+        if fmt == "#,##0":
+            return numbers.map("{:,.0f}".format)
+        elif fmt == "0":
+            return numbers.map("{:.0f}".format)
+        elif fmt == "0.00":
+            return numbers.map("{:.2f}".format)
+        elif fmt == "0.##":
+            return numbers.map(lambda x: f"{x:.2f}".rstrip("0").rstrip("."))
+        return numbers
+
+    return series
+
+
+def to_text(series: pd.Series) -> pd.Series:
+    """
+    컬럼 값을 문자열로 변환합니다. (행 단위 row.values.astype(str)와 같은 결과, NaN은 "nan")
+
+    Args:
+        series (pd.Series): 컬럼
+
+    Returns:
+        pd.Series: 문자열 컬럼
+    """
+    return pd.Series(series.astype(object).to_numpy().astype(str), index=series.index, dtype=object)
+
+
+def join_columns(columns: list[pd.Series], sep: str) -> pd.Series:
+    """
+    여러 컬럼의 값을 구분자로 이어붙입니다. (벡터 연산)
+
+    Args:
+        columns (list[pd.Series]): 컬럼 목록
+        sep (str): 구분자
+
+    Returns:
+        pd.Series: 이어붙인 문자열 컬럼
+    """
+    texts = [to_text(column) for column in columns]
+    if len(texts) == 1:
+        return texts[0]
+    return texts[0].str.cat(texts[1:], sep=sep)
+
+
+class TransformGraph:
+    """
+    엑셀 컬럼 변환(converted_df)과 필드 값 생성(field_df)의 결과를 설정별로 캐시합니다.
+
+    컬럼 변환은 (데이터 버전, 컬럼, 데이터 타입, 포맷)으로, 필드 값은 (입력 컬럼의 변환 키, 선택 컬럼,
+    사용자 지정 값)으로 식별하므로, 위젯 하나를 바꾸면 그 설정에 의존하는 컬럼과 필드만 다시 계산합니다.
+    컬럼과 필드마다 마지막 결과 하나만 보관합니다.
+
+    Streamlit 세션 상태(st.session_state)에 보관해서 재실행 사이에 재사용합니다.
+    """
+
+    def __init__(self):
+        self._columns: dict[str, tuple[Hashable, pd.Series]] = {}
+        self._fields: dict[str, tuple[Hashable, pd.Series]] = {}
+        self.recomputed: list[str] = []  # 마지막 갱신에서 다시 계산한 컬럼/필드 이름
+
+    def convert(
+        self, df: pd.DataFrame, data_key: Hashable, column_settings: dict[str, dict[str, Any]]
+    ) -> pd.DataFrame:
+        """
+        데이터 타입과 포맷을 적용한 데이터프레임(converted_df)을 만듭니다.
+
+        Args:
+            df (pd.DataFrame): 기본키 필터링까지 끝난 데이터프레임
+            data_key (Hashable): df의 내용을 식별하는 키
+                - 예: (엑셀 내용 해시, 기본키 컬럼 목록)
+            column_settings (dict[str, dict[str, Any]]): 컬럼별 설정 ("dtype", "format")
+
+        Returns:
+            pd.DataFrame: 변환된 데이터프레임
+        """
+        self.recomputed = []
+        converted = {}
+        for col in df.columns:
+            setting = column_settings.get(col, {})
+            key = (data_key, col, setting.get("dtype"), setting.get("format"))
+            cached = self._columns.get(col)
+            if cached is None or cached[0] != key:
+                series = convert_column(df[col], setting.get("dtype"), setting.get("format"))
+                cached = self._columns[col] = (key, series)
+                self.recomputed.append(col)
+            converted[col] = cached[1]
+
+        return pd.DataFrame(converted, index=df.index)
+
+    def column_key(self, col: str) -> Hashable:
+        """
+        변환된 컬럼의 캐시 키를 반환합니다. (없으면 None)
+        """
+        cached = self._columns.get(col)
+        return cached[0] if cached is not None else None
+
+    def field(
+        self,
+        field: str,
+        converted_df: pd.DataFrame,
+        selected_columns: list[str],
+        fixed_value: str,
+    ) -> pd.Series:
+        """
+        필드 하나의 값 컬럼을 만듭니다.
+
+        Args:
+            field (str): 필드 이름
+            converted_df (pd.DataFrame): convert()로 만든 데이터프레임
+            selected_columns (list[str]): 선택한 컬럼 (특수 선택지 포함, 최대 3개)
+            fixed_value (str): 사용자 지정 값 또는 조사
+
+        Returns:
+            pd.Series: 필드 값 컬럼
+
+        Raises:
+            ValueError: 선택이 올바르지 않은 경우 (메시지를 화면에 표시)
+        """
+        columns = [c for c in selected_columns if c not in (CUSTOM_VALUE, JOSA_VALUE)]
+        missing = [c for c in columns if c not in converted_df.columns]
+        if missing:
+            raise ValueError(f"선택한 열이 데이터프레임에 존재하지 않습니다: {missing}")
+
+        key = (
+            tuple(selected_columns),
+            fixed_value,
+            tuple(self.column_key(c) for c in columns),
+        )
+        cached = self._fields.get(field)
+        if cached is None or cached[0] != key:
+            series = derive_field(converted_df, selected_columns, fixed_value)
+            cached = self._fields[field] = (key, series)
+            self.recomputed.append(field)
+
+        return cached[1]
+
+
+def derive_field(
+    converted_df: pd.DataFrame, selected_columns: list[str], fixed_value: str
+) -> pd.Series:
+    """
+    선택한 컬럼과 사용자 지정 값으로 필드 값 컬럼을 만듭니다.
+
+    Args:
+        converted_df (pd.DataFrame): 변환된 데이터프레임
+        selected_columns (list[str]): 선택한 컬럼 (특수 선택지 포함)
+            - [컬럼]: 컬럼 값 그대로
+            - ["사용자 지정"]: 모든 행에 사용자 지정 값
+            - [컬럼, "사용자 지정", 컬럼]: 두 컬럼 값 사이에 사용자 지정 값을 넣어 연결
+            - [컬럼, "조사(은/는)"]: 컬럼 값 뒤에 사용자 지정 값(조사)을 붙임
+            - [컬럼, 컬럼, ...]: 컬럼 값을 공백으로 연결
+        fixed_value (str): 사용자 지정 값 또는 조사
+
+    Returns:
+        pd.Series: 필드 값 컬럼
+
+    Raises:
+        ValueError: 선택이 올바르지 않은 경우
+    """
+    columns = [c for c in selected_columns if c not in (CUSTOM_VALUE, JOSA_VALUE)]
+
+    if not selected_columns:
+        raise ValueError("선택된 컬럼이 없습니다. 필드를 선택하세요.")
+
+    if len(selected_columns) == 1:
+        if selected_columns[0] == CUSTOM_VALUE:
+            # 사용자 지정값이므로 고정값 사용
+            return pd.Series(fixed_value, index=converted_df.index, dtype=object)
+        if selected_columns[0] == JOSA_VALUE:
+            raise ValueError("조사(은/는) 단독 사용이 지원되지 않습니다.")
+        return converted_df[selected_columns[0]]
+
+    if CUSTOM_VALUE in selected_columns and len(selected_columns) == 3:
+        # df 컬럼 값 + 사용자 지정 값 + df 컬럼 값
+        return join_columns([converted_df[c] for c in columns], f" {fixed_value} ")
+
+    if JOSA_VALUE in selected_columns and len(selected_columns) == 2:
+        # df 컬럼 값 + 조사(은/는)
+        if not fixed_value:
+            raise ValueError("올바르지 않은 조사 값입니다.")
+        return apply_josa(converted_df[columns[0]].astype(str), fixed_value)
+
+    # 실제 컬럼으로만 구성된 경우 (df 컬럼 값 + df 컬럼 값 + df 컬럼 값)
+    return join_columns([converted_df[c] for c in columns], " ")
@@ -0,0 +1,14 @@
+import uuid
+
+import pytest
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    """
+    FakeHwp로 여는 템플릿 파일 경로입니다.
+    템플릿 계획은 내용 해시로 디스크에 캐시되므로, 테스트마다 내용이 다른 파일을 만듭니다.
+    """
+    path = tmp_path / "template.hwp"
+    path.write_text(uuid.uuid4().hex, encoding="utf-8")
+    return str(path)
@@ -0,0 +1,75 @@
+import functools
+
+import pytest
+from openpyxl import Workbook
+
+from config import Config
+from entrypoint_cli import iter_rows
+from hwp.export import FILENAME_COLUMN, OutputPlanner
+from hwp.fake import FakeHwp
+from hwp.service import process_documents
+
+
+@pytest.fixture
+def config(tmp_path, template_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(("key", "name"))
+    for key, name in [("dup", "first"), ("dup", "second"), ("x", "third"), ("dup", "fourth")]:
+        ws.append((key, name))
+    excel_path = tmp_path / "rows.xlsx"
+    wb.save(excel_path)
+
+    return Config(
+        workflow_name="wf",
+        template_path=template_path,
+        excel_path=str(excel_path),
+        key_columns=["key"],
+        field_mapping={"name": "name"},
+    )
+
+
+def run_shard(config, output_folder, rows=None, shard=(0, 1)):
+    planner = OutputPlanner(output_folder, config.workflow_name, key_columns=config.key_columns)
+    return process_documents(
+        template_path=config.template_path,
+        dataframe=iter_rows(config, rows, shard, planner=planner),
+        output_folder=str(output_folder),
+        workflow_name=config.workflow_name,
+        key_columns=config.key_columns,
+        field_mapping=config.field_mapping,
+        hwp_factory=functools.partial(FakeHwp, fields=["name"]),
+        formats=("hwp",),
+    )
+
+
+def test_shards_plan_names_over_all_rows(config, tmp_path):
+    output_folder = tmp_path / "out"
+
+    shard0 = run_shard(config, output_folder, shard=(0, 2))
+    shard1 = run_shard(config, output_folder, shard=(1, 2))
+
+    assert [(r.index, r.filename) for r in shard0] == [(1, "wf_dup"), (3, "wf_x")]
+    assert [(r.index, r.filename) for r in shard1] == [(2, "wf_dup_2"), (4, "wf_dup_3")]
+    contents = {
+        path.name: path.read_text(encoding="utf-8") for path in output_folder.iterdir()
+    }
+    assert contents == {
+        "wf_dup.hwp": "name\tfirst",
+        "wf_dup_2.hwp": "name\tsecond",
+        "wf_x.hwp": "name\tthird",
+        "wf_dup_3.hwp": "name\tfourth",
+    }
+
+
+def test_row_range_keeps_unsharded_names(config, tmp_path):
+    results = run_shard(config, tmp_path / "out", rows=(4, None))
+
+    assert [(r.index, r.filename) for r in results] == [(4, "wf_dup_3")]
+
+
+def test_rows_without_planner_have_no_filename_column(config):
+    chunks = list(iter_rows(config, shard=(1, 2)))
+
+    assert FILENAME_COLUMN not in chunks[0].columns
+    assert list(chunks[0].index) == [1, 3]
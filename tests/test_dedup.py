@@ -0,0 +1,52 @@
+import functools
+import os
+
+import pandas as pd
+
+from hwp.export import export_document
+from hwp.fake import FakeHwp
+from hwp.service import process_documents
+
+
+def test_export_does_not_write_through_hard_link(tmp_path):
+    original = tmp_path / "a.hwp"
+    original.write_text("original", encoding="utf-8")
+    os.link(original, tmp_path / "b.hwp")
+
+    hwp = FakeHwp(fields=["name"])
+    hwp.put_field_text("name", "new")
+    export_document(hwp, tmp_path / "b", formats=("hwp",))
+
+    assert original.read_text(encoding="utf-8") == "original"
+    assert (tmp_path / "b.hwp").read_text(encoding="utf-8") == "name\tnew"
+    assert original.stat().st_nlink == 1
+
+
+def test_rerender_without_dedup_keeps_linked_copies(template_path, tmp_path):
+    # 중복 문서를 하드링크로 만든 뒤, --dedup 없이 한 행만 바뀌어 다시 생성해도 다른 문서는 그대로
+    output_folder = tmp_path / "out"
+    kwargs = {
+        "template_path": template_path,
+        "output_folder": str(output_folder),
+        "workflow_name": "w",
+        "key_columns": ["key"],
+        "field_mapping": {"name": "name"},
+        "hwp_factory": functools.partial(FakeHwp, fields=["name"]),
+        "formats": ("hwp",),
+    }
+
+    first = process_documents(
+        dataframe=pd.DataFrame({"key": ["a", "b"], "name": ["same", "same"]}),
+        deduplicate=True,
+        **kwargs,
+    )
+    assert first[1].source == "w_a"
+    assert (output_folder / "w_a.hwp").stat().st_nlink == 2
+
+    process_documents(
+        dataframe=pd.DataFrame({"key": ["a", "b"], "name": ["same", "changed"]}),
+        **kwargs,
+    )
+
+    assert (output_folder / "w_a.hwp").read_text(encoding="utf-8") == "name\tsame"
+    assert (output_folder / "w_b.hwp").read_text(encoding="utf-8") == "name\tchanged"
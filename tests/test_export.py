@@ -0,0 +1,57 @@
+import functools
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from hwp.export import convert_to_pdf
+from hwp.fake import FakeHwp
+from hwp.service import process_documents
+
+
+class PdfFailingHwp(FakeHwp):
+    """
+    이름에 "bad"가 들어간 문서의 PDF 저장에 실패하는 가짜 HWP 객체입니다.
+    """
+
+    def save_as(self, path: str, format: str = "HWP", arg: str = "") -> bool:
+        if format == "pdf" and "bad" in Path(path).name:
+            self._record("save_as", path, format)
+            return False
+        return super().save_as(path, format, arg)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_remove_source_keeps_unconverted_files(tmp_path, workers):
+    sources = [tmp_path / f"{name}.hwp" for name in ("a", "bad", "c")]
+    for path in sources:
+        path.write_text(path.stem, encoding="utf-8")
+
+    pdf_paths = convert_to_pdf(
+        sources, hwp_factory=PdfFailingHwp, workers=workers, remove_source=True
+    )
+
+    assert sorted(path.name for path in pdf_paths) == ["a.pdf", "c.pdf"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.pdf", "bad.hwp", "c.pdf"]
+
+
+def test_deferred_pdf_failure_keeps_hwp_and_reports_row(template_path, tmp_path):
+    results = process_documents(
+        template_path=template_path,
+        dataframe=pd.DataFrame({"key": ["ok", "bad"], "name": ["x", "y"]}),
+        output_folder=str(tmp_path / "out"),
+        workflow_name="w",
+        key_columns=["key"],
+        field_mapping={"name": "name"},
+        hwp_factory=functools.partial(PdfFailingHwp, fields=["name"]),
+        formats=("pdf",),
+        defer_pdf=True,
+    )
+
+    ok, bad = results
+    assert ok.ok
+    assert ok.paths == [str(tmp_path / "out" / "w_ok.pdf")]
+    assert not bad.ok
+    assert bad.paths == [str(tmp_path / "out" / "w_bad.hwp")]
+    assert (tmp_path / "out" / "w_bad.hwp").read_text(encoding="utf-8") == "name\ty"
+    assert "w_bad" in (tmp_path / "out.failed.csv").read_text(encoding="utf-8-sig")
@@ -0,0 +1,62 @@
+from datetime import datetime
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from excel.loader import data_loader, iter_data_chunks, load_worksheet
+
+
+def make_workbook(path: Path, rows: list[tuple], formats: dict[str, str] | None = None) -> str:
+    """
+    헤더("A", "B")와 rows로 엑셀 파일을 만들고, formats(셀 좌표별 서식)를 적용합니다.
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.append(("A", "B"))
+    for row in rows:
+        ws.append(row)
+    for coordinate, number_format in (formats or {}).items():
+        ws[coordinate].number_format = number_format
+    wb.save(path)
+    return str(path)
+
+
+def test_date_after_sample_in_text_column(tmp_path):
+    # 표본(20행)에서는 정수만 있는 열에 24행에서 날짜가 나오면 셀 서식대로 변환
+    rows = [(i, f"v{i}") for i in range(22)] + [(datetime(2024, 5, 5), "date")]
+    path = make_workbook(tmp_path / "late_date.xlsx", rows, {"A24": "yyyy-mm-dd"})
+
+    frame = data_loader(load_worksheet(path))
+
+    assert frame["A"].iloc[0] == "0"
+    assert frame["A"].iloc[-1] == "2024.05.05."
+
+
+def test_date_after_sample_in_each_chunk(tmp_path):
+    # 날짜가 있는 조각만 셀 객체로 다시 읽고, 다른 조각의 결과와 행 번호는 그대로 유지
+    rows = [(i, f"v{i}") for i in range(30)]
+    rows[25] = (datetime(2024, 1, 2), "date")
+    path = make_workbook(tmp_path / "chunks.xlsx", rows, {"A27": "yyyy/mm/dd/"})
+
+    chunks = list(iter_data_chunks(load_worksheet(path), chunk_size=10))
+
+    assert [list(chunk.index) for chunk in chunks] == [
+        list(range(10)),
+        list(range(10, 20)),
+        list(range(20, 30)),
+    ]
+    assert chunks[2]["A"].tolist()[5] == "2024.01.02."
+    assert chunks[2]["A"].tolist()[6] == "26"
+
+
+def test_other_date_format_after_sample_in_date_column(tmp_path):
+    # 표본과 다른 날짜 서식의 셀은 열의 서식이 아니라 자신의 서식대로 변환
+    rows = [(f"k{i}", datetime(2024, 1, i + 1)) for i in range(25)]
+    formats = {f"B{i}": "yyyy/mm/dd/" for i in range(2, 27)}
+    formats["B26"] = r'yyyy"년"\ m"월"\ d"일";@'
+    path = make_workbook(tmp_path / "date_formats.xlsx", rows, formats)
+
+    frame = data_loader(load_worksheet(path))
+
+    assert frame["B"].iloc[0] == "2024.01.01."
+    assert frame["B"].iloc[-1] == datetime(2024, 1, 25).strftime("%Y년 %#m월 %#d일")
@@ -0,0 +1,101 @@
+import csv
+import functools
+from pathlib import Path
+
+import pandas as pd
+
+from hwp.fake import FakeHwp
+from hwp.manifest import FAILURE_REPORT_SUFFIX
+from hwp.service import process_documents
+
+
+def broken_hwp() -> FakeHwp:
+    """
+    작업 프로세스에서 한글 프로그램을 실행하지 못하는 상황을 흉내냅니다.
+    """
+    raise RuntimeError("HWP 실행 실패")
+
+
+def test_pool_outputs_and_ordered_results(template_path, tmp_path):
+    dataframe = pd.DataFrame(
+        {
+            "key": [f"k{i}" for i in range(7)],
+            "name": [f"이름{i}" for i in range(7)],
+            "amount": [str(i * 1000) for i in range(7)],
+        }
+    )
+    output_folder = tmp_path / "out"
+
+    results = process_documents(
+        template_path=template_path,
+        dataframe=dataframe,
+        output_folder=str(output_folder),
+        workflow_name="w",
+        key_columns=["key"],
+        field_mapping={"name": "name", "amount": "amount"},
+        hwp_factory=functools.partial(FakeHwp, fields=["name", "amount"]),
+        workers=2,
+        formats=("hwp",),
+    )
+
+    assert [result.index for result in results] == list(range(1, 8))
+    assert [result.filename for result in results] == [f"w_k{i}" for i in range(7)]
+    assert all(result.ok for result in results)
+
+    for i, result in enumerate(results):
+        (path,) = map(Path, result.paths)
+        assert path == output_folder / f"w_k{i}.hwp"
+        assert path.read_text(encoding="utf-8") == f"name\t이름{i}\namount\t{i * 1000}"
+    assert sorted(p.name for p in output_folder.iterdir()) == [f"w_k{i}.hwp" for i in range(7)]
+
+
+def test_pool_duplicate_names_across_shards(template_path, tmp_path):
+    # 저장 파일 이름은 메인 프로세스에서 한 번에 정하므로 구간이 달라도 겹치지 않음
+    dataframe = pd.DataFrame({"key": ["same"] * 4, "name": list("abcd")})
+
+    results = process_documents(
+        template_path=template_path,
+        dataframe=dataframe,
+        output_folder=str(tmp_path / "out"),
+        workflow_name="w",
+        key_columns=["key"],
+        field_mapping={"name": "name"},
+        hwp_factory=functools.partial(FakeHwp, fields=["name"]),
+        workers=2,
+        formats=("hwp",),
+    )
+
+    assert [result.filename for result in results] == ["w_same", "w_same_2", "w_same_3", "w_same_4"]
+    assert all(result.ok for result in results)
+
+
+def test_failed_shard_keeps_planned_filenames(template_path, tmp_path):
+    dataframe = pd.DataFrame({"key": ["a", "b", "c"], "name": ["x", "y", "z"]})
+    output_folder = tmp_path / "out"
+
+    results = process_documents(
+        template_path=template_path,
+        dataframe=dataframe,
+        output_folder=str(output_folder),
+        workflow_name="w",
+        key_columns=["key"],
+        field_mapping={"name": "name"},
+        hwp_factory=broken_hwp,
+        workers=2,
+        formats=("hwp",),
+    )
+
+    assert [(result.index, result.filename) for result in results] == [
+        (1, "w_a"),
+        (2, "w_b"),
+        (3, "w_c"),
+    ]
+    assert all("HWP 실행 실패" in result.error for result in results)
+    # 작업 프로세스의 traceback(실패한 위치)도 실패 기록에 남음
+    assert all("in broken_hwp" in result.error for result in results)
+
+    report = tmp_path / f"out{FAILURE_REPORT_SUFFIX}"
+    with open(report, encoding="utf-8-sig", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["filename"] for row in rows] == ["w_a", "w_b", "w_c"]
+    assert [row["error"] for row in rows] == [result.error for result in results]
@@ -0,0 +1,55 @@
+import functools
+
+import pandas as pd
+import pytest
+
+from hwp.fake import FakeHwp
+from hwp.service import process_documents
+from hwp.session import HwpSession
+
+
+@pytest.fixture
+def labelled_rows():
+    # 인덱스가 정수가 아닌 데이터프레임 (행 번호는 전체 위치 + 1)
+    return pd.DataFrame({"name": list("abcde")}, index=[f"r{i}" for i in range(5)])
+
+
+def render(template_path, tmp_path, dataframe, **kwargs):
+    return process_documents(
+        template_path=template_path,
+        dataframe=dataframe,
+        output_folder=str(tmp_path / "out"),
+        workflow_name="w",
+        field_mapping={"name": "name"},
+        hwp_factory=functools.partial(FakeHwp, fields=["name"]),
+        formats=("hwp",),
+        **kwargs,
+    )
+
+
+def test_row_numbers_survive_session_recycle(template_path, tmp_path, labelled_rows):
+    session = HwpSession(functools.partial(FakeHwp, fields=["name"]), max_documents=2)
+    with session:
+        results = render(template_path, tmp_path, labelled_rows, session=session)
+
+    assert session.starts == 3
+    assert [result.index for result in results] == [1, 2, 3, 4, 5]
+    assert [result.filename for result in results] == [f"w_{i}" for i in range(1, 6)]
+
+
+def test_row_numbers_survive_pool_shards(template_path, tmp_path, labelled_rows):
+    results = render(template_path, tmp_path, labelled_rows, workers=2)
+
+    assert [result.index for result in results] == [1, 2, 3, 4, 5]
+    for result, name in zip(results, "abcde"):
+        assert (tmp_path / "out" / f"{result.filename}.hwp").read_text(
+            encoding="utf-8"
+        ) == f"name\t{name}"
+
+
+def test_row_numbers_continue_across_chunks(template_path, tmp_path, labelled_rows):
+    chunks = [labelled_rows.iloc[:2], labelled_rows.iloc[2:]]
+
+    results = render(template_path, tmp_path, iter(chunks))
+
+    assert [result.index for result in results] == [1, 2, 3, 4, 5]
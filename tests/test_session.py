@@ -0,0 +1,177 @@
+import functools
+
+import pandas as pd
+import pytest
+
+from hwp.fake import FakeHwp
+from hwp.metrics import MemorySink, Metrics, use_metrics
+from hwp.pool import render_shard
+from hwp.session import HwpSession
+
+
+class FakeFactory:
+    """
+    만든 FakeHwp 객체를 기록하는 HWP 객체 생성 함수입니다.
+    """
+
+    def __init__(self, fields: list[str] | None = None):
+        self.fields = fields
+        self.created: list[FakeHwp] = []
+
+    def __call__(self) -> FakeHwp:
+        hwp = FakeHwp(fields=self.fields)
+        self.created.append(hwp)
+        return hwp
+
+
+def recycle_reasons(sink: MemorySink) -> list[str]:
+    return [event.labels["reason"] for event in sink.events if event.name == "hwp_recycle"]
+
+
+def test_lazy_start():
+    factory = FakeFactory()
+    session = HwpSession(factory)
+    assert session.hwp is None
+    assert session.starts == 0
+    assert factory.created == []
+
+    with session.lease() as hwp:
+        assert hwp is factory.created[0]
+    with session.lease() as again:
+        assert again is hwp  # 같은 HWP 객체 재사용
+
+    assert session.starts == 1
+    session.close()
+    assert not hwp.alive
+
+
+def test_unhealthy_hwp_is_restarted():
+    factory = FakeFactory()
+    sink = MemorySink()
+    with use_metrics(Metrics(sinks=[sink])), HwpSession(factory) as session:
+        with session.lease() as hwp:
+            pass
+        hwp.crash()  # 빌려주지 않는 동안 한글 프로그램이 종료됨
+
+        with session.lease() as restarted:
+            assert restarted is not hwp
+            assert restarted.alive
+
+    assert session.starts == 2
+    assert session.recycles == 1
+    assert recycle_reasons(sink) == ["unhealthy"]
+    # 응답하지 않는 이유와 종료하지 못한 이유를 삼키지 않고 기록
+    errors = {event.name: event.attrs["error"] for event in sink.events if "error" in event.attrs}
+    assert errors == {
+        "hwp_unresponsive": repr(RuntimeError("HWP 프로그램이 종료되었습니다.")),
+        "hwp_stop_failed": repr(RuntimeError("HWP 프로그램이 종료되었습니다.")),
+    }
+
+
+def test_unexpected_health_check_error_is_raised():
+    class BrokenHwp(FakeHwp):
+        @property
+        def Version(self) -> list[int]:
+            raise ValueError("버그")
+
+    session = HwpSession(BrokenHwp)
+    with session.lease():
+        pass
+    with pytest.raises(ValueError), session.lease():
+        pass
+
+
+def test_error_in_lease_recycles():
+    factory = FakeFactory()
+    sink = MemorySink()
+    with use_metrics(Metrics(sinks=[sink])), HwpSession(factory) as session:
+        with pytest.raises(RuntimeError), session.lease() as hwp:
+            raise RuntimeError("COM 오류")
+
+        assert session.hwp is None
+        assert not hwp.alive
+        with session.lease() as restarted:
+            assert restarted is not hwp
+
+    assert recycle_reasons(sink) == ["error"]
+
+
+def test_recycle_after_max_documents():
+    factory = FakeFactory()
+    sink = MemorySink()
+    with use_metrics(Metrics(sinks=[sink])), HwpSession(factory, max_documents=2) as session:
+        with session.lease():
+            session.count_documents()
+        assert session.remaining == 1
+        assert session.hwp is factory.created[0]
+
+        with session.lease():
+            session.count_documents()
+        assert session.hwp is None  # 문서 수 제한에 도달하면 lease가 끝날 때 종료
+
+        with session.lease() as hwp:
+            assert hwp is factory.created[1]
+            assert session.remaining == 2
+
+    assert session.starts == 2
+    assert recycle_reasons(sink) == ["max_documents"]
+
+
+def test_restart_inside_lease():
+    factory = FakeFactory()
+    sink = MemorySink()
+    session = HwpSession(factory)
+    with use_metrics(Metrics(sinks=[sink])), session, session.lease() as hwp:
+        session.count_documents(3)
+        restarted = session.restart("retry")
+
+        assert restarted is not hwp
+        assert not hwp.alive
+        assert session.hwp is restarted
+        assert session.documents == 0
+
+    assert session.starts == 2
+    assert recycle_reasons(sink) == ["retry"]
+
+
+def test_invalid_max_documents():
+    with pytest.raises(ValueError):
+        HwpSession(FakeFactory(), max_documents=0)
+
+
+def test_shard_recycles_after_max_documents(template_path, tmp_path):
+    # 작업 프로세스의 구간도 max_documents개마다 HWP 객체를 새로 띄우고 템플릿을 다시 엶
+    factory = FakeFactory(fields=["name"])
+    shard = pd.DataFrame({"name": [f"n{i}" for i in range(5)]})
+    render_kwargs = {
+        "output_folder": str(tmp_path / "out"),
+        "workflow_name": "w",
+        "field_mapping": {"name": "name"},
+        "formats": ("hwp",),
+    }
+
+    results = render_shard(template_path, shard, factory, render_kwargs, max_documents=2)
+
+    assert [result.ok for result in results] == [True] * 5
+    assert len(factory.created) == 3
+    assert [hwp.count("open") for hwp in factory.created] == [1, 1, 1]
+    assert [hwp.count("save_as") for hwp in factory.created] == [2, 2, 1]
+    assert not any(hwp.alive for hwp in factory.created)
+
+
+def test_shard_without_limit_uses_one_hwp(template_path, tmp_path):
+    factory = functools.partial(FakeHwp, fields=["name"])
+    shard = pd.DataFrame({"name": ["a", "b", "c"]})
+    sink = MemorySink()
+    render_kwargs = {
+        "output_folder": str(tmp_path / "out"),
+        "workflow_name": "w",
+        "field_mapping": {"name": "name"},
+        "formats": ("hwp",),
+    }
+
+    with use_metrics(Metrics(sinks=[sink])):
+        results = render_shard(template_path, shard, factory, render_kwargs, max_documents=None)
+
+    assert len(results) == 3
+    assert sum(1 for event in sink.events if event.name == "hwp_start") == 1
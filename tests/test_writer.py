@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from hwp.fake import FakeHwp
+from hwp.service import process_documents
+from hwp.template import open_template
+from hwp.writer import write_fields
+
+
+@pytest.fixture
+def hwp():
+    return FakeHwp(fields=["name", "note", "name"])
+
+
+@pytest.fixture
+def plan(hwp, template_path, tmp_path):
+    plan = open_template(hwp, template_path, cache_dir=tmp_path / "plans")
+    plan.defaults = ["", "(비고)", ""]
+    return plan
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_reset_without_plan_is_rejected(hwp, batch):
+    row = pd.Series({"이름": "홍길동"})
+
+    with pytest.raises(ValueError, match="plan"):
+        write_fields(hwp, row, {"name": "이름"}, batch=batch, reset=True)
+    assert hwp.count("put_field_text") == 0
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_reset_restores_unmapped_fields(hwp, plan, batch):
+    write_fields(
+        hwp, pd.Series({"이름": "a", "비고": "b"}), {"name": "이름", "note": "비고"}, plan=plan
+    )
+    write_fields(
+        hwp, pd.Series({"이름": "c"}), {"name": "이름"}, batch=batch, plan=plan, reset=True
+    )
+
+    assert hwp.get_field_text("name{{0}}\x02note{{0}}\x02name{{1}}") == "c\x02(비고)\x02c"
+
+
+@pytest.mark.parametrize(
+    ("batch", "reset", "calls_per_row"),
+    [(True, False, 1), (True, True, 1), (False, False, 3), (False, True, 4)],
+)
+def test_put_field_text_calls_per_row(template_path, tmp_path, batch, reset, calls_per_row):
+    instances = []
+
+    def factory():
+        instances.append(FakeHwp(fields=["a", "b", "c", "d"]))
+        return instances[-1]
+
+    results = process_documents(
+        template_path=template_path,
+        dataframe=pd.DataFrame({"a": ["1", "2"], "b": ["3", "4"], "c": ["5", "6"]}),
+        output_folder=str(tmp_path / "out"),
+        workflow_name="w",
+        field_mapping={"a": "a", "b": "b", "c": "c"},
+        hwp_factory=factory,
+        formats=("hwp",),
+        batch_write=batch,
+        reset_fields=reset,
+    )
+
+    assert all(result.ok for result in results)
+    (hwp,) = instances
+    assert hwp.count("put_field_text") == calls_per_row * 2
+    assert (tmp_path / "out" / "w_2.hwp").read_text(encoding="utf-8") == "a\t2\nb\t4\nc\t6\nd\t"